@@ -0,0 +1,445 @@
+"""
+Export FactOrders and FactOrders_Error from ORDER_DDS to partitioned Parquet files.
+
+Rows are streamed from SQL Server in fixed-size batches and written one batch at a time,
+so memory stays bounded by the batch size regardless of the table size.
+
+A windowed export is widened to whole months and replaces the month partitions it covers.
+An incremental export appends the FactOrders rows loaded since the last run (by LoadDate,
+lagging behind the server clock so that slow transactions are not skipped) and re-exports
+FactOrders_Error in full, since reprocessing updates its rows in place.
+
+Usage:
+    python export_fact_data.py --start_date=1996-01-01 --end_date=1998-12-31
+    python export_fact_data.py --incremental
+"""
+import argparse
+import json
+import calendar
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pipeline_dimensional_data.config import SCHEMA_NAME, FACT_ORDERS, FACT_ORDERS_ERROR, FACT_ORDERS_PARTITIONED
+from utils import generate_uuid, get_pymssql_connection
+
+
+DEFAULT_OUTPUT_DIR = 'exports'
+DEFAULT_BATCH_SIZE = 50000
+WATERMARK_FILE_NAME = '_watermarks.json'
+# Incremental exports stop this far behind the server clock: a row's LoadDate is set when its
+# INSERT runs, but the row only becomes visible when the transaction commits
+DEFAULT_SAFETY_LAG_MINUTES = 60
+
+# Per-table export definition:
+#   key_column       - surrogate key, orders rows within a partition
+#   date_column      - column used for the date window and for partitioning (one directory per month)
+#   partition_name   - Hive-style partition directory prefix
+#   append_only      - rows are never updated after they are loaded, so incremental exports can
+#                      append the rows loaded since the last run (LoadDate watermark)
+#   dictionary_columns - low-cardinality dimension keys stored dictionary-encoded in Parquet
+EXPORT_TABLES = {
+    FACT_ORDERS: {
+        'key_column': 'OrderFact_SK',
+        'date_column': 'OrderDate',
+        'partition_name': 'order_month',
+        'append_only': True,
+        'schema': pa.schema([
+            ('OrderFact_SK', pa.int64()),
+            ('OrderID', pa.int32()),
+            ('OrderDate', pa.date32()),
+            ('RequiredDate', pa.date32()),
+            ('ShippedDate', pa.date32()),
+            ('OrderDateKey', pa.int32()),
+            ('RequiredDateKey', pa.int32()),
+            ('ShippedDateKey', pa.int32()),
+            ('Freight', pa.decimal128(18, 2)),
+            ('Customer_SK', pa.int32()),
+            ('Employee_SK', pa.int32()),
+            ('Shipper_SK', pa.int32()),
+            ('Territory_SK', pa.int32()),
+            ('Region_SK', pa.int32()),
+            ('Product_SK', pa.int32()),
+            ('Category_SK', pa.int32()),
+            ('Supplier_SK', pa.int32()),
+            ('Quantity', pa.int32()),
+            ('UnitPrice', pa.decimal128(18, 2)),
+            ('Discount', pa.float64()),
+            ('SOR_SK', pa.int32()),
+            ('staging_raw_id_nk', pa.int32()),
+            ('LoadDate', pa.timestamp('us')),
+        ]),
+        'dictionary_columns': [
+            'OrderDateKey', 'Customer_SK', 'Employee_SK', 'Shipper_SK', 'Territory_SK', 'Region_SK',
+            'Product_SK', 'Category_SK', 'Supplier_SK', 'SOR_SK'
+        ],
+    },
+    # FactOrders_Error has no order date, so it is windowed and partitioned by LoadDate.
+    # Reprocessing sets IsResolved/ResolvedAt in place, so incremental runs re-export it in full.
+    FACT_ORDERS_ERROR: {
+        'key_column': 'ErrorFact_SK',
+        'date_column': 'LoadDate',
+        'partition_name': 'load_month',
+        'append_only': False,
+        'schema': pa.schema([
+            ('ErrorFact_SK', pa.int64()),
+            ('OrderID', pa.int32()),
+            ('ProductID', pa.int32()),
+            ('ErrorReason', pa.string()),
+            ('Customer_SK', pa.int32()),
+            ('Employee_SK', pa.int32()),
+            ('Shipper_SK', pa.int32()),
+            ('Territory_SK', pa.int32()),
+            ('Region_SK', pa.int32()),
+            ('Product_SK', pa.int32()),
+            ('Category_SK', pa.int32()),
+            ('Supplier_SK', pa.int32()),
+            ('SOR_SK', pa.int32()),
+            ('staging_raw_id_nk', pa.int32()),
+            ('LoadDate', pa.timestamp('us')),
+            ('IsResolved', pa.bool_()),
+            ('ResolvedAt', pa.timestamp('us')),
+        ]),
+        'dictionary_columns': [
+            'ErrorReason', 'Customer_SK', 'Employee_SK', 'Shipper_SK', 'Territory_SK',
+            'Region_SK', 'Product_SK', 'Category_SK', 'Supplier_SK', 'SOR_SK'
+        ],
+    },
+}
+
+
+def parse_arguments():
+    """
+    Parse command-line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description='Export fact tables to partitioned Parquet files')
+    parser.add_argument('--start_date', type=str, help='Start of the export window (format: YYYY-MM-DD)')
+    parser.add_argument('--end_date', type=str, help='End of the export window (format: YYYY-MM-DD)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Append the FactOrders rows loaded since the last incremental export '
+                             '(FactOrders_Error is re-exported in full)')
+    parser.add_argument('--safety_lag_minutes', type=int, default=DEFAULT_SAFETY_LAG_MINUTES,
+                        help='Incremental exports only take rows loaded at least this long ago')
+    parser.add_argument('--tables', type=str, default=','.join(EXPORT_TABLES),
+                        help='Comma-separated list of tables to export')
+    parser.add_argument('--output_dir', type=str, default=DEFAULT_OUTPUT_DIR, help='Export root directory')
+    parser.add_argument('--batch_size', type=int, default=DEFAULT_BATCH_SIZE, help='Rows fetched per batch')
+    return parser.parse_args()
+
+
+def read_watermarks(output_dir: str) -> Dict[str, str]:
+    """Read the LoadDate up to which each table was exported (empty if nothing was exported yet)."""
+    watermark_path = os.path.join(output_dir, WATERMARK_FILE_NAME)
+    if not os.path.exists(watermark_path):
+        return {}
+    with open(watermark_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_watermarks(output_dir: str, watermarks: Dict[str, str]) -> None:
+    """Persist watermarks atomically so an interrupted export never advances them."""
+    os.makedirs(output_dir, exist_ok=True)
+    watermark_path = os.path.join(output_dir, WATERMARK_FILE_NAME)
+    tmp_path = watermark_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(watermarks, f, indent=2)
+    os.replace(tmp_path, watermark_path)
+
+
+def expand_to_months(start_date: Optional[str], end_date: Optional[str]):
+    """
+    Widen a date window to whole calendar months, since a windowed export replaces each
+    month partition it touches.
+
+    Returns:
+        tuple: (first day of the start month or None, last day of the end month or None)
+    """
+    if start_date:
+        start_date = start_date[:8] + '01'
+    if end_date:
+        year, month = int(end_date[:4]), int(end_date[5:7])
+        end_date = f"{end_date[:8]}{calendar.monthrange(year, month)[1]:02d}"
+    return start_date, end_date
+
+
+def get_incremental_cutoff(conn, safety_lag_minutes: int) -> str:
+    """
+    Read the LoadDate up to which an incremental export may go: the server's UTC clock
+    (LoadDate defaults to SYSUTCDATETIME()) minus the safety lag.
+
+    Returns:
+        str: Cutoff as 'YYYY-MM-DD HH:MM:SS.fffffff'
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT CONVERT(VARCHAR(27), DATEADD(MINUTE, -%s, SYSUTCDATETIME()), 121)",
+            (safety_lag_minutes,)
+        )
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+
+def build_export_query(
+    table_name: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    loaded_after: Optional[str] = None,
+    loaded_until: Optional[str] = None
+):
+    """
+    Build the export SELECT for a table and its parameters.
+
+    Rows are ordered by the partition date so that each month arrives contiguously
+    and only one Parquet writer has to be open at a time.
+
+    Returns:
+        tuple: (query, params)
+    """
+    table = EXPORT_TABLES[table_name]
+    columns = ', '.join(table['schema'].names)
+    conditions: List[str] = []
+    params: List = []
+
+    if start_date:
+        conditions.append(f"{table['date_column']} >= %s")
+        params.append(start_date)
+    if end_date:
+        # End date is inclusive; LoadDate carries a time part
+        conditions.append(f"{table['date_column']} < DATEADD(DAY, 1, CAST(%s AS DATE))")
+        params.append(end_date)
+    if loaded_after is not None:
+        conditions.append("LoadDate > %s")
+        params.append(loaded_after)
+    if loaded_until is not None:
+        conditions.append("LoadDate <= %s")
+        params.append(loaded_until)
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    query = (
+        f"SELECT {columns} FROM {SCHEMA_NAME}.{table_name} {where_clause} "
+        f"ORDER BY {table['date_column']}, {table['key_column']}"
+    )
+    return query, tuple(params)
+
+
+def export_table(
+    conn,
+    table_name: str,
+    output_dir: str,
+    run_id: str,
+    batch_size: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    loaded_after: Optional[str] = None,
+    loaded_until: Optional[str] = None
+) -> Dict:
+    """
+    Stream one table into month-partitioned Parquet files.
+
+    Args:
+        conn: Open database connection
+        table_name: Table to export (key of EXPORT_TABLES)
+        output_dir: Export root directory
+        run_id: Unique id of this export run (used in file names)
+        batch_size: Number of rows fetched and written per batch
+        start_date: Optional inclusive start of the date window (YYYY-MM-DD)
+        end_date: Optional inclusive end of the date window (YYYY-MM-DD)
+        loaded_after: Only export rows with a LoadDate after this value
+        loaded_until: Only export rows with a LoadDate up to this value
+
+    Returns:
+        dict: {'rows': exported row count, 'files': files written}
+    """
+    table = EXPORT_TABLES[table_name]
+    schema = table['schema']
+    date_index = schema.get_field_index(table['date_column'])
+
+    query, params = build_export_query(table_name, start_date, end_date, loaded_after, loaded_until)
+    cursor = conn.cursor()
+    # pymssql reads the result set from the wire as rows are fetched, so only one batch is held in memory
+    cursor.execute(query, params)
+
+    writer = None
+    current_partition = None
+    files: List[str] = []
+    row_count = 0
+
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+
+            # Rows are ordered by date, so each month is a contiguous slice of the batch
+            start = 0
+            while start < len(rows):
+                partition = rows[start][date_index].strftime('%Y-%m')
+                end = start
+                while end < len(rows) and rows[end][date_index].strftime('%Y-%m') == partition:
+                    end += 1
+
+                if partition != current_partition:
+                    if writer is not None:
+                        writer.close()
+                    partition_dir = os.path.join(output_dir, table_name, f"{table['partition_name']}={partition}")
+                    os.makedirs(partition_dir, exist_ok=True)
+                    file_path = os.path.join(partition_dir, f"part-{run_id}.parquet")
+                    writer = pq.ParquetWriter(file_path, schema, use_dictionary=table['dictionary_columns'])
+                    files.append(file_path)
+                    current_partition = partition
+
+                chunk = rows[start:end]
+                columns = [[row[i] for row in chunk] for i in range(len(schema))]
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                ))
+                start = end
+
+            row_count += len(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+        cursor.close()
+
+    return {'rows': row_count, 'files': files}
+
+
+def replace_partitions(
+    output_dir: str,
+    table_name: str,
+    run_id: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> int:
+    """
+    Remove the files of earlier runs from the month partitions covered by a completed export,
+    so that re-exporting a window replaces its months instead of duplicating them. Months of
+    the window without rows this time are emptied too.
+
+    Args:
+        output_dir: Export root directory
+        table_name: Exported table (key of EXPORT_TABLES)
+        run_id: Run whose files are kept
+        start_date: Inclusive start of the exported window (None for unbounded)
+        end_date: Inclusive end of the exported window (None for unbounded)
+
+    Returns:
+        int: Number of files removed
+    """
+    table_dir = os.path.join(output_dir, table_name)
+    if not os.path.isdir(table_dir):
+        return 0
+
+    prefix = f"{EXPORT_TABLES[table_name]['partition_name']}="
+    keep = f"part-{run_id}.parquet"
+    removed = 0
+    for name in os.listdir(table_dir):
+        partition_dir = os.path.join(table_dir, name)
+        if not (name.startswith(prefix) and os.path.isdir(partition_dir)):
+            continue
+        month = name[len(prefix):]
+        if (start_date and month < start_date[:7]) or (end_date and month > end_date[:7]):
+            continue
+        for file_name in os.listdir(partition_dir):
+            if file_name != keep:
+                os.remove(os.path.join(partition_dir, file_name))
+                removed += 1
+        if not os.listdir(partition_dir):
+            os.rmdir(partition_dir)
+    return removed
+
+
+def main():
+    """Main function to export the fact tables."""
+    args = parse_arguments()
+
+    for date_string in (args.start_date, args.end_date):
+        if date_string:
+            try:
+                datetime.strptime(date_string, '%Y-%m-%d')
+            except ValueError:
+                print(f"Error: Invalid date format: {date_string}. Expected format: YYYY-MM-DD")
+                sys.exit(1)
+
+    tables = [table.strip() for table in args.tables.split(',') if table.strip()]
+    unknown_tables = [table for table in tables if table not in EXPORT_TABLES]
+    if unknown_tables:
+        print(f"Error: Unknown table(s): {', '.join(unknown_tables)}. Available: {', '.join(EXPORT_TABLES)}")
+        sys.exit(1)
+
+    if not (args.start_date or args.end_date or args.incremental):
+        print("Error: Specify a date window (--start_date/--end_date) or --incremental")
+        sys.exit(1)
+
+    # The watermark is a single LoadDate per table: advancing it from a date-filtered export would
+    # skip the rows outside the window in every later incremental run
+    if args.incremental and (args.start_date or args.end_date):
+        print("Error: --incremental cannot be combined with --start_date/--end_date")
+        sys.exit(1)
+
+    # A partition-switch reload rewrites every FactOrders row of the window with a new LoadDate,
+    # so appending "new" rows would export the reloaded rows a second time
+    if args.incremental and FACT_ORDERS in tables and FACT_ORDERS_PARTITIONED:
+        print("Error: --incremental is append-only and cannot export FactOrders while it is loaded by "
+              "partition switching (FACT_ORDERS_PARTITIONED = True); use a windowed export instead")
+        sys.exit(1)
+
+    start_date, end_date = expand_to_months(args.start_date, args.end_date)
+    if (start_date, end_date) != (args.start_date, args.end_date):
+        print(f"Exporting whole months: {start_date or 'start'} to {end_date or 'end'}")
+
+    run_id = generate_uuid()
+    watermarks = read_watermarks(args.output_dir)
+
+    try:
+        conn = get_pymssql_connection()
+    except Exception as e:
+        print(f"✗ Failed to connect to database: {e}")
+        sys.exit(1)
+
+    try:
+        cutoff = get_incremental_cutoff(conn, args.safety_lag_minutes) if args.incremental else None
+        for table_name in tables:
+            print(f"Exporting {table_name}...")
+            if args.incremental and EXPORT_TABLES[table_name]['append_only']:
+                result = export_table(
+                    conn, table_name, args.output_dir, run_id, args.batch_size,
+                    loaded_after=watermarks.get(table_name), loaded_until=cutoff
+                )
+                # Only incremental (unfiltered) runs advance the watermark, and never backwards
+                watermarks[table_name] = max(cutoff, watermarks.get(table_name, cutoff))
+                print(f"  ✓ Appended {result['rows']} rows loaded up to {cutoff} "
+                      f"into {len(result['files'])} file(s)")
+                continue
+
+            # Windowed export, or a full export of a table whose rows change in place:
+            # replace the covered months once the new files are complete
+            result = export_table(
+                conn, table_name, args.output_dir, run_id, args.batch_size,
+                start_date=start_date, end_date=end_date
+            )
+            removed = replace_partitions(args.output_dir, table_name, run_id, start_date, end_date)
+            print(f"  ✓ Exported {result['rows']} rows into {len(result['files'])} file(s), "
+                  f"replacing {removed} earlier file(s)")
+
+        write_watermarks(args.output_dir, watermarks)
+        print(f"\n✓ Export completed. Run ID: {run_id}")
+    except Exception as e:
+        print(f"\n✗ Error exporting data: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
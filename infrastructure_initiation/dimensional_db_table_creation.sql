@@ -212,6 +212,34 @@ CREATE TABLE dbo.DimTerritories_Hist (
 );
 GO
 
+/* =====================
+   DimDate – generated calendar (populated by update_dim_date.sql)
+   ===================== */
+IF OBJECT_ID('dbo.DimDate','U') IS NOT NULL DROP TABLE dbo.DimDate;
+CREATE TABLE dbo.DimDate (
+    DateKey INT NOT NULL PRIMARY KEY,            -- YYYYMMDD
+    FullDate DATE NOT NULL UNIQUE,
+    DayOfMonth TINYINT NOT NULL,
+    DayOfWeek TINYINT NOT NULL,                  -- 1 = Monday ... 7 = Sunday
+    DayName NVARCHAR(10) NOT NULL,
+    DayOfYear SMALLINT NOT NULL,
+    WeekOfYear TINYINT NOT NULL,                 -- ISO week
+    MonthNumber TINYINT NOT NULL,
+    MonthName NVARCHAR(10) NOT NULL,
+    QuarterNumber TINYINT NOT NULL,
+    YearNumber SMALLINT NOT NULL,
+    YearMonth CHAR(7) NOT NULL,                  -- YYYY-MM
+    IsWeekend BIT NOT NULL,
+    FiscalYear SMALLINT NOT NULL,
+    FiscalQuarter TINYINT NOT NULL,
+    FiscalMonth TINYINT NOT NULL,
+    IsHoliday BIT NOT NULL DEFAULT 0,
+    HolidayName NVARCHAR(100) NULL,
+    CreatedAt DATETIME2 DEFAULT SYSUTCDATETIME(),
+    UpdatedAt DATETIME2 NULL
+);
+GO
+
 /* =====================
    FactOrders – INSERT (created after all dimensions)
    ===================== */
@@ -222,6 +250,9 @@ CREATE TABLE dbo.FactOrders (
     OrderDate DATE,
     RequiredDate DATE,
     ShippedDate DATE,
+    OrderDateKey INT,
+    RequiredDateKey INT,
+    ShippedDateKey INT,
     Freight DECIMAL(18,2),
     Customer_SK INT,
     Employee_SK INT,
@@ -245,10 +276,21 @@ CREATE TABLE dbo.FactOrders (
     CONSTRAINT FK_FactOrders_Product FOREIGN KEY (Product_SK) REFERENCES dbo.DimProducts(Product_SK),
     CONSTRAINT FK_FactOrders_Category FOREIGN KEY (Category_SK) REFERENCES dbo.DimCategories(Category_SK),
     CONSTRAINT FK_FactOrders_Supplier FOREIGN KEY (Supplier_SK) REFERENCES dbo.DimSuppliers(Supplier_SK),
-    CONSTRAINT FK_FactOrders_SOR FOREIGN KEY (SOR_SK) REFERENCES dbo.Dim_SOR(SOR_SK)
+    CONSTRAINT FK_FactOrders_SOR FOREIGN KEY (SOR_SK) REFERENCES dbo.Dim_SOR(SOR_SK),
+    CONSTRAINT FK_FactOrders_OrderDate FOREIGN KEY (OrderDateKey) REFERENCES dbo.DimDate(DateKey),
+    CONSTRAINT FK_FactOrders_RequiredDate FOREIGN KEY (RequiredDateKey) REFERENCES dbo.DimDate(DateKey),
+    CONSTRAINT FK_FactOrders_ShippedDate FOREIGN KEY (ShippedDateKey) REFERENCES dbo.DimDate(DateKey)
 );
 GO
 
+CREATE NONCLUSTERED INDEX IX_FactOrders_OrderDateKey ON dbo.FactOrders (OrderDateKey);
+GO
+
+-- One row per order line: order-line lookups (FactOrders_Error reprocessing and the batched load check
+-- whether a line is already loaded), and concurrent writers of the same lines fail instead of duplicating
+CREATE UNIQUE NONCLUSTERED INDEX IX_FactOrders_OrderID_Product ON dbo.FactOrders (OrderID, Product_SK);
+GO
+
 /* =====================
    FactOrders_Error (created after all dimensions)
    ===================== */
@@ -269,6 +311,8 @@ CREATE TABLE dbo.FactOrders_Error (
     SOR_SK INT NOT NULL,
     staging_raw_id_nk INT NOT NULL,
     LoadDate DATETIME2 DEFAULT SYSUTCDATETIME(),
+    IsResolved BIT NOT NULL DEFAULT 0,
+    ResolvedAt DATETIME2 NULL,
     CONSTRAINT FK_FactOrders_Error_Customer FOREIGN KEY (Customer_SK) REFERENCES dbo.DimCustomers(Customer_SK),
     CONSTRAINT FK_FactOrders_Error_Employee FOREIGN KEY (Employee_SK) REFERENCES dbo.DimEmployees(Employee_SK),
     CONSTRAINT FK_FactOrders_Error_Shipper FOREIGN KEY (Shipper_SK) REFERENCES dbo.DimShippers(Shipper_SK),
@@ -279,4 +323,95 @@ CREATE TABLE dbo.FactOrders_Error (
     CONSTRAINT FK_FactOrders_Error_Supplier FOREIGN KEY (Supplier_SK) REFERENCES dbo.DimSuppliers(Supplier_SK),
     CONSTRAINT FK_FactOrders_Error_SOR FOREIGN KEY (SOR_SK) REFERENCES dbo.Dim_SOR(SOR_SK)
 );
-GO
\ No newline at end of file
+GO
+
+-- Keeps late-arriving dimension reprocessing proportional to the unresolved backlog
+CREATE NONCLUSTERED INDEX IX_FactOrders_Error_Unresolved ON dbo.FactOrders_Error (OrderID, ProductID)
+    WHERE IsResolved = 0;
+GO
+
+/* =====================
+   Dashboard aggregates (maintained per load window by update_agg_sales.sql)
+   ===================== */
+IF OBJECT_ID('dbo.AggSales_Daily_Product_Country','U') IS NOT NULL DROP TABLE dbo.AggSales_Daily_Product_Country;
+CREATE TABLE dbo.AggSales_Daily_Product_Country (
+    OrderDate DATE NOT NULL,
+    Product_SK INT NOT NULL,
+    CustomerCountry NVARCHAR(255) NOT NULL,
+    OrderCount INT NOT NULL,
+    OrderLineCount INT NOT NULL,
+    Quantity INT NOT NULL,
+    GrossSales DECIMAL(18,2) NOT NULL,
+    NetSales DECIMAL(18,2) NOT NULL,
+    LoadDate DATETIME2 DEFAULT SYSUTCDATETIME(),
+    CONSTRAINT PK_AggSales_Daily_Product_Country PRIMARY KEY (OrderDate, Product_SK, CustomerCountry),
+    CONSTRAINT FK_AggSales_Daily_Product FOREIGN KEY (Product_SK) REFERENCES dbo.DimProducts(Product_SK)
+);
+GO
+
+IF OBJECT_ID('dbo.AggSales_Monthly_Employee_Shipper','U') IS NOT NULL DROP TABLE dbo.AggSales_Monthly_Employee_Shipper;
+CREATE TABLE dbo.AggSales_Monthly_Employee_Shipper (
+    MonthStartDate DATE NOT NULL,
+    Employee_SK INT NOT NULL,
+    Shipper_SK INT NOT NULL,
+    OrderCount INT NOT NULL,
+    OrderLineCount INT NOT NULL,
+    Quantity INT NOT NULL,
+    GrossSales DECIMAL(18,2) NOT NULL,
+    NetSales DECIMAL(18,2) NOT NULL,
+    LoadDate DATETIME2 DEFAULT SYSUTCDATETIME(),
+    CONSTRAINT PK_AggSales_Monthly_Employee_Shipper PRIMARY KEY (MonthStartDate, Employee_SK, Shipper_SK),
+    CONSTRAINT FK_AggSales_Monthly_Employee FOREIGN KEY (Employee_SK) REFERENCES dbo.DimEmployees(Employee_SK),
+    CONSTRAINT FK_AggSales_Monthly_Shipper FOREIGN KEY (Shipper_SK) REFERENCES dbo.DimShippers(Shipper_SK)
+);
+GO
+
+/* =====================
+   Pipeline control: distributed work queue of date windows
+   ===================== */
+IF OBJECT_ID('dbo.Pipeline_WorkQueue','U') IS NOT NULL DROP TABLE dbo.Pipeline_WorkQueue;
+CREATE TABLE dbo.Pipeline_WorkQueue (
+    WindowID INT IDENTITY(1,1) PRIMARY KEY,
+    QueueName NVARCHAR(128) NOT NULL,
+    WindowStart DATE NOT NULL,
+    WindowEnd DATE NOT NULL,
+    Status NVARCHAR(20) NOT NULL DEFAULT 'PENDING',   -- PENDING | CLAIMED | DONE | FAILED
+    ClaimedBy NVARCHAR(255) NULL,
+    LeaseExpiresAt DATETIME2 NULL,
+    Attempts INT NOT NULL DEFAULT 0,
+    LastError NVARCHAR(MAX) NULL,
+    CreatedAt DATETIME2 DEFAULT SYSUTCDATETIME(),
+    UpdatedAt DATETIME2 NULL,
+    CONSTRAINT UQ_Pipeline_WorkQueue_Window UNIQUE (QueueName, WindowStart, WindowEnd)
+);
+GO
+
+CREATE NONCLUSTERED INDEX IX_Pipeline_WorkQueue_Claim ON dbo.Pipeline_WorkQueue (QueueName, Status, WindowStart);
+GO
+
+IF OBJECT_ID('dbo.Pipeline_WorkQueueSteps','U') IS NOT NULL DROP TABLE dbo.Pipeline_WorkQueueSteps;
+CREATE TABLE dbo.Pipeline_WorkQueueSteps (
+    QueueName NVARCHAR(128) NOT NULL,
+    StepName NVARCHAR(128) NOT NULL,
+    CompletedBy NVARCHAR(255) NOT NULL,
+    CompletedAt DATETIME2 DEFAULT SYSUTCDATETIME(),
+    CONSTRAINT PK_Pipeline_WorkQueueSteps PRIMARY KEY (QueueName, StepName)
+);
+GO
+
+/* =====================
+   Pipeline control: batched fact load progress (last committed OrderID per window, used to resume)
+   ===================== */
+IF OBJECT_ID('dbo.Pipeline_FactLoadProgress','U') IS NOT NULL DROP TABLE dbo.Pipeline_FactLoadProgress;
+CREATE TABLE dbo.Pipeline_FactLoadProgress (
+    FactTableName NVARCHAR(128) NOT NULL,
+    WindowStart DATE NOT NULL,
+    WindowEnd DATE NOT NULL,
+    LastOrderID INT NOT NULL,
+    BatchesCommitted INT NOT NULL DEFAULT 0,
+    RowsInserted BIGINT NOT NULL DEFAULT 0,
+    StartedAt DATETIME2 DEFAULT SYSUTCDATETIME(),
+    UpdatedAt DATETIME2 NULL,
+    CONSTRAINT PK_Pipeline_FactLoadProgress PRIMARY KEY (FactTableName, WindowStart, WindowEnd)
+);
+GO
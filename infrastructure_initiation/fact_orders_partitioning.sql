@@ -0,0 +1,181 @@
+USE ORDER_DDS;
+GO
+
+/* =====================
+   OPTIONAL: partitioned + columnstore FactOrders
+   Run after dimensional_db_table_creation.sql to replace the rowstore FactOrders
+   with a monthly-partitioned table (on OrderDate) stored as a clustered columnstore.
+   Loads then go through update_fact_partition_switch.sql (FACT_ORDERS_PARTITIONED = True).
+   ===================== */
+
+IF OBJECT_ID('dbo.FactOrders','U') IS NOT NULL DROP TABLE dbo.FactOrders;
+IF OBJECT_ID('dbo.FactOrders_SwitchIn','U') IS NOT NULL DROP TABLE dbo.FactOrders_SwitchIn;
+IF OBJECT_ID('dbo.FactOrders_SwitchOut','U') IS NOT NULL DROP TABLE dbo.FactOrders_SwitchOut;
+IF EXISTS (SELECT 1 FROM sys.partition_schemes WHERE name = 'PS_FactOrders_OrderDate') DROP PARTITION SCHEME PS_FactOrders_OrderDate;
+IF EXISTS (SELECT 1 FROM sys.partition_functions WHERE name = 'PF_FactOrders_OrderDate') DROP PARTITION FUNCTION PF_FactOrders_OrderDate;
+IF OBJECT_ID('dbo.seq_FactOrders_SK','SO') IS NOT NULL DROP SEQUENCE dbo.seq_FactOrders_SK;
+GO
+
+/* =====================
+   Surrogate key sequence (shared by FactOrders and its switch tables,
+   so rows built in FactOrders_SwitchIn keep unique OrderFact_SK values)
+   ===================== */
+CREATE SEQUENCE dbo.seq_FactOrders_SK AS BIGINT START WITH 1 INCREMENT BY 1;
+GO
+
+/* =====================
+   Monthly partition function / scheme on OrderDate (RANGE RIGHT: each boundary is a month start)
+   ===================== */
+CREATE PARTITION FUNCTION PF_FactOrders_OrderDate (DATE) AS RANGE RIGHT FOR VALUES ('1996-01-01');
+CREATE PARTITION SCHEME PS_FactOrders_OrderDate AS PARTITION PF_FactOrders_OrderDate ALL TO ([PRIMARY]);
+GO
+
+-- Pre-create monthly boundaries; update_fact_partition_switch.sql splits further months on demand
+DECLARE @boundary DATE = '1996-02-01';
+WHILE @boundary <= '1999-12-01'
+BEGIN
+    ALTER PARTITION SCHEME PS_FactOrders_OrderDate NEXT USED [PRIMARY];
+    ALTER PARTITION FUNCTION PF_FactOrders_OrderDate() SPLIT RANGE (@boundary);
+    SET @boundary = DATEADD(MONTH, 1, @boundary);
+END;
+GO
+
+/* =====================
+   FactOrders – partitioned, clustered columnstore
+   ===================== */
+CREATE TABLE dbo.FactOrders (
+    OrderFact_SK BIGINT NOT NULL CONSTRAINT DF_FactOrders_SK DEFAULT (NEXT VALUE FOR dbo.seq_FactOrders_SK),
+    OrderID INT NOT NULL,
+    OrderDate DATE NOT NULL,
+    RequiredDate DATE,
+    ShippedDate DATE,
+    OrderDateKey INT,
+    RequiredDateKey INT,
+    ShippedDateKey INT,
+    Freight DECIMAL(18,2),
+    Customer_SK INT,
+    Employee_SK INT,
+    Shipper_SK INT,
+    Territory_SK INT,
+    Region_SK INT,
+    Product_SK INT,
+    Category_SK INT,
+    Supplier_SK INT,
+    Quantity INT,
+    UnitPrice DECIMAL(18,2),
+    Discount FLOAT,
+    SOR_SK INT NOT NULL,
+    staging_raw_id_nk INT NOT NULL,
+    LoadDate DATETIME2 DEFAULT SYSUTCDATETIME(),
+    CONSTRAINT PK_FactOrders PRIMARY KEY NONCLUSTERED (OrderFact_SK, OrderDate),
+    CONSTRAINT FK_FactOrders_Customer FOREIGN KEY (Customer_SK) REFERENCES dbo.DimCustomers(Customer_SK),
+    CONSTRAINT FK_FactOrders_Employee FOREIGN KEY (Employee_SK) REFERENCES dbo.DimEmployees(Employee_SK),
+    CONSTRAINT FK_FactOrders_Shipper FOREIGN KEY (Shipper_SK) REFERENCES dbo.DimShippers(Shipper_SK),
+    CONSTRAINT FK_FactOrders_Territory FOREIGN KEY (Territory_SK) REFERENCES dbo.DimTerritories(Territory_SK),
+    CONSTRAINT FK_FactOrders_Region FOREIGN KEY (Region_SK) REFERENCES dbo.DimRegion(Region_SK),
+    CONSTRAINT FK_FactOrders_Product FOREIGN KEY (Product_SK) REFERENCES dbo.DimProducts(Product_SK),
+    CONSTRAINT FK_FactOrders_Category FOREIGN KEY (Category_SK) REFERENCES dbo.DimCategories(Category_SK),
+    CONSTRAINT FK_FactOrders_Supplier FOREIGN KEY (Supplier_SK) REFERENCES dbo.DimSuppliers(Supplier_SK),
+    CONSTRAINT FK_FactOrders_SOR FOREIGN KEY (SOR_SK) REFERENCES dbo.Dim_SOR(SOR_SK),
+    CONSTRAINT FK_FactOrders_OrderDate FOREIGN KEY (OrderDateKey) REFERENCES dbo.DimDate(DateKey),
+    CONSTRAINT FK_FactOrders_RequiredDate FOREIGN KEY (RequiredDateKey) REFERENCES dbo.DimDate(DateKey),
+    CONSTRAINT FK_FactOrders_ShippedDate FOREIGN KEY (ShippedDateKey) REFERENCES dbo.DimDate(DateKey)
+) ON PS_FactOrders_OrderDate (OrderDate);
+GO
+
+CREATE CLUSTERED COLUMNSTORE INDEX CCI_FactOrders ON dbo.FactOrders ON PS_FactOrders_OrderDate (OrderDate);
+GO
+
+-- One row per order line (see dimensional_db_table_creation.sql); partition-aligned so switching stays
+-- metadata-only, which requires the partitioning column in a unique key (an order has a single OrderDate)
+CREATE UNIQUE NONCLUSTERED INDEX IX_FactOrders_OrderID_Product ON dbo.FactOrders (OrderID, Product_SK, OrderDate)
+    ON PS_FactOrders_OrderDate (OrderDate);
+GO
+
+/* =====================
+   FactOrders_SwitchIn – one month is built here, then switched into FactOrders.
+   Must mirror FactOrders (columns, indexes, foreign keys); the OrderDate CHECK
+   constraint is recreated per month by the load script.
+   ===================== */
+CREATE TABLE dbo.FactOrders_SwitchIn (
+    OrderFact_SK BIGINT NOT NULL CONSTRAINT DF_FactOrders_SwitchIn_SK DEFAULT (NEXT VALUE FOR dbo.seq_FactOrders_SK),
+    OrderID INT NOT NULL,
+    OrderDate DATE NOT NULL,
+    RequiredDate DATE,
+    ShippedDate DATE,
+    OrderDateKey INT,
+    RequiredDateKey INT,
+    ShippedDateKey INT,
+    Freight DECIMAL(18,2),
+    Customer_SK INT,
+    Employee_SK INT,
+    Shipper_SK INT,
+    Territory_SK INT,
+    Region_SK INT,
+    Product_SK INT,
+    Category_SK INT,
+    Supplier_SK INT,
+    Quantity INT,
+    UnitPrice DECIMAL(18,2),
+    Discount FLOAT,
+    SOR_SK INT NOT NULL,
+    staging_raw_id_nk INT NOT NULL,
+    LoadDate DATETIME2 DEFAULT SYSUTCDATETIME(),
+    CONSTRAINT PK_FactOrders_SwitchIn PRIMARY KEY NONCLUSTERED (OrderFact_SK, OrderDate),
+    CONSTRAINT FK_FactOrders_SwitchIn_Customer FOREIGN KEY (Customer_SK) REFERENCES dbo.DimCustomers(Customer_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_Employee FOREIGN KEY (Employee_SK) REFERENCES dbo.DimEmployees(Employee_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_Shipper FOREIGN KEY (Shipper_SK) REFERENCES dbo.DimShippers(Shipper_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_Territory FOREIGN KEY (Territory_SK) REFERENCES dbo.DimTerritories(Territory_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_Region FOREIGN KEY (Region_SK) REFERENCES dbo.DimRegion(Region_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_Product FOREIGN KEY (Product_SK) REFERENCES dbo.DimProducts(Product_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_Category FOREIGN KEY (Category_SK) REFERENCES dbo.DimCategories(Category_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_Supplier FOREIGN KEY (Supplier_SK) REFERENCES dbo.DimSuppliers(Supplier_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_SOR FOREIGN KEY (SOR_SK) REFERENCES dbo.Dim_SOR(SOR_SK),
+    CONSTRAINT FK_FactOrders_SwitchIn_OrderDate FOREIGN KEY (OrderDateKey) REFERENCES dbo.DimDate(DateKey),
+    CONSTRAINT FK_FactOrders_SwitchIn_RequiredDate FOREIGN KEY (RequiredDateKey) REFERENCES dbo.DimDate(DateKey),
+    CONSTRAINT FK_FactOrders_SwitchIn_ShippedDate FOREIGN KEY (ShippedDateKey) REFERENCES dbo.DimDate(DateKey)
+) ON [PRIMARY];
+GO
+
+CREATE CLUSTERED COLUMNSTORE INDEX CCI_FactOrders_SwitchIn ON dbo.FactOrders_SwitchIn ON [PRIMARY];
+GO
+
+CREATE UNIQUE NONCLUSTERED INDEX IX_FactOrders_SwitchIn_OrderID_Product ON dbo.FactOrders_SwitchIn (OrderID, Product_SK, OrderDate) ON [PRIMARY];
+GO
+
+/* =====================
+   FactOrders_SwitchOut – receives the replaced month partition (truncated after each switch)
+   ===================== */
+CREATE TABLE dbo.FactOrders_SwitchOut (
+    OrderFact_SK BIGINT NOT NULL,
+    OrderID INT NOT NULL,
+    OrderDate DATE NOT NULL,
+    RequiredDate DATE,
+    ShippedDate DATE,
+    OrderDateKey INT,
+    RequiredDateKey INT,
+    ShippedDateKey INT,
+    Freight DECIMAL(18,2),
+    Customer_SK INT,
+    Employee_SK INT,
+    Shipper_SK INT,
+    Territory_SK INT,
+    Region_SK INT,
+    Product_SK INT,
+    Category_SK INT,
+    Supplier_SK INT,
+    Quantity INT,
+    UnitPrice DECIMAL(18,2),
+    Discount FLOAT,
+    SOR_SK INT NOT NULL,
+    staging_raw_id_nk INT NOT NULL,
+    LoadDate DATETIME2 DEFAULT SYSUTCDATETIME(),
+    CONSTRAINT PK_FactOrders_SwitchOut PRIMARY KEY NONCLUSTERED (OrderFact_SK, OrderDate)
+) ON [PRIMARY];
+GO
+
+CREATE CLUSTERED COLUMNSTORE INDEX CCI_FactOrders_SwitchOut ON dbo.FactOrders_SwitchOut ON [PRIMARY];
+GO
+
+CREATE UNIQUE NONCLUSTERED INDEX IX_FactOrders_SwitchOut_OrderID_Product ON dbo.FactOrders_SwitchOut (OrderID, Product_SK, OrderDate) ON [PRIMARY];
+GO
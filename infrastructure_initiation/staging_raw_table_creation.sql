@@ -152,6 +152,9 @@ CREATE TABLE dbo.stg_Orders_raw (
     LoadDate DATETIME2 DEFAULT SYSUTCDATETIME()
 );
 
+-- Order lookups (fact loads join on OrderID; FactOrders_Error reprocessing probes single orders)
+CREATE NONCLUSTERED INDEX IX_stg_Orders_raw_OrderID ON dbo.stg_Orders_raw (OrderID);
+
 /* =====================
    STAGING: OrderDetails
    ===================== */
@@ -165,3 +168,5 @@ CREATE TABLE dbo.stg_OrderDetails_raw (
     Discount FLOAT,
     LoadDate DATETIME2 DEFAULT SYSUTCDATETIME()
 );
+
+CREATE NONCLUSTERED INDEX IX_stg_OrderDetails_raw_OrderID_ProductID ON dbo.stg_OrderDetails_raw (OrderID, ProductID);
@@ -1,18 +1,75 @@
 """
 Load data from Excel file into SQL Server staging tables
 
-Usage: python load_staging_data.py
+Usage: python load_staging_data.py [--quarantine] [--report_path PATH] [--quarantine_dir DIR]
+                                    [--no_cache] [--cache_dir DIR] [--cache_max_mb MB] [--profile]
 """
 
+import argparse
+from contextlib import ExitStack
+from datetime import datetime
 import pandas as pd
 import pymssql
+from profiling import RunProfiler
 from utils import parse_database_config
+from staging_validation import (
+    QUARANTINE_TABLES, dimension_checks, quarantine_invalid_rows, validate_frames, write_quarantine, write_report
+)
 import sys
 import os
 
 
-def load_data_to_staging():
-    """Load data from Excel into staging tables"""
+def _stage(profiler, name):
+    """
+    Start profiling a loader stage (a no-op when profiling is disabled).
+
+    Use the result as a context manager, or call its close() where the stage ends.
+    """
+    stage = ExitStack()
+    if profiler is not None:
+        stage.enter_context(profiler.profile_task(name))
+    return stage
+
+
+def _read_workbook(excel_file, use_cache, cache_dir, max_cache_bytes):
+    """
+    Read all sheets of the workbook. workbook_cache (and with it pyarrow) is only
+    imported when the snapshot cache is used, so --no_cache works without pyarrow.
+    """
+    if not use_cache:
+        excel_file_obj = pd.ExcelFile(excel_file)
+        frames = {sheet_name: excel_file_obj.parse(sheet_name) for sheet_name in excel_file_obj.sheet_names}
+        return list(excel_file_obj.sheet_names), frames, False
+
+    from workbook_cache import read_workbook
+    return read_workbook(excel_file, cache_dir=cache_dir, max_cache_bytes=max_cache_bytes)
+
+
+def load_data_to_staging(
+    quarantine=False,
+    report_path='logs/staging_validation_report.json',
+    quarantine_dir='quarantine',
+    use_cache=True,
+    cache_dir='.cache/workbook',
+    max_cache_bytes=512 * 1024 * 1024,
+    profile=False
+):
+    """
+    Load data from Excel into staging tables
+
+    Every sheet is read and validated in memory first (null/type checks, duplicate
+    natural keys, orphan foreign keys across sheets). With quarantine=True the
+    failing Orders / Order Details rows are written to quarantine_dir and not
+    inserted; failing rows of dimension source tables stop the load instead, since
+    dropping them would make the next dimension run mark those members deleted.
+
+    Sheets are read through a Feather snapshot cache keyed by the workbook's
+    content hash, so an unchanged file is only parsed once.
+
+    With profile=True each stage (workbook read, validation, one load per table)
+    is profiled with cProfile/tracemalloc into profiles/staging_<timestamp>/.
+    """
+    profiler = RunProfiler(f"staging_{datetime.now():%Y%m%d_%H%M%S}") if profile else None
     
     excel_file = '../DS206_Project2_Group4 3/raw_data_source.xlsx'
     
@@ -71,11 +128,16 @@ def load_data_to_staging():
     }
     
     try:
-        # Read Excel file to get sheet names
-        excel_file_obj = pd.ExcelFile(excel_file)
-        available_sheets = excel_file_obj.sheet_names
+        # Read all sheets (from the snapshot cache when the file is unchanged)
+        with _stage(profiler, "read_workbook"):
+            available_sheets, workbook, cache_hit = _read_workbook(excel_file, use_cache, cache_dir, max_cache_bytes)
+        if use_cache:
+            print(f"{'✓ Using cached snapshot' if cache_hit else '✓ Built snapshot'} of {excel_file} ({cache_dir})")
         print(f"Available sheets in Excel: {', '.join(available_sheets)}\n")
         
+        # Read every mapped sheet up front so cross-sheet checks can run before any insert
+        sheets = {}
+        frames = {}
         for sheet_name in available_sheets:
             # Map sheet name to table (handle both 'Order Details' and 'OrderDetails')
             if sheet_name in ['Order Details', 'OrderDetails']:
@@ -86,10 +148,39 @@ def load_data_to_staging():
                 print(f"⚠ Skipping sheet '{sheet_name}' (not in mapping)")
                 continue
             
-            print(f"Loading {sheet_name} → {table_name}...")
+            sheets[table_name] = sheet_name
+            frames[table_name] = workbook[sheet_name]
+        
+        # Validate in memory before touching the server
+        with _stage(profiler, "validate"):
+            if quarantine:
+                frames_to_load, quarantined, checks = quarantine_invalid_rows(frames)
+            else:
+                frames_to_load, quarantined = frames, {}
+                _, checks = validate_frames(frames)
+        write_report(checks, frames, report_path)
+        
+        if checks:
+            print(f"⚠ Validation found {len(checks)} failed check(s) (report: {report_path})")
+            for check in checks:
+                print(f"  {check['table']}: {check['check']} ({check['rows']} rows)")
+        else:
+            print(f"✓ Validation passed (report: {report_path})")
+        if quarantine and dimension_checks(checks):
+            print(f"✗ Dimension source rows failed validation and cannot be quarantined "
+                  f"(only {', '.join(QUARANTINE_TABLES)} can). Fix the source workbook; nothing was loaded.")
+            sys.exit(1)
+        if quarantined:
+            write_quarantine(quarantined, quarantine_dir)
+            total = sum(len(df) for df in quarantined.values())
+            print(f"⚠ Quarantined {total} row(s) to {quarantine_dir}/")
+        print()
+        
+        for table_name, sheet_name in sheets.items():
+            stage = _stage(profiler, f"load_{table_name}")
+            df = frames_to_load[table_name]
             
-            # Read Excel sheet
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
+            print(f"Loading {sheet_name} → {table_name}...")
             
             # Clear existing data in staging table
             cursor.execute(f"TRUNCATE TABLE dbo.{table_name}")
@@ -261,6 +352,7 @@ def load_data_to_staging():
             cursor.execute(f"SELECT COUNT(*) FROM dbo.{table_name}")
             row_count = cursor.fetchone()[0]
             print(f"  ✓ Loaded {row_count} rows\n")
+            stage.close()
         
         print("\n" + "="*60)
         print("✓ All data loaded successfully!")
@@ -289,13 +381,44 @@ def load_data_to_staging():
     finally:
         cursor.close()
         conn.close()
+        if profiler is not None:
+            try:
+                print(f"\nProfile written to {profiler.write_bundle()} (see summary.txt)")
+            except Exception as e:
+                print(f"\n⚠ Failed to write profile: {e}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load the Excel source into the staging tables")
+    parser.add_argument("--quarantine", action="store_true",
+                        help="Do not insert Orders / Order Details rows that fail validation; write them to "
+                             "--quarantine_dir instead (invalid dimension source rows stop the load)")
+    parser.add_argument("--report_path", type=str, default="logs/staging_validation_report.json",
+                        help="Path of the JSON validation report")
+    parser.add_argument("--quarantine_dir", type=str, default="quarantine",
+                        help="Directory for quarantined rows (one CSV per staging table)")
+    parser.add_argument("--no_cache", action="store_true",
+                        help="Parse the workbook directly instead of using the snapshot cache")
+    parser.add_argument("--cache_dir", type=str, default=".cache/workbook",
+                        help="Directory of the workbook snapshot cache")
+    parser.add_argument("--cache_max_mb", type=int, default=512,
+                        help="Size limit of the snapshot cache in MB (least recently used snapshots are evicted)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile each load stage (cProfile, tracemalloc) into profiles/staging_<timestamp>/")
+    args = parser.parse_args()
+    
     print("="*60)
     print("Loading Staging Data from Excel")
     print("="*60)
     print()
     
-    load_data_to_staging()
+    load_data_to_staging(
+        quarantine=args.quarantine,
+        report_path=args.report_path,
+        quarantine_dir=args.quarantine_dir,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        max_cache_bytes=args.cache_max_mb * 1024 * 1024,
+        profile=args.profile
+    )
 
@@ -3,9 +3,17 @@ Main entry point for the dimensional data pipeline.
 Parses command-line arguments and executes the dimensional data flow.
 """
 import argparse
+import multiprocessing
+import os
+import socket
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from pipeline_dimensional_data.flow import DimensionalDataFlow
+from typing import Dict, List
+from pipeline_dimensional_data.config import MAINTENANCE_ENABLED
+from pipeline_dimensional_data.flow import DimensionalDataFlow, run_target
+from pipeline_dimensional_data.work_queue import SqlServerWorkQueue, get_staging_load_batch
+from utils import list_database_targets, parse_database_config
 
 
 def parse_arguments():
@@ -34,6 +42,63 @@ def parse_arguments():
         help='End date for fact table ingestion (format: YYYY-MM-DD)'
     )
     
+    parser.add_argument(
+        '--distributed',
+        action='store_true',
+        help='Run as one of several workers sharing a SQL Server work queue of date windows'
+    )
+    
+    parser.add_argument(
+        '--queue_name',
+        type=str,
+        default=None,
+        help='Work queue name shared by the workers of one backfill '
+             '(default: <start_date>_<end_date>_<latest staging LoadDate>, so a new staging load starts a new queue)'
+    )
+    
+    parser.add_argument(
+        '--worker_id',
+        type=str,
+        default=f"{socket.gethostname()}:{os.getpid()}",
+        help='Unique worker identifier (default: <hostname>:<pid>)'
+    )
+    
+    parser.add_argument(
+        '--window_months',
+        type=int,
+        default=1,
+        help='Calendar months per work-queue window (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--maintenance',
+        action='store_true',
+        default=MAINTENANCE_ENABLED,
+        help='Refresh statistics and fix fragmented indexes of tables changed past the configured thresholds '
+             '(default: MAINTENANCE_ENABLED in pipeline_dimensional_data/config.py)'
+    )
+    
+    parser.add_argument(
+        '--targets',
+        type=str,
+        default=None,
+        help='Run against named [TARGET <name>] sections of the config: "all" or a comma-separated list'
+    )
+    
+    parser.add_argument(
+        '--max_workers',
+        type=int,
+        default=None,
+        help='Processes for --targets (default: one per target, capped at the CPU count)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Capture actual query plans, STATISTICS IO/TIME and Python profiles per task '
+             'into profiles/<execution_id>/'
+    )
+    
     return parser.parse_args()
 
 
@@ -54,6 +119,70 @@ def validate_date(date_string: str) -> bool:
         return False
 
 
+def run_targets(targets: List[str], args, config_file_path: str = "sql_server_config.cfg") -> List[Dict]:
+    """
+    Run the pipeline for several targets on a process pool.
+    
+    Each target gets its own connection semaphore sized by its max_connections, so a
+    target's limit holds regardless of which other targets share its server.
+    
+    Args:
+        targets: Target names
+        args: Parsed command-line arguments
+        config_file_path: Path to database configuration file
+        
+    Returns:
+        list: One summary dict per target (see flow.run_target)
+    """
+    target_limits = {
+        target: parse_database_config(config_file_path, None if target == 'default' else target)['max_connections']
+        for target in targets
+    }
+    
+    max_workers = args.max_workers or min(len(targets), os.cpu_count() or 1)
+    summaries = []
+    with multiprocessing.Manager() as manager:
+        connection_limits = {target: manager.BoundedSemaphore(limit) for target, limit in target_limits.items()}
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    run_target, target, args.start_date, args.end_date,
+                    args.maintenance, config_file_path, connection_limits, args.profile
+                ): target
+                for target in targets
+            }
+            for future in as_completed(futures):
+                try:
+                    summaries.append(future.result())
+                except Exception as e:
+                    summaries.append({'target': futures[future], 'success': False, 'error': str(e)})
+    
+    return sorted(summaries, key=lambda summary: targets.index(summary['target']))
+
+
+def print_target_summary(summaries: List[Dict]) -> None:
+    """
+    Print the aggregated result of a multi-target run.
+    
+    Args:
+        summaries: Summary dicts returned by run_targets
+    """
+    print("=" * 60)
+    print("Multi-target summary")
+    print("=" * 60)
+    for summary in summaries:
+        status = "✓" if summary.get('success') else "✗"
+        print(f"{status} {summary['target']} ({summary.get('database') or 'N/A'}): "
+              f"{summary.get('duration_seconds', 0)}s, {summary.get('retries', 0)} retries, "
+              f"execution_id {summary.get('execution_id') or 'N/A'}")
+        if not summary.get('success'):
+            print(f"    Error: {summary.get('error') or 'Unknown error'}")
+    succeeded = sum(1 for summary in summaries if summary.get('success'))
+    print(f"{succeeded}/{len(summaries)} targets succeeded, "
+          f"{sum(summary.get('retries', 0) for summary in summaries)} retries in total")
+
+
 def main():
     """Main function to execute the pipeline."""
     # Parse arguments
@@ -76,10 +205,61 @@ def main():
         print(f"Error: start_date ({args.start_date}) must be before or equal to end_date ({args.end_date})")
         sys.exit(1)
     
+    if args.window_months < 1:
+        print(f"Error: window_months must be at least 1, got {args.window_months}")
+        sys.exit(1)
+    
+    if args.max_workers is not None and args.max_workers < 1:
+        print(f"Error: max_workers must be at least 1, got {args.max_workers}")
+        sys.exit(1)
+    
+    # Multi-target run: one process per target
+    if args.targets:
+        if args.distributed:
+            print("Error: --targets cannot be combined with --distributed")
+            sys.exit(1)
+        
+        try:
+            available_targets = list_database_targets()
+            if args.targets == 'all':
+                targets = available_targets
+            else:
+                targets = [target.strip() for target in args.targets.split(',') if target.strip()]
+                unknown = [target for target in targets if target not in available_targets]
+                if unknown:
+                    print(f"Error: Unknown target(s): {', '.join(unknown)}. Available: {', '.join(available_targets)}")
+                    sys.exit(1)
+            
+            summaries = run_targets(targets, args)
+        except Exception as e:
+            print(f"Fatal error: {str(e)}")
+            sys.exit(1)
+        
+        print_target_summary(summaries)
+        sys.exit(0 if all(summary.get('success') for summary in summaries) else 1)
+    
     # Create and execute the flow
     try:
-        flow = DimensionalDataFlow()
-        result = flow.exec(start_date=args.start_date, end_date=args.end_date)
+        flow = DimensionalDataFlow(profile=args.profile)
+        if args.distributed:
+            queue_name = args.queue_name or f"{args.start_date}_{args.end_date}_{get_staging_load_batch()}"
+            queue = SqlServerWorkQueue(queue_name)
+            result = flow.exec_distributed(
+                start_date=args.start_date,
+                end_date=args.end_date,
+                queue=queue,
+                worker_id=args.worker_id,
+                window_months=args.window_months,
+                maintenance=args.maintenance
+            )
+        else:
+            result = flow.exec(start_date=args.start_date, end_date=args.end_date, maintenance=args.maintenance)
+        
+        if result.get('retries'):
+            print(f"Transient SQL errors retried: {result['retries']} ({result['retry_seconds']:.1f}s lost to retries)")
+        
+        if flow.profiler is not None:
+            print(f"Profile written to {flow.profiler.bundle_dir} (see summary.txt)")
         
         if result.get('success', False):
             print(f"Pipeline executed successfully! Execution ID: {result.get('execution_id')}")
@@ -17,11 +17,44 @@ DIM_SHIPPERS = "DimShippers"
 DIM_SUPPLIERS = "DimSuppliers"
 DIM_TERRITORIES = "DimTerritories"
 DIM_SOR = "Dim_SOR"
+DIM_DATE = "DimDate"
+
+# DimDate settings
+# Month in which the fiscal year starts (1 = calendar year); the fiscal year is named after the year it ends in
+DIM_DATE_FISCAL_YEAR_START_MONTH = 1
+# Holidays: 'MM-DD' recurs every year, 'YYYY-MM-DD' applies to a single date
+DIM_DATE_HOLIDAYS = {
+    "01-01": "New Year's Day",
+    "07-04": "Independence Day",
+    "12-25": "Christmas Day",
+}
 
 # Fact table names
 FACT_ORDERS = "FactOrders"
 FACT_ORDERS_ERROR = "FactOrders_Error"
 
+# Optional partitioned/columnstore FactOrders (see infrastructure_initiation/fact_orders_partitioning.sql)
+FACT_ORDERS_PARTITIONED = False
+FACT_ORDERS_SWITCH_IN = "FactOrders_SwitchIn"
+FACT_ORDERS_SWITCH_OUT = "FactOrders_SwitchOut"
+FACT_ORDERS_PARTITION_FUNCTION = "PF_FactOrders_OrderDate"
+FACT_ORDERS_PARTITION_SCHEME = "PS_FactOrders_OrderDate"
+# How long a partition-switch load waits for another run to finish switching its month (ms)
+FACT_ORDERS_SWITCH_LOCK_TIMEOUT_MS = 1800000
+
+# FactOrders insert strategy for the non-partitioned table:
+#   "single"  - one INSERT ... SELECT per window (update_fact.sql)
+#   "batched" - OrderID key-range batches of about FACT_ORDERS_BATCH_SIZE rows, one transaction each,
+#               resumable from FACT_LOAD_PROGRESS_TABLE and safe to re-run (update_fact_batched.sql)
+#   "bulk"    - one TABLOCK insert in one transaction, for initial loads (update_fact_bulk.sql)
+FACT_ORDERS_LOAD_STRATEGY = "single"
+FACT_ORDERS_BATCH_SIZE = 50000
+FACT_LOAD_PROGRESS_TABLE = "Pipeline_FactLoadProgress"
+
+# Dashboard aggregate table names
+AGG_SALES_DAILY = "AggSales_Daily_Product_Country"
+AGG_SALES_MONTHLY = "AggSales_Monthly_Employee_Shipper"
+
 # Staging table names
 STG_CATEGORIES_RAW = "stg_Categories_raw"
 STG_CUSTOMERS_RAW = "stg_Customers_raw"
@@ -33,3 +66,33 @@ STG_SUPPLIERS_RAW = "stg_Suppliers_raw"
 STG_TERRITORIES_RAW = "stg_Territories_raw"
 STG_ORDERS_RAW = "stg_Orders_raw"
 STG_ORDER_DETAILS_RAW = "stg_OrderDetails_raw"
+STAGING_TABLES = [
+    STG_CATEGORIES_RAW, STG_CUSTOMERS_RAW, STG_EMPLOYEES_RAW, STG_PRODUCTS_RAW, STG_REGION_RAW,
+    STG_SHIPPERS_RAW, STG_SUPPLIERS_RAW, STG_TERRITORIES_RAW, STG_ORDERS_RAW, STG_ORDER_DETAILS_RAW
+]
+
+# Distributed execution work queue
+WORK_QUEUE_TABLE = "Pipeline_WorkQueue"
+WORK_QUEUE_STEPS_TABLE = "Pipeline_WorkQueueSteps"
+WORK_QUEUE_LEASE_SECONDS = 1800
+WORK_QUEUE_MAX_ATTEMPTS = 3
+WORK_QUEUE_LOCK_TIMEOUT_MS = 1800000
+
+# Optional post-load maintenance (statistics refresh and index health)
+MAINTENANCE_ENABLED = False
+MAINTENANCE_STATS_CHANGED_PCT = 10
+MAINTENANCE_STATS_CHANGED_ROWS = 100000
+MAINTENANCE_REORGANIZE_PCT = 5
+MAINTENANCE_REBUILD_PCT = 30
+MAINTENANCE_MIN_PAGES = 100
+MAINTENANCE_STAGING_TABLES = list(STAGING_TABLES)
+MAINTENANCE_DDS_TABLES = [
+    DIM_CATEGORIES, DIM_CUSTOMERS, DIM_EMPLOYEES, DIM_PRODUCTS, DIM_REGION, DIM_SHIPPERS,
+    DIM_SUPPLIERS, DIM_TERRITORIES, DIM_DATE, FACT_ORDERS, FACT_ORDERS_ERROR,
+    AGG_SALES_DAILY, AGG_SALES_MONTHLY
+]
+
+# Retry of transient SQL errors (deadlock victim, lock timeout, dropped connection) for idempotent scripts
+SQL_RETRY_MAX_ATTEMPTS = 4
+SQL_RETRY_BASE_DELAY_SECONDS = 0.5
+SQL_RETRY_MAX_DELAY_SECONDS = 30
@@ -4,21 +4,32 @@ Sequentially executes all ETL tasks for the dimensional data pipeline.
 """
 import sys
 import os
-from typing import Dict
+import time
+from typing import Callable, Dict, List, Optional
 
 # Add parent directory to path for imports
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from utils import generate_uuid
+from profiling import RunProfiler
+from utils import generate_uuid, parse_database_config
 # Import pipeline logging module
 import importlib.util
 logging_spec = importlib.util.spec_from_file_location("pipeline_logging", os.path.join(parent_dir, "pipeline_logging.py"))
 pipeline_logging = importlib.util.module_from_spec(logging_spec)
 logging_spec.loader.exec_module(pipeline_logging)
 
-from pipeline_dimensional_data import tasks
+from pipeline_dimensional_data import tasks, work_queue
+from pipeline_dimensional_data.config import (
+    DATABASE_NAME,
+    MAINTENANCE_DDS_TABLES,
+    MAINTENANCE_ENABLED,
+    MAINTENANCE_STAGING_TABLES,
+    WORK_QUEUE_LEASE_SECONDS,
+    WORK_QUEUE_MAX_ATTEMPTS,
+    WORK_QUEUE_LOCK_TIMEOUT_MS,
+)
 
 
 class DimensionalDataFlow:
@@ -27,24 +38,51 @@ class DimensionalDataFlow:
     Generates a unique execution_id upon instantiation and sequentially executes all tasks.
     """
     
-    def __init__(self, log_file_path: str = "logs/logs_dimensional_data_pipeline.txt"):
+    def __init__(
+        self,
+        log_file_path: str = "logs/logs_dimensional_data_pipeline.txt",
+        target: Optional[str] = None,
+        database_name: str = DATABASE_NAME,
+        config_file_path: str = "sql_server_config.cfg",
+        profile: bool = False
+    ):
         """
         Initialize the dimensional data flow.
         
         Args:
             log_file_path: Path to the log file
+            target: Named database target from the config file (None for [DATABASE])
+            database_name: Dimensional database of the target
+            config_file_path: Path to database configuration file
+            profile: Capture actual query plans, STATISTICS IO/TIME and Python profiles per task
+                     into profiles/<execution_id>/
         """
         self.execution_id = generate_uuid()
+        self.target = target
+        # Passed to every task so the whole run goes to the same target
+        self.task_options = {
+            'database_name': database_name,
+            'config_file_path': config_file_path,
+            'target': target
+        }
         self.logger = pipeline_logging.setup_logger(self.execution_id, log_file_path)
-        self.logger.info(f"DimensionalDataFlow initialized with execution_id: {self.execution_id}")
+        self.logger.info(
+            f"DimensionalDataFlow initialized with execution_id: {self.execution_id}"
+            + (f" (target: {target}, database: {database_name})" if target else "")
+        )
+        self.profiler = RunProfiler(self.execution_id) if profile else None
+        if self.profiler is not None:
+            tasks.set_profiler(self.profiler)
+            self.logger.info(f"Profile mode: writing plans and profiles to {self.profiler.bundle_dir}")
     
-    def exec(self, start_date: str, end_date: str) -> Dict[str, bool]:
+    def exec(self, start_date: str, end_date: str, maintenance: bool = MAINTENANCE_ENABLED) -> Dict[str, bool]:
         """
         Execute the dimensional data pipeline sequentially.
         
         Args:
             start_date: Start date for fact table ingestion (YYYY-MM-DD)
             end_date: End date for fact table ingestion (YYYY-MM-DD)
+            maintenance: Refresh statistics / index health of staging tables before and DDS tables after the load
             
         Returns:
             dict: {'success': True} if all tasks completed successfully
@@ -55,73 +93,468 @@ class DimensionalDataFlow:
         results = {}
         
         try:
+            if maintenance:
+                self.logger.info("Refreshing staging table statistics...")
+                self._maintain_tables(results, 'maintenance_staging', MAINTENANCE_STAGING_TABLES)
+            
             # Step 1: Update dimension tables (can run in parallel logically, but executing sequentially for simplicity)
             self.logger.info("Step 1: Updating dimension tables...")
+            self._update_dimensions(results)
+            self._reprocess_fact_errors(results)
+            self._update_window(results, start_date, end_date, results['dim_territories'])
             
-            # Update all dimensions
-            self.logger.info("Updating DimCategories...")
-            results['dim_categories'] = tasks.update_dim_categories()
-            if not results['dim_categories'].get('success', False):
-                raise Exception("Failed to update DimCategories")
-            
-            self.logger.info("Updating DimCustomers...")
-            results['dim_customers'] = tasks.update_dim_customers(results['dim_categories'])
-            if not results['dim_customers'].get('success', False):
-                raise Exception("Failed to update DimCustomers")
+            if maintenance:
+                self.logger.info("Step 5: Post-load maintenance...")
+                self._maintain_tables(results, 'maintenance_dds', MAINTENANCE_DDS_TABLES)
             
-            self.logger.info("Updating DimEmployees...")
-            results['dim_employees'] = tasks.update_dim_employees(results['dim_customers'])
-            if not results['dim_employees'].get('success', False):
-                raise Exception("Failed to update DimEmployees")
+            self.logger.info("Dimensional data pipeline execution completed successfully!")
+            return {'success': True, 'execution_id': self.execution_id, 'results': results, **self._retry_summary(results)}
             
-            self.logger.info("Updating DimProducts...")
-            results['dim_products'] = tasks.update_dim_products(results['dim_employees'])
-            if not results['dim_products'].get('success', False):
-                raise Exception("Failed to update DimProducts")
+        except Exception as e:
+            self.logger.error(f"Pipeline execution failed: {str(e)}")
+            return {
+                'success': False, 'execution_id': self.execution_id, 'error': str(e), 'results': results,
+                **self._retry_summary(results)
+            }
+        finally:
+            self._write_profile()
+    
+    def exec_distributed(
+        self,
+        start_date: str,
+        end_date: str,
+        queue,
+        worker_id: str,
+        window_months: int = 1,
+        lease_seconds: int = WORK_QUEUE_LEASE_SECONDS,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS,
+        lock_timeout_ms: int = WORK_QUEUE_LOCK_TIMEOUT_MS,
+        maintenance: bool = MAINTENANCE_ENABLED
+    ) -> Dict[str, bool]:
+        """
+        Execute the pipeline as one of several workers sharing a work queue of date windows.
+        
+        The dimension updates run exactly once per queue under a named lock; the date range is
+        split into windows that workers claim with a lease, so no window is loaded twice concurrently.
+        A window can still be loaded again (retry after a failure, lease lost), so the fact load
+        must be re-runnable (see tasks.fact_load_is_rerunnable).
+        
+        Args:
+            start_date: Start date for fact table ingestion (YYYY-MM-DD)
+            end_date: End date for fact table ingestion (YYYY-MM-DD)
+            queue: Work queue (SqlServerWorkQueue or InMemoryWorkQueue)
+            worker_id: Unique identifier of this worker
+            window_months: Calendar months per window
+            lease_seconds: Lease length of a claimed window (renewed in the background while it is loaded)
+            max_attempts: Attempts per window before it is left as FAILED
+            lock_timeout_ms: How long to wait for the dimension lock
+            maintenance: Refresh statistics / index health of staging tables before the dimension
+                         update and of DDS tables after this worker runs out of windows
             
-            self.logger.info("Updating DimRegion...")
-            results['dim_region'] = tasks.update_dim_region(results['dim_products'])
-            if not results['dim_region'].get('success', False):
-                raise Exception("Failed to update DimRegion")
+        Returns:
+            dict: {'success': True} if every window claimed by this worker completed
+        """
+        self.logger.info(
+            f"Starting distributed pipeline execution as worker {worker_id}. "
+            f"Queue: {queue.queue_name}. Date range: {start_date} to {end_date}"
+        )
+        
+        results = {'windows': {}}
+        failed_windows = []
+        
+        try:
+            if not tasks.fact_load_is_rerunnable():
+                raise Exception(
+                    "Distributed execution reloads retried windows, which requires a re-runnable fact load "
+                    "(set FACT_ORDERS_PARTITIONED = True or FACT_ORDERS_LOAD_STRATEGY = 'batched' "
+                    "in pipeline_dimensional_data/config.py)"
+                )
             
-            self.logger.info("Updating DimShippers...")
-            results['dim_shippers'] = tasks.update_dim_shippers(results['dim_region'])
-            if not results['dim_shippers'].get('success', False):
-                raise Exception("Failed to update DimShippers")
+            queue.enqueue_windows(work_queue.split_date_range(start_date, end_date, window_months))
             
-            self.logger.info("Updating DimSuppliers...")
-            results['dim_suppliers'] = tasks.update_dim_suppliers(results['dim_shippers'])
-            if not results['dim_suppliers'].get('success', False):
-                raise Exception("Failed to update DimSuppliers")
+            # Step 1: Update dimension tables once per queue
+            lock_name = f"{queue.queue_name}:dimensions"
+            if not queue.acquire_lock(lock_name, lock_timeout_ms):
+                raise Exception("Timed out waiting for the dimension update lock")
+            try:
+                if queue.is_step_done('dimensions'):
+                    self.logger.info("Step 1: Dimension tables already updated for this queue, skipping")
+                else:
+                    if maintenance:
+                        self.logger.info("Refreshing staging table statistics...")
+                        self._maintain_tables(results, 'maintenance_staging', MAINTENANCE_STAGING_TABLES)
+                    self.logger.info("Step 1: Updating dimension tables...")
+                    self._update_dimensions(results)
+                    self._reprocess_fact_errors(results)
+                    queue.mark_step_done('dimensions', worker_id)
+            finally:
+                queue.release_lock(lock_name)
             
-            self.logger.info("Updating DimTerritories...")
-            results['dim_territories'] = tasks.update_dim_territories(results['dim_suppliers'])
-            if not results['dim_territories'].get('success', False):
-                raise Exception("Failed to update DimTerritories")
+            # Claim and process windows until none are left
+            while True:
+                window = queue.claim(worker_id, lease_seconds, max_attempts)
+                if window is None:
+                    break
+                
+                window_id = window['window_id']
+                window_key = f"{window['window_start']}_{window['window_end']}"
+                self.logger.info(
+                    f"Claimed window {window['window_start']} to {window['window_end']} "
+                    f"(attempt {window['attempts']})"
+                )
+                
+                window_results = {}
+                try:
+                    with work_queue.LeaseKeeper(queue, window_id, worker_id, lease_seconds) as lease:
+                        self._update_window(
+                            window_results, window['window_start'], window['window_end'],
+                            {'success': True}, heartbeat=lease.check
+                        )
+                        lease.check()
+                    # Only the lease owner can complete the window; otherwise another worker reloads it
+                    if not queue.complete(window_id, worker_id):
+                        raise Exception(f"Lost the lease on window {window_key} before it completed")
+                except Exception as e:
+                    self.logger.error(f"Window {window_key} failed: {str(e)}")
+                    queue.fail(window_id, worker_id, str(e))
+                    failed_windows.append(window_key)
+                results['windows'][window_key] = window_results
             
-            # Step 2: Update fact table (depends on all dimensions)
-            self.logger.info("Step 2: Updating fact table...")
-            results['fact_orders'] = tasks.update_fact_orders(
-                start_date=start_date,
-                end_date=end_date,
-                prerequisite_result=results['dim_territories']
-            )
-            if not results['fact_orders'].get('success', False):
-                raise Exception("Failed to update FactOrders")
+            if failed_windows:
+                raise Exception(f"Failed windows: {', '.join(failed_windows)}")
             
-            # Step 3: Update fact error table (depends on fact table update)
-            self.logger.info("Step 3: Updating fact error table...")
-            results['fact_orders_error'] = tasks.update_fact_orders_error(
-                start_date=start_date,
-                end_date=end_date,
-                prerequisite_result=results['fact_orders']
-            )
-            if not results['fact_orders_error'].get('success', False):
-                raise Exception("Failed to update FactOrders_Error")
+            # Thresholds make this cheap for workers finishing after another worker already maintained the tables
+            if maintenance:
+                self.logger.info("Step 5: Post-load maintenance...")
+                self._maintain_tables(results, 'maintenance_dds', MAINTENANCE_DDS_TABLES)
             
-            self.logger.info("Dimensional data pipeline execution completed successfully!")
-            return {'success': True, 'execution_id': self.execution_id, 'results': results}
+            self.logger.info("Distributed pipeline execution completed successfully!")
+            return {'success': True, 'execution_id': self.execution_id, 'results': results, **self._retry_summary(results)}
             
         except Exception as e:
             self.logger.error(f"Pipeline execution failed: {str(e)}")
-            return {'success': False, 'execution_id': self.execution_id, 'error': str(e), 'results': results}
+            return {
+                'success': False, 'execution_id': self.execution_id, 'error': str(e), 'results': results,
+                **self._retry_summary(results)
+            }
+        finally:
+            self._write_profile()
+    
+    def _update_dimensions(self, results: Dict) -> None:
+        """
+        Update all SCD dimension tables sequentially.
+        
+        Args:
+            results: Dictionary collecting task results (updated in place)
+        """
+        # Update all dimensions
+        self.logger.info("Updating DimCategories...")
+        results['dim_categories'] = self._run_task(
+            'dim_categories', tasks.update_dim_categories, **self.task_options
+        )
+        if not results['dim_categories'].get('success', False):
+            raise Exception("Failed to update DimCategories")
+        
+        self.logger.info("Updating DimCustomers...")
+        results['dim_customers'] = self._run_task(
+            'dim_customers', tasks.update_dim_customers, results['dim_categories'], **self.task_options
+        )
+        if not results['dim_customers'].get('success', False):
+            raise Exception("Failed to update DimCustomers")
+        
+        self.logger.info("Updating DimEmployees...")
+        results['dim_employees'] = self._run_task(
+            'dim_employees', tasks.update_dim_employees, results['dim_customers'], **self.task_options
+        )
+        if not results['dim_employees'].get('success', False):
+            raise Exception("Failed to update DimEmployees")
+        
+        self.logger.info("Updating DimProducts...")
+        results['dim_products'] = self._run_task(
+            'dim_products', tasks.update_dim_products, results['dim_employees'], **self.task_options
+        )
+        if not results['dim_products'].get('success', False):
+            raise Exception("Failed to update DimProducts")
+        
+        self.logger.info("Updating DimRegion...")
+        results['dim_region'] = self._run_task(
+            'dim_region', tasks.update_dim_region, results['dim_products'], **self.task_options
+        )
+        if not results['dim_region'].get('success', False):
+            raise Exception("Failed to update DimRegion")
+        
+        self.logger.info("Updating DimShippers...")
+        results['dim_shippers'] = self._run_task(
+            'dim_shippers', tasks.update_dim_shippers, results['dim_region'], **self.task_options
+        )
+        if not results['dim_shippers'].get('success', False):
+            raise Exception("Failed to update DimShippers")
+        
+        self.logger.info("Updating DimSuppliers...")
+        results['dim_suppliers'] = self._run_task(
+            'dim_suppliers', tasks.update_dim_suppliers, results['dim_shippers'], **self.task_options
+        )
+        if not results['dim_suppliers'].get('success', False):
+            raise Exception("Failed to update DimSuppliers")
+        
+        self.logger.info("Updating DimTerritories...")
+        results['dim_territories'] = self._run_task(
+            'dim_territories', tasks.update_dim_territories, results['dim_suppliers'], **self.task_options
+        )
+        if not results['dim_territories'].get('success', False):
+            raise Exception("Failed to update DimTerritories")
+    
+    def _reprocess_fact_errors(self, results: Dict) -> None:
+        """
+        Resolve FactOrders_Error rows whose late-arriving dimension members have now been loaded,
+        then refresh the aggregates for the order dates that received new fact rows.
+        
+        Args:
+            results: Dictionary collecting task results (updated in place)
+        """
+        self.logger.info("Reprocessing unresolved FactOrders_Error rows...")
+        results['fact_orders_error_reprocessed'] = self._run_task(
+            'fact_orders_error_reprocessed', tasks.reprocess_fact_orders_error,
+            results['dim_territories'], **self.task_options
+        )
+        if not results['fact_orders_error_reprocessed'].get('success', False):
+            raise Exception("Failed to reprocess FactOrders_Error")
+        
+        reprocessed = results['fact_orders_error_reprocessed']
+        self.logger.info(
+            f"Resolved {reprocessed['resolved_rows']} FactOrders_Error rows, "
+            f"inserted {reprocessed['inserted_rows']} FactOrders rows"
+        )
+        if reprocessed['inserted_rows']:
+            results['agg_sales_reprocessed'] = self._run_task(
+                'agg_sales_reprocessed', tasks.update_agg_sales,
+                start_date=reprocessed['min_order_date'],
+                end_date=reprocessed['max_order_date'],
+                prerequisite_result=reprocessed,
+                **self.task_options
+            )
+            if not results['agg_sales_reprocessed'].get('success', False):
+                raise Exception("Failed to update aggregate tables for reprocessed rows")
+    
+    def _update_window(
+        self,
+        results: Dict,
+        start_date: str,
+        end_date: str,
+        prerequisite_result: Dict,
+        heartbeat: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Run the date-window tasks: DimDate, FactOrders, FactOrders_Error and aggregates.
+        
+        Args:
+            results: Dictionary collecting task results (updated in place)
+            start_date: Start date of the window (YYYY-MM-DD)
+            end_date: End date of the window (YYYY-MM-DD)
+            prerequisite_result: Result of the dimension update
+            heartbeat: Optional callable invoked before each task (e.g. to stop once a work-queue lease was lost)
+        """
+        if heartbeat is not None:
+            heartbeat()
+        self.logger.info("Updating DimDate...")
+        results['dim_date'] = self._run_task(
+            'dim_date', tasks.update_dim_date,
+            start_date=start_date,
+            end_date=end_date,
+            prerequisite_result=prerequisite_result,
+            **self.task_options
+        )
+        if not results['dim_date'].get('success', False):
+            raise Exception("Failed to update DimDate")
+        
+        # Step 2: Update fact table (depends on all dimensions)
+        if heartbeat is not None:
+            heartbeat()
+        self.logger.info("Step 2: Updating fact table...")
+        results['fact_orders'] = self._run_task(
+            'fact_orders', tasks.update_fact_orders,
+            start_date=start_date,
+            end_date=end_date,
+            prerequisite_result=results['dim_date'],
+            **self.task_options
+        )
+        if not results['fact_orders'].get('success', False):
+            raise Exception("Failed to update FactOrders")
+        if 'batches' in results['fact_orders']:
+            fact_load = results['fact_orders']
+            resumed = fact_load['resumed_from_order_id']
+            self.logger.info(
+                f"Inserted {fact_load['rows_inserted']} FactOrders rows in {fact_load['batches']} batches"
+                + (f" (resumed after OrderID {resumed})" if resumed is not None else "")
+            )
+        
+        # Step 3: Update fact error table (depends on fact table update)
+        if heartbeat is not None:
+            heartbeat()
+        self.logger.info("Step 3: Updating fact error table...")
+        results['fact_orders_error'] = self._run_task(
+            'fact_orders_error', tasks.update_fact_orders_error,
+            start_date=start_date,
+            end_date=end_date,
+            prerequisite_result=results['fact_orders'],
+            **self.task_options
+        )
+        if not results['fact_orders_error'].get('success', False):
+            raise Exception("Failed to update FactOrders_Error")
+        
+        # Step 4: Refresh dashboard aggregates for the load window (depends on fact table update)
+        if heartbeat is not None:
+            heartbeat()
+        self.logger.info("Step 4: Updating dashboard aggregate tables...")
+        results['agg_sales'] = self._run_task(
+            'agg_sales', tasks.update_agg_sales,
+            start_date=start_date,
+            end_date=end_date,
+            prerequisite_result=results['fact_orders_error'],
+            **self.task_options
+        )
+        if not results['agg_sales'].get('success', False):
+            raise Exception("Failed to update aggregate tables")
+    
+    def _run_task(self, name: str, task: Callable, *args, **kwargs) -> Dict:
+        """
+        Call a task, profiling it under the given name in profile mode.
+        
+        Args:
+            name: Task name used in the profile bundle
+            task: Task function
+            *args, **kwargs: Task arguments
+            
+        Returns:
+            dict: Task result
+        """
+        if self.profiler is None:
+            return task(*args, **kwargs)
+        with self.profiler.profile_task(name):
+            return task(*args, **kwargs)
+    
+    def _write_profile(self) -> None:
+        """Write the profile bundle of the run (profile mode only)."""
+        if self.profiler is None:
+            return
+        try:
+            bundle_dir = self.profiler.write_bundle()
+            self.logger.info(f"Profile written to {bundle_dir} (see summary.txt)")
+        except Exception as e:
+            self.logger.warning(f"Failed to write profile: {str(e)}")
+    
+    def _maintain_tables(self, results: Dict, result_key: str, tables: List[str]) -> None:
+        """
+        Run index/statistics maintenance on the given tables and log the time each action took.
+        Failures are logged as warnings only, since the data itself is already loaded.
+        
+        Args:
+            results: Dictionary collecting task results (updated in place)
+            result_key: Key under which the task result is stored
+            tables: Table names to maintain
+        """
+        started = time.perf_counter()
+        results[result_key] = self._run_task(result_key, tasks.maintain_tables, tables, **self.task_options)
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        
+        if not results[result_key].get('success', False):
+            self.logger.warning(f"Table maintenance failed: {results[result_key].get('error', 'Unknown error')}")
+            return
+        
+        for action in results[result_key]['actions']:
+            target = action['table_name'] if action['object_name'] is None else f"{action['table_name']}.{action['object_name']}"
+            metric = 'rows changed' if action['action'] == 'UPDATE STATISTICS' else '% fragmentation'
+            self.logger.info(f"{action['action']} {target} ({action['metric']} {metric}) took {action['duration_ms']} ms")
+        self.logger.info(f"Maintenance: {len(results[result_key]['actions'])} action(s) in {elapsed_ms} ms")
+    
+    def _retry_summary(self, results: Dict) -> Dict:
+        """
+        Total the transient-error retries of all tasks (including nested window results) and log them.
+        
+        Args:
+            results: Dictionary of task results
+            
+        Returns:
+            dict: {'retries': n, 'retry_seconds': s, 'retries_by_task': {task: n}}
+        """
+        retries_by_task = {}
+        retry_seconds = 0.0
+        
+        def collect(task_results: Dict, prefix: str) -> None:
+            nonlocal retry_seconds
+            for key, value in task_results.items():
+                if not isinstance(value, dict):
+                    continue
+                if 'retries' in value:
+                    if value['retries']:
+                        retries_by_task[f"{prefix}{key}"] = value['retries']
+                    retry_seconds += value.get('retry_seconds', 0)
+                else:
+                    collect(value, f"{prefix}{key}.")
+        
+        collect(results, '')
+        retries = sum(retries_by_task.values())
+        if retries:
+            per_task = ', '.join(f"{task}: {count}" for task, count in retries_by_task.items())
+            self.logger.info(f"SQL retries: {retries} ({retry_seconds:.1f}s lost to retries) - {per_task}")
+        return {'retries': retries, 'retry_seconds': round(retry_seconds, 3), 'retries_by_task': retries_by_task}
+
+
+def run_target(
+    target: str,
+    start_date: str,
+    end_date: str,
+    maintenance: bool = MAINTENANCE_ENABLED,
+    config_file_path: str = "sql_server_config.cfg",
+    connection_limits: Optional[Dict] = None,
+    profile: bool = False
+) -> Dict:
+    """
+    Run the pipeline against one named target. Used as the worker of multi-target runs,
+    each target getting its own process, log file and execution_id.
+    
+    Args:
+        target: Target name from the config file ('default' for [DATABASE])
+        start_date: Start date for fact table ingestion (YYYY-MM-DD)
+        end_date: End date for fact table ingestion (YYYY-MM-DD)
+        maintenance: Run the statistics / index maintenance steps
+        config_file_path: Path to database configuration file
+        connection_limits: Semaphore per target capping concurrent connections
+        profile: Write a profile bundle for the target's run
+        
+    Returns:
+        dict: Summary with target, database, success, execution_id, error, retries and duration
+    """
+    started = time.perf_counter()
+    summary = {'target': target, 'database': None, 'success': False, 'execution_id': None, 'error': None,
+               'retries': 0, 'retry_seconds': 0.0}
+    try:
+        if connection_limits is not None:
+            tasks.set_connection_limits(connection_limits)
+        
+        if target == 'default':
+            database_name = DATABASE_NAME
+        else:
+            database_name = parse_database_config(config_file_path, target)['database']
+        summary['database'] = database_name
+        
+        flow = DimensionalDataFlow(
+            log_file_path=f"logs/logs_dimensional_data_pipeline_{target}.txt",
+            target=None if target == 'default' else target,
+            database_name=database_name,
+            config_file_path=config_file_path,
+            profile=profile
+        )
+        result = flow.exec(start_date, end_date, maintenance=maintenance)
+        summary.update({
+            'success': result.get('success', False),
+            'execution_id': result.get('execution_id'),
+            'error': result.get('error'),
+            'retries': result.get('retries', 0),
+            'retry_seconds': result.get('retry_seconds', 0.0)
+        })
+    except Exception as e:
+        summary['error'] = str(e)
+    
+    summary['duration_seconds'] = round(time.perf_counter() - started, 1)
+    return summary
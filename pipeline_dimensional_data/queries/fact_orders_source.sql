@@ -0,0 +1,59 @@
+-- Shared FactOrders source query, substituted for {fact_orders_source} by tasks.update_fact_orders
+-- Used by update_fact.sql, update_fact_bulk.sql, update_fact_batched.sql and update_fact_partition_switch.sql.
+-- The including script declares @sor_orderdetails_sk and appends its own window predicates (AND ...)
+-- after the WHERE clause below.
+SELECT
+    o.OrderID,
+    CAST(o.OrderDate AS DATE) AS OrderDate,
+    CAST(o.RequiredDate AS DATE) AS RequiredDate,
+    CAST(o.ShippedDate AS DATE) AS ShippedDate,
+    -- Integer DimDate keys (YYYYMMDD)
+    CONVERT(INT, CONVERT(CHAR(8), o.OrderDate, 112)) AS OrderDateKey,
+    CONVERT(INT, CONVERT(CHAR(8), o.RequiredDate, 112)) AS RequiredDateKey,
+    CONVERT(INT, CONVERT(CHAR(8), o.ShippedDate, 112)) AS ShippedDateKey,
+    o.Freight,
+    -- Dimension surrogate keys
+    dc.Customer_SK,
+    de.Employee_SK,
+    ds.Shipper_SK,
+    dt.Territory_SK,
+    dr.Region_SK,
+    dp.Product_SK,
+    dc2.Category_SK,
+    dsup.Supplier_SK,
+    -- Order detail measures
+    od.Quantity,
+    od.UnitPrice,
+    od.Discount,
+    -- SOR tracking (using order details since that's the grain of the fact table)
+    @sor_orderdetails_sk AS SOR_SK,
+    od.staging_raw_id_sk AS staging_raw_id_nk
+FROM {schema_name}.stg_Orders_raw AS o
+INNER JOIN {schema_name}.stg_OrderDetails_raw AS od
+    ON o.OrderID = od.OrderID
+-- Join with dimensions (using current records where applicable)
+LEFT JOIN {schema_name}.DimCustomers AS dc
+    ON o.CustomerID = dc.CustomerID AND dc.IsCurrent = 1
+LEFT JOIN {schema_name}.DimEmployees AS de
+    ON o.EmployeeID = de.EmployeeID AND de.IsDeleted = 0
+LEFT JOIN {schema_name}.DimShippers AS ds
+    ON o.ShipVia = ds.ShipperID AND ds.IsDeleted = 0
+LEFT JOIN {schema_name}.DimTerritories AS dt
+    ON o.TerritoryID = dt.TerritoryID
+LEFT JOIN {schema_name}.DimRegion AS dr
+    ON dt.RegionID = dr.RegionID
+LEFT JOIN {schema_name}.DimProducts AS dp
+    ON od.ProductID = dp.ProductID AND dp.IsCurrent = 1 AND dp.IsDeleted = 0
+LEFT JOIN {schema_name}.DimCategories AS dc2
+    ON dp.CategoryID = dc2.CategoryID
+LEFT JOIN {schema_name}.DimSuppliers AS dsup
+    ON dp.SupplierID = dsup.SupplierID
+-- Only rows where all required dimension keys are found
+WHERE dc.Customer_SK IS NOT NULL
+  AND de.Employee_SK IS NOT NULL
+  AND ds.Shipper_SK IS NOT NULL
+  AND dt.Territory_SK IS NOT NULL
+  AND dr.Region_SK IS NOT NULL
+  AND dp.Product_SK IS NOT NULL
+  AND dc2.Category_SK IS NOT NULL
+  AND dsup.Supplier_SK IS NOT NULL
@@ -0,0 +1,109 @@
+-- Post-load maintenance: index health and statistics refresh
+-- Parameters: @database_name, @schema_name, @table_values, @stats_changed_pct, @stats_changed_rows,
+--             @reorganize_pct, @rebuild_pct, @min_pages
+-- Returns one row per action taken (table_name, action, object_name, metric, duration_ms)
+
+USE {database_name};
+GO
+
+SET NOCOUNT ON;
+
+DECLARE @stats_changed_pct DECIMAL(9,2) = {stats_changed_pct};
+DECLARE @stats_changed_rows BIGINT = {stats_changed_rows};
+DECLARE @reorganize_pct FLOAT = {reorganize_pct};
+DECLARE @rebuild_pct FLOAT = {rebuild_pct};
+DECLARE @min_pages BIGINT = {min_pages};
+
+DECLARE @tables TABLE (TableName SYSNAME PRIMARY KEY, ObjectId INT NULL);
+INSERT INTO @tables (TableName) VALUES {table_values};
+
+UPDATE @tables SET ObjectId = OBJECT_ID('{schema_name}.' + TableName);
+DELETE FROM @tables WHERE ObjectId IS NULL;
+
+DECLARE @actions TABLE (
+    ActionId INT IDENTITY(1,1),
+    TableName SYSNAME,
+    ActionName VARCHAR(20),
+    ObjectName SYSNAME NULL,
+    Metric DECIMAL(19,2),
+    DurationMs INT
+);
+
+DECLARE @table_name SYSNAME;
+DECLARE @index_name SYSNAME;
+DECLARE @metric DECIMAL(19,2);
+DECLARE @action VARCHAR(20);
+DECLARE @sql NVARCHAR(MAX);
+DECLARE @started DATETIME2;
+
+-- Index health: rowstore indexes above the fragmentation thresholds
+-- (columnstore indexes are skipped; partitions are rolled up to the index)
+DECLARE index_cursor CURSOR LOCAL FAST_FORWARD FOR
+    SELECT
+        t.TableName,
+        i.name,
+        MAX(ips.avg_fragmentation_in_percent),
+        CASE WHEN MAX(ips.avg_fragmentation_in_percent) >= @rebuild_pct THEN 'REBUILD' ELSE 'REORGANIZE' END
+    FROM @tables AS t
+    CROSS APPLY sys.dm_db_index_physical_stats(DB_ID(), t.ObjectId, NULL, NULL, 'LIMITED') AS ips
+    INNER JOIN sys.indexes AS i
+        ON i.object_id = ips.object_id AND i.index_id = ips.index_id
+    WHERE i.type IN (1, 2)
+      AND ips.alloc_unit_type_desc = 'IN_ROW_DATA'
+    GROUP BY t.TableName, i.name
+    HAVING SUM(ips.page_count) >= @min_pages
+       AND MAX(ips.avg_fragmentation_in_percent) >= @reorganize_pct;
+
+OPEN index_cursor;
+FETCH NEXT FROM index_cursor INTO @table_name, @index_name, @metric, @action;
+WHILE @@FETCH_STATUS = 0
+BEGIN
+    SET @sql = N'ALTER INDEX ' + QUOTENAME(@index_name) + N' ON {schema_name}.' + QUOTENAME(@table_name) + N' ' + @action;
+    SET @started = SYSDATETIME();
+    EXEC sp_executesql @sql;
+    INSERT INTO @actions (TableName, ActionName, ObjectName, Metric, DurationMs)
+    VALUES (@table_name, @action, @index_name, @metric, DATEDIFF(MILLISECOND, @started, SYSDATETIME()));
+
+    FETCH NEXT FROM index_cursor INTO @table_name, @index_name, @metric, @action;
+END;
+CLOSE index_cursor;
+DEALLOCATE index_cursor;
+
+-- Statistics: tables whose rows changed since the last statistics update crossed a threshold
+-- (evaluated after index maintenance, since a rebuild already refreshes that index's statistics)
+DECLARE stats_cursor CURSOR LOCAL FAST_FORWARD FOR
+    SELECT t.TableName, MAX(sp.modification_counter)
+    FROM @tables AS t
+    INNER JOIN sys.stats AS s
+        ON s.object_id = t.ObjectId
+    CROSS APPLY sys.dm_db_stats_properties(s.object_id, s.stats_id) AS sp
+    GROUP BY t.TableName
+    HAVING MAX(sp.modification_counter) > 0
+       AND (
+           MAX(sp.modification_counter) >= @stats_changed_rows
+           OR MAX(sp.modification_counter) * 100.0 / NULLIF(MAX(sp.rows), 0) >= @stats_changed_pct
+       );
+
+OPEN stats_cursor;
+FETCH NEXT FROM stats_cursor INTO @table_name, @metric;
+WHILE @@FETCH_STATUS = 0
+BEGIN
+    SET @sql = N'UPDATE STATISTICS {schema_name}.' + QUOTENAME(@table_name);
+    SET @started = SYSDATETIME();
+    EXEC sp_executesql @sql;
+    INSERT INTO @actions (TableName, ActionName, ObjectName, Metric, DurationMs)
+    VALUES (@table_name, 'UPDATE STATISTICS', NULL, @metric, DATEDIFF(MILLISECOND, @started, SYSDATETIME()));
+
+    FETCH NEXT FROM stats_cursor INTO @table_name, @metric;
+END;
+CLOSE stats_cursor;
+DEALLOCATE stats_cursor;
+
+SELECT
+    TableName AS table_name,
+    ActionName AS action,
+    ObjectName AS object_name,
+    Metric AS metric,
+    DurationMs AS duration_ms
+FROM @actions
+ORDER BY ActionId;
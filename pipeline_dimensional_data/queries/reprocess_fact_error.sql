@@ -0,0 +1,137 @@
+-- Reprocess FactOrders_Error rows whose missing dimension members have arrived since
+-- Parameters: @database_name, @schema_name, @fact_table_name, @fact_error_table_name
+
+USE {database_name};
+GO
+
+SET NOCOUNT ON;
+SET XACT_ABORT ON;
+
+DECLARE @sor_orderdetails_sk INT;
+SELECT @sor_orderdetails_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = 'stg_OrderDetails_raw';
+
+DECLARE @resolved_at DATETIME2 = SYSUTCDATETIME();
+DECLARE @inserted_rows INT;
+DECLARE @resolved_rows INT;
+DECLARE @inserted_dates TABLE (OrderDate DATE NOT NULL);
+
+-- Dropped first so a retried run of this batch in the same session can recreate it
+IF OBJECT_ID('tempdb..#resolvable') IS NOT NULL DROP TABLE #resolvable;
+
+-- Only unresolved error rows are considered (one per order line), so the work scales with the error
+-- backlog: the staging joins seek IX_stg_Orders_raw_OrderID / IX_stg_OrderDetails_raw_OrderID_ProductID.
+-- A row is resolvable once every dimension key (and its DimDate keys) can be found.
+SELECT
+    o.OrderID,
+    od.ProductID,
+    CAST(o.OrderDate AS DATE) AS OrderDate,
+    CAST(o.RequiredDate AS DATE) AS RequiredDate,
+    CAST(o.ShippedDate AS DATE) AS ShippedDate,
+    CONVERT(INT, CONVERT(CHAR(8), o.OrderDate, 112)) AS OrderDateKey,
+    CONVERT(INT, CONVERT(CHAR(8), o.RequiredDate, 112)) AS RequiredDateKey,
+    CONVERT(INT, CONVERT(CHAR(8), o.ShippedDate, 112)) AS ShippedDateKey,
+    o.Freight,
+    dc.Customer_SK,
+    de.Employee_SK,
+    ds.Shipper_SK,
+    dt.Territory_SK,
+    dr.Region_SK,
+    dp.Product_SK,
+    dc2.Category_SK,
+    dsup.Supplier_SK,
+    od.Quantity,
+    od.UnitPrice,
+    od.Discount,
+    od.staging_raw_id_sk
+INTO #resolvable
+FROM (
+    SELECT
+        OrderID,
+        ProductID,
+        ROW_NUMBER() OVER (PARTITION BY OrderID, ProductID ORDER BY ErrorFact_SK DESC) AS rn
+    FROM {schema_name}.{fact_error_table_name}
+    WHERE IsResolved = 0
+) AS e
+INNER JOIN {schema_name}.stg_Orders_raw AS o
+    ON o.OrderID = e.OrderID
+INNER JOIN {schema_name}.stg_OrderDetails_raw AS od
+    ON od.OrderID = e.OrderID AND od.ProductID = e.ProductID
+INNER JOIN {schema_name}.DimCustomers AS dc
+    ON o.CustomerID = dc.CustomerID AND dc.IsCurrent = 1
+INNER JOIN {schema_name}.DimEmployees AS de
+    ON o.EmployeeID = de.EmployeeID AND de.IsDeleted = 0
+INNER JOIN {schema_name}.DimShippers AS ds
+    ON o.ShipVia = ds.ShipperID AND ds.IsDeleted = 0
+INNER JOIN {schema_name}.DimTerritories AS dt
+    ON o.TerritoryID = dt.TerritoryID
+INNER JOIN {schema_name}.DimRegion AS dr
+    ON dt.RegionID = dr.RegionID
+INNER JOIN {schema_name}.DimProducts AS dp
+    ON od.ProductID = dp.ProductID AND dp.IsCurrent = 1 AND dp.IsDeleted = 0
+INNER JOIN {schema_name}.DimCategories AS dc2
+    ON dp.CategoryID = dc2.CategoryID
+INNER JOIN {schema_name}.DimSuppliers AS dsup
+    ON dp.SupplierID = dsup.SupplierID
+INNER JOIN {schema_name}.DimDate AS dd
+    ON dd.DateKey = CONVERT(INT, CONVERT(CHAR(8), o.OrderDate, 112))
+WHERE e.rn = 1
+  AND (o.RequiredDate IS NULL OR EXISTS (
+      SELECT 1 FROM {schema_name}.DimDate WHERE DateKey = CONVERT(INT, CONVERT(CHAR(8), o.RequiredDate, 112))
+  ))
+  AND (o.ShippedDate IS NULL OR EXISTS (
+      SELECT 1 FROM {schema_name}.DimDate WHERE DateKey = CONVERT(INT, CONVERT(CHAR(8), o.ShippedDate, 112))
+  ));
+
+BEGIN TRANSACTION;
+
+-- Move resolvable rows into the fact table (skipping order lines a full re-run has already loaded;
+-- the probe seeks IX_FactOrders_OrderID_Product)
+INSERT INTO {schema_name}.{fact_table_name} (
+    OrderID, OrderDate, RequiredDate, ShippedDate,
+    OrderDateKey, RequiredDateKey, ShippedDateKey, Freight,
+    Customer_SK, Employee_SK, Shipper_SK, Territory_SK, Region_SK,
+    Product_SK, Category_SK, Supplier_SK,
+    Quantity, UnitPrice, Discount,
+    SOR_SK, staging_raw_id_nk
+)
+OUTPUT inserted.OrderDate INTO @inserted_dates (OrderDate)
+SELECT
+    r.OrderID, r.OrderDate, r.RequiredDate, r.ShippedDate,
+    r.OrderDateKey, r.RequiredDateKey, r.ShippedDateKey, r.Freight,
+    r.Customer_SK, r.Employee_SK, r.Shipper_SK, r.Territory_SK, r.Region_SK,
+    r.Product_SK, r.Category_SK, r.Supplier_SK,
+    r.Quantity, r.UnitPrice, r.Discount,
+    @sor_orderdetails_sk, r.staging_raw_id_sk
+FROM #resolvable AS r
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM {schema_name}.{fact_table_name} AS f
+    INNER JOIN {schema_name}.DimProducts AS p ON p.Product_SK = f.Product_SK
+    WHERE f.OrderID = r.OrderID AND p.ProductID = r.ProductID
+);
+
+SET @inserted_rows = @@ROWCOUNT;
+
+-- Mark every error row of the resolved order lines
+UPDATE e
+SET IsResolved = 1,
+    ResolvedAt = @resolved_at
+FROM {schema_name}.{fact_error_table_name} AS e
+INNER JOIN #resolvable AS r
+    ON e.OrderID = r.OrderID AND e.ProductID = r.ProductID
+WHERE e.IsResolved = 0;
+
+SET @resolved_rows = @@ROWCOUNT;
+
+COMMIT TRANSACTION;
+
+-- Report the fact rows inserted (the aggregates of their order dates need a refresh) separately from
+-- the error rows marked resolved, which include order lines that were already in FactOrders
+SELECT
+    @inserted_rows AS inserted_rows,
+    @resolved_rows AS resolved_rows,
+    CONVERT(CHAR(10), MIN(OrderDate), 23) AS min_order_date,
+    CONVERT(CHAR(10), MAX(OrderDate), 23) AS max_order_date
+FROM @inserted_dates;
+
+DROP TABLE #resolvable;
@@ -0,0 +1,75 @@
+-- Update dashboard aggregate tables for the load window
+-- Parameters: @database_name, @schema_name, @fact_table_name, @agg_daily_table_name, @agg_monthly_table_name, @start_date, @end_date
+
+USE {database_name};
+GO
+
+SET XACT_ABORT ON;
+
+DECLARE @window_start DATE = '{start_date}';
+DECLARE @window_end DATE = '{end_date}';
+
+-- Monthly aggregates are rebuilt for every month the window touches
+DECLARE @month_start DATE = DATEFROMPARTS(YEAR(@window_start), MONTH(@window_start), 1);
+DECLARE @month_end DATE = EOMONTH(@window_end);
+
+-- FactOrders is filtered on its integer DimDate key (YYYYMMDD)
+DECLARE @window_start_key INT = CONVERT(INT, CONVERT(CHAR(8), @window_start, 112));
+DECLARE @window_end_key INT = CONVERT(INT, CONVERT(CHAR(8), @window_end, 112));
+DECLARE @month_start_key INT = CONVERT(INT, CONVERT(CHAR(8), @month_start, 112));
+DECLARE @month_end_key INT = CONVERT(INT, CONVERT(CHAR(8), @month_end, 112));
+
+BEGIN TRANSACTION;
+
+-- Daily sales by product and customer country: replace only the days of the window
+DELETE FROM {schema_name}.{agg_daily_table_name}
+WHERE OrderDate >= @window_start
+  AND OrderDate <= @window_end;
+
+INSERT INTO {schema_name}.{agg_daily_table_name} (
+    OrderDate, Product_SK, CustomerCountry,
+    OrderCount, OrderLineCount, Quantity, GrossSales, NetSales
+)
+SELECT
+    f.OrderDate,
+    f.Product_SK,
+    ISNULL(dc.Country, 'Unknown') AS CustomerCountry,
+    COUNT(DISTINCT f.OrderID) AS OrderCount,
+    COUNT(*) AS OrderLineCount,
+    SUM(ISNULL(f.Quantity, 0)) AS Quantity,
+    SUM(ISNULL(f.Quantity, 0) * ISNULL(f.UnitPrice, 0)) AS GrossSales,
+    SUM(ISNULL(f.Quantity, 0) * ISNULL(f.UnitPrice, 0) * (1 - ISNULL(f.Discount, 0))) AS NetSales
+FROM {schema_name}.{fact_table_name} AS f
+INNER JOIN {schema_name}.DimCustomers AS dc
+    ON f.Customer_SK = dc.Customer_SK
+WHERE f.OrderDateKey >= @window_start_key
+  AND f.OrderDateKey <= @window_end_key
+  AND f.Product_SK IS NOT NULL
+GROUP BY f.OrderDate, f.Product_SK, ISNULL(dc.Country, 'Unknown');
+
+-- Monthly sales by employee and shipper: replace the touched months as a whole
+DELETE FROM {schema_name}.{agg_monthly_table_name}
+WHERE MonthStartDate >= @month_start
+  AND MonthStartDate <= @month_end;
+
+INSERT INTO {schema_name}.{agg_monthly_table_name} (
+    MonthStartDate, Employee_SK, Shipper_SK,
+    OrderCount, OrderLineCount, Quantity, GrossSales, NetSales
+)
+SELECT
+    DATEFROMPARTS(YEAR(f.OrderDate), MONTH(f.OrderDate), 1) AS MonthStartDate,
+    f.Employee_SK,
+    f.Shipper_SK,
+    COUNT(DISTINCT f.OrderID) AS OrderCount,
+    COUNT(*) AS OrderLineCount,
+    SUM(ISNULL(f.Quantity, 0)) AS Quantity,
+    SUM(ISNULL(f.Quantity, 0) * ISNULL(f.UnitPrice, 0)) AS GrossSales,
+    SUM(ISNULL(f.Quantity, 0) * ISNULL(f.UnitPrice, 0) * (1 - ISNULL(f.Discount, 0))) AS NetSales
+FROM {schema_name}.{fact_table_name} AS f
+WHERE f.OrderDateKey >= @month_start_key
+  AND f.OrderDateKey <= @month_end_key
+  AND f.Employee_SK IS NOT NULL
+  AND f.Shipper_SK IS NOT NULL
+GROUP BY DATEFROMPARTS(YEAR(f.OrderDate), MONTH(f.OrderDate), 1), f.Employee_SK, f.Shipper_SK;
+
+COMMIT TRANSACTION;
@@ -4,11 +4,33 @@
 USE {database_name};
 GO
 
+SET XACT_ABORT ON;
+
 DECLARE @sor_sk INT;
 SELECT @sor_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = '{staging_table_name}';
 
 DECLARE @current_date DATE = CAST(GETDATE() AS DATE);
 
+-- Rows closed by the MERGE, captured with the staging values of their new version
+DECLARE @changes TABLE (
+    MergeAction NVARCHAR(10) NOT NULL,
+    CustomerID NVARCHAR(10) NOT NULL,
+    CompanyName NVARCHAR(255),
+    ContactName NVARCHAR(255),
+    ContactTitle NVARCHAR(255),
+    Address NVARCHAR(255),
+    City NVARCHAR(255),
+    Region NVARCHAR(255),
+    PostalCode NVARCHAR(20),
+    Country NVARCHAR(255),
+    Phone NVARCHAR(50),
+    Fax NVARCHAR(50),
+    staging_raw_id_sk INT NOT NULL
+);
+
+-- The MERGE and the insert of new versions commit together, so a failed run can simply be re-run
+BEGIN TRANSACTION;
+
 -- SCD2: Close existing current records that have changed, insert new current records
 MERGE {schema_name}.{dim_table_name} AS target
 USING (
@@ -54,42 +76,38 @@ WHEN NOT MATCHED THEN
         source.CustomerID, source.CompanyName, source.ContactName, source.ContactTitle,
         source.Address, source.City, source.Region, source.PostalCode, source.Country,
         source.Phone, source.Fax, @current_date, NULL, 1, @sor_sk, source.staging_raw_id_sk
-    );
+    )
+OUTPUT
+    $action,
+    source.CustomerID, source.CompanyName, source.ContactName, source.ContactTitle,
+    source.Address, source.City, source.Region, source.PostalCode, source.Country,
+    source.Phone, source.Fax, source.staging_raw_id_sk
+INTO @changes;
 
--- Insert new current records for changed customers
+-- Insert new current records for changed customers (from the captured changes, no second scan)
 INSERT INTO {schema_name}.{dim_table_name} (
     CustomerID, CompanyName, ContactName, ContactTitle, Address, City,
     Region, PostalCode, Country, Phone, Fax,
     EffectiveStartDate, EffectiveEndDate, IsCurrent, SOR_SK, staging_raw_id_nk
 )
 SELECT 
-    source.CustomerID,
-    source.CompanyName,
-    source.ContactName,
-    source.ContactTitle,
-    source.Address,
-    source.City,
-    source.Region,
-    source.PostalCode,
-    source.Country,
-    source.Phone,
-    source.Fax,
+    changes.CustomerID,
+    changes.CompanyName,
+    changes.ContactName,
+    changes.ContactTitle,
+    changes.Address,
+    changes.City,
+    changes.Region,
+    changes.PostalCode,
+    changes.Country,
+    changes.Phone,
+    changes.Fax,
     @current_date AS EffectiveStartDate,
     NULL AS EffectiveEndDate,
     1 AS IsCurrent,
     @sor_sk AS SOR_SK,
-    source.staging_raw_id_sk
-FROM {schema_name}.{staging_table_name} AS source
-WHERE EXISTS (
-    SELECT 1
-    FROM {schema_name}.{dim_table_name} AS target
-    WHERE target.CustomerID = source.CustomerID
-    AND target.IsCurrent = 0
-    AND target.EffectiveEndDate = DATEADD(DAY, -1, @current_date)
-)
-AND NOT EXISTS (
-    SELECT 1
-    FROM {schema_name}.{dim_table_name} AS target
-    WHERE target.CustomerID = source.CustomerID
-    AND target.IsCurrent = 1
-);
+    changes.staging_raw_id_sk
+FROM @changes AS changes
+WHERE changes.MergeAction = 'UPDATE';
+
+COMMIT TRANSACTION;
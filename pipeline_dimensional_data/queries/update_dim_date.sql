@@ -0,0 +1,97 @@
+-- Update DimDate (generated calendar)
+-- Parameters: @database_name, @schema_name, @dim_table_name, @start_date, @end_date,
+--             @fiscal_year_start_month, @holiday_inserts
+
+USE {database_name};
+GO
+
+DECLARE @fiscal_year_start_month INT = {fiscal_year_start_month};
+
+-- Cover the load window plus every order/required/shipped date of the orders in it,
+-- so all fact date keys resolve
+DECLARE @calendar_start DATE = '{start_date}';
+DECLARE @calendar_end DATE = '{end_date}';
+
+SELECT
+    @calendar_start = CASE WHEN MIN(d.DateValue) < @calendar_start THEN MIN(d.DateValue) ELSE @calendar_start END,
+    @calendar_end = CASE WHEN MAX(d.DateValue) > @calendar_end THEN MAX(d.DateValue) ELSE @calendar_end END
+FROM {schema_name}.stg_Orders_raw AS o
+CROSS APPLY (VALUES
+    (CAST(o.OrderDate AS DATE)),
+    (CAST(o.RequiredDate AS DATE)),
+    (CAST(o.ShippedDate AS DATE))
+) AS d(DateValue)
+WHERE o.OrderDate >= '{start_date}'
+  AND o.OrderDate < DATEADD(DAY, 1, CAST('{end_date}' AS DATE))
+  AND d.DateValue IS NOT NULL;
+
+-- Holidays: 'MM-DD' recurs every year, 'YYYY-MM-DD' is a single date
+DECLARE @holidays TABLE (HolidayDate VARCHAR(10) PRIMARY KEY, HolidayName NVARCHAR(100) NOT NULL);
+{holiday_inserts}
+
+WITH calendar AS (
+    SELECT @calendar_start AS FullDate
+    UNION ALL
+    SELECT DATEADD(DAY, 1, FullDate) FROM calendar WHERE FullDate < @calendar_end
+),
+source AS (
+    SELECT
+        CONVERT(INT, CONVERT(CHAR(8), c.FullDate, 112)) AS DateKey,
+        c.FullDate,
+        DAY(c.FullDate) AS DayOfMonth,
+        (DATEDIFF(DAY, '19000101', c.FullDate) % 7) + 1 AS DayOfWeek,
+        DATENAME(WEEKDAY, c.FullDate) AS DayName,
+        DATEPART(DAYOFYEAR, c.FullDate) AS DayOfYear,
+        DATEPART(ISO_WEEK, c.FullDate) AS WeekOfYear,
+        MONTH(c.FullDate) AS MonthNumber,
+        DATENAME(MONTH, c.FullDate) AS MonthName,
+        DATEPART(QUARTER, c.FullDate) AS QuarterNumber,
+        YEAR(c.FullDate) AS YearNumber,
+        CONVERT(CHAR(7), c.FullDate, 23) AS YearMonth,
+        CASE WHEN (DATEDIFF(DAY, '19000101', c.FullDate) % 7) + 1 IN (6, 7) THEN 1 ELSE 0 END AS IsWeekend,
+        -- Fiscal year is named after the calendar year in which it ends
+        YEAR(c.FullDate) + CASE WHEN @fiscal_year_start_month > 1 AND MONTH(c.FullDate) >= @fiscal_year_start_month THEN 1 ELSE 0 END AS FiscalYear,
+        ((MONTH(c.FullDate) - @fiscal_year_start_month + 12) % 12) / 3 + 1 AS FiscalQuarter,
+        ((MONTH(c.FullDate) - @fiscal_year_start_month + 12) % 12) + 1 AS FiscalMonth,
+        h.HolidayName
+    FROM calendar AS c
+    OUTER APPLY (
+        SELECT TOP 1 hd.HolidayName
+        FROM @holidays AS hd
+        WHERE hd.HolidayDate = CONVERT(CHAR(10), c.FullDate, 23)
+           OR hd.HolidayDate = RIGHT(CONVERT(CHAR(10), c.FullDate, 23), 5)
+        ORDER BY LEN(hd.HolidayDate) DESC
+    ) AS h
+)
+-- HOLDLOCK keeps the key range locked from the match to the insert: distributed workers build
+-- overlapping calendars (each runs past its window to the latest required/shipped date), and
+-- without it two of them can both miss a date and fail the second insert with a PK violation
+MERGE {schema_name}.{dim_table_name} WITH (HOLDLOCK) AS target
+USING source
+ON target.DateKey = source.DateKey
+WHEN MATCHED AND (
+    target.FiscalYear <> source.FiscalYear OR
+    target.FiscalMonth <> source.FiscalMonth OR
+    ISNULL(target.HolidayName, '') <> ISNULL(source.HolidayName, '')
+) THEN
+    UPDATE SET
+        FiscalYear = source.FiscalYear,
+        FiscalQuarter = source.FiscalQuarter,
+        FiscalMonth = source.FiscalMonth,
+        IsHoliday = CASE WHEN source.HolidayName IS NULL THEN 0 ELSE 1 END,
+        HolidayName = source.HolidayName,
+        UpdatedAt = SYSUTCDATETIME()
+WHEN NOT MATCHED THEN
+    INSERT (
+        DateKey, FullDate, DayOfMonth, DayOfWeek, DayName, DayOfYear, WeekOfYear,
+        MonthNumber, MonthName, QuarterNumber, YearNumber, YearMonth, IsWeekend,
+        FiscalYear, FiscalQuarter, FiscalMonth, IsHoliday, HolidayName
+    )
+    VALUES (
+        source.DateKey, source.FullDate, source.DayOfMonth, source.DayOfWeek, source.DayName,
+        source.DayOfYear, source.WeekOfYear, source.MonthNumber, source.MonthName,
+        source.QuarterNumber, source.YearNumber, source.YearMonth, source.IsWeekend,
+        source.FiscalYear, source.FiscalQuarter, source.FiscalMonth,
+        CASE WHEN source.HolidayName IS NULL THEN 0 ELSE 1 END, source.HolidayName
+    )
+OPTION (MAXRECURSION 0);
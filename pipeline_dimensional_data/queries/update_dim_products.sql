@@ -4,11 +4,33 @@
 USE {database_name};
 GO
 
+SET XACT_ABORT ON;
+
 DECLARE @sor_sk INT;
 SELECT @sor_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = '{staging_table_name}';
 
 DECLARE @current_date DATE = CAST(GETDATE() AS DATE);
 
+-- Rows closed by the MERGE, captured with the staging values of their new version
+DECLARE @changes TABLE (
+    MergeAction NVARCHAR(10) NOT NULL,
+    ClosedAsDeleted BIT NOT NULL,
+    ProductID INT NULL,
+    ProductName NVARCHAR(255),
+    SupplierID INT,
+    CategoryID INT,
+    QuantityPerUnit NVARCHAR(255),
+    UnitPrice DECIMAL(18,2),
+    UnitsInStock SMALLINT,
+    UnitsOnOrder SMALLINT,
+    ReorderLevel SMALLINT,
+    Discontinued BIT,
+    staging_raw_id_sk INT NULL
+);
+
+-- The MERGE and the insert of new versions commit together, so a failed run can simply be re-run
+BEGIN TRANSACTION;
+
 -- SCD2 with delete closing: Close existing current records that have changed or are deleted, insert new current records
 MERGE {schema_name}.{dim_table_name} AS target
 USING (
@@ -52,55 +74,47 @@ WHEN NOT MATCHED THEN
         source.ProductID, source.ProductName, source.SupplierID, source.CategoryID,
         source.QuantityPerUnit, source.UnitPrice, source.UnitsInStock, source.UnitsOnOrder,
         source.ReorderLevel, source.Discontinued, @current_date, NULL, 1, 0, @sor_sk, source.staging_raw_id_sk
-    );
+    )
+-- Close current records for products that no longer exist in staging (delete closing)
+WHEN NOT MATCHED BY SOURCE AND target.IsCurrent = 1 AND target.IsDeleted = 0 THEN
+    UPDATE SET
+        EffectiveEndDate = DATEADD(DAY, -1, @current_date),
+        IsCurrent = 0,
+        IsDeleted = 1,
+        UpdatedAt = SYSUTCDATETIME()
+OUTPUT
+    $action,
+    inserted.IsDeleted,
+    source.ProductID, source.ProductName, source.SupplierID, source.CategoryID,
+    source.QuantityPerUnit, source.UnitPrice, source.UnitsInStock, source.UnitsOnOrder,
+    source.ReorderLevel, source.Discontinued, source.staging_raw_id_sk
+INTO @changes;
 
--- Insert new current records for changed products
+-- Insert new current records for changed products (from the captured changes, no second scan)
 INSERT INTO {schema_name}.{dim_table_name} (
     ProductID, ProductName, SupplierID, CategoryID, QuantityPerUnit, UnitPrice,
     UnitsInStock, UnitsOnOrder, ReorderLevel, Discontinued,
     EffectiveStartDate, EffectiveEndDate, IsCurrent, IsDeleted, SOR_SK, staging_raw_id_nk
 )
 SELECT 
-    source.ProductID,
-    source.ProductName,
-    source.SupplierID,
-    source.CategoryID,
-    source.QuantityPerUnit,
-    source.UnitPrice,
-    source.UnitsInStock,
-    source.UnitsOnOrder,
-    source.ReorderLevel,
-    source.Discontinued,
+    changes.ProductID,
+    changes.ProductName,
+    changes.SupplierID,
+    changes.CategoryID,
+    changes.QuantityPerUnit,
+    changes.UnitPrice,
+    changes.UnitsInStock,
+    changes.UnitsOnOrder,
+    changes.ReorderLevel,
+    changes.Discontinued,
     @current_date AS EffectiveStartDate,
     NULL AS EffectiveEndDate,
     1 AS IsCurrent,
     0 AS IsDeleted,
     @sor_sk AS SOR_SK,
-    source.staging_raw_id_sk
-FROM {schema_name}.{staging_table_name} AS source
-WHERE EXISTS (
-    SELECT 1
-    FROM {schema_name}.{dim_table_name} AS target
-    WHERE target.ProductID = source.ProductID
-    AND target.IsCurrent = 0
-    AND target.EffectiveEndDate = DATEADD(DAY, -1, @current_date)
-)
-AND NOT EXISTS (
-    SELECT 1
-    FROM {schema_name}.{dim_table_name} AS target
-    WHERE target.ProductID = source.ProductID
-    AND target.IsCurrent = 1
-);
+    changes.staging_raw_id_sk
+FROM @changes AS changes
+WHERE changes.MergeAction = 'UPDATE'
+  AND changes.ClosedAsDeleted = 0;
 
--- Close current records for products that no longer exist in staging (delete closing)
-UPDATE {schema_name}.{dim_table_name}
-SET 
-    EffectiveEndDate = DATEADD(DAY, -1, @current_date),
-    IsCurrent = 0,
-    IsDeleted = 1,
-    UpdatedAt = SYSUTCDATETIME()
-WHERE ProductID NOT IN (
-    SELECT ProductID FROM {schema_name}.{staging_table_name}
-)
-AND IsCurrent = 1
-AND IsDeleted = 0;
+COMMIT TRANSACTION;
@@ -27,20 +27,7 @@ WHEN MATCHED AND ISNULL(target.RegionDescription, '') <> ISNULL(source.RegionDes
         UpdatedAt = SYSUTCDATETIME()
 WHEN NOT MATCHED THEN
     INSERT (RegionID, RegionDescription, SOR_SK, staging_raw_id_nk)
-    VALUES (source.RegionID, source.RegionDescription, @sor_sk, source.staging_raw_id_sk);
-
--- Insert into history table for changed records
-INSERT INTO {schema_name}.DimRegion_Hist (RegionID, RegionDescription, ChangeDate, ChangeType)
-SELECT 
-    source.RegionID,
-    source.RegionDescription,
-    @current_date AS ChangeDate,
-    CASE 
-        WHEN target.RegionID IS NULL THEN 'INSERT'
-        WHEN ISNULL(target.RegionDescription, '') <> ISNULL(source.RegionDescription, '') THEN 'UPDATE'
-        ELSE 'NO CHANGE'
-    END AS ChangeType
-FROM {schema_name}.{staging_table_name} AS source
-LEFT JOIN {schema_name}.{dim_table_name} AS target ON source.RegionID = target.RegionID
-WHERE target.RegionID IS NULL 
-   OR ISNULL(target.RegionDescription, '') <> ISNULL(source.RegionDescription, '');
+    VALUES (source.RegionID, source.RegionDescription, @sor_sk, source.staging_raw_id_sk)
+-- Record inserted/changed rows in the history table as part of the same statement
+OUTPUT inserted.RegionID, inserted.RegionDescription, @current_date, $action
+INTO {schema_name}.DimRegion_Hist (RegionID, RegionDescription, ChangeDate, ChangeType);
@@ -32,22 +32,7 @@ WHEN MATCHED AND (
         UpdatedAt = SYSUTCDATETIME()
 WHEN NOT MATCHED THEN
     INSERT (TerritoryID, TerritoryDescription, RegionID, SOR_SK, staging_raw_id_nk)
-    VALUES (source.TerritoryID, source.TerritoryDescription, source.RegionID, @sor_sk, source.staging_raw_id_sk);
-
--- Insert into history table for changed records
-INSERT INTO {schema_name}.DimTerritories_Hist (TerritoryID, TerritoryDescription, ChangeDate, ChangeType)
-SELECT 
-    source.TerritoryID,
-    source.TerritoryDescription,
-    @current_date AS ChangeDate,
-    CASE 
-        WHEN target.TerritoryID IS NULL THEN 'INSERT'
-        WHEN ISNULL(target.TerritoryDescription, '') <> ISNULL(source.TerritoryDescription, '') 
-          OR ISNULL(target.RegionID, 0) <> ISNULL(source.RegionID, 0) THEN 'UPDATE'
-        ELSE 'NO CHANGE'
-    END AS ChangeType
-FROM {schema_name}.{staging_table_name} AS source
-LEFT JOIN {schema_name}.{dim_table_name} AS target ON source.TerritoryID = target.TerritoryID
-WHERE target.TerritoryID IS NULL 
-   OR ISNULL(target.TerritoryDescription, '') <> ISNULL(source.TerritoryDescription, '')
-   OR ISNULL(target.RegionID, 0) <> ISNULL(source.RegionID, 0);
+    VALUES (source.TerritoryID, source.TerritoryDescription, source.RegionID, @sor_sk, source.staging_raw_id_sk)
+-- Record inserted/changed rows in the history table as part of the same statement
+OUTPUT inserted.TerritoryID, inserted.TerritoryDescription, @current_date, $action
+INTO {schema_name}.DimTerritories_Hist (TerritoryID, TerritoryDescription, ChangeDate, ChangeType);
@@ -0,0 +1,151 @@
+-- Update FactOrders in bounded batches (OrderID key ranges, one transaction per batch)
+-- Parameters: @database_name, @schema_name, @fact_table_name, @progress_table_name, @batch_size,
+--             @start_date, @end_date
+-- Committed progress is kept in @progress_table_name, so a failed run resumes after the last committed batch.
+-- Order lines already in FactOrders are skipped, so loading a completed window again (a retried or
+-- reclaimed distributed window) inserts nothing twice. Two runs of the same window at the same time (a
+-- worker that lost its lease still running) are kept apart by the unique IX_FactOrders_OrderID_Product:
+-- the batch that loses the race fails with a duplicate key, rolls back and is run again, skipping the
+-- lines the other run committed.
+
+USE {database_name};
+GO
+
+SET NOCOUNT ON;
+SET XACT_ABORT ON;
+
+DECLARE @sor_orders_sk INT;
+DECLARE @sor_orderdetails_sk INT;
+
+SELECT @sor_orders_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = 'stg_Orders_raw';
+SELECT @sor_orderdetails_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = 'stg_OrderDetails_raw';
+
+DECLARE @batch_size INT = {batch_size};
+DECLARE @window_start DATE = '{start_date}';
+DECLARE @window_end DATE = '{end_date}';
+DECLARE @last_order_id INT;
+DECLARE @resumed_from_order_id INT;
+DECLARE @to_order_id INT;
+DECLARE @batch_rows INT;
+DECLARE @batches INT = 0;
+DECLARE @rows_inserted BIGINT = 0;
+DECLARE @duplicate_retries INT = 0;
+
+-- Resume after the last committed batch of an unfinished run of this window
+SELECT @last_order_id = LastOrderID
+FROM {schema_name}.{progress_table_name}
+WHERE FactTableName = '{fact_table_name}' AND WindowStart = @window_start AND WindowEnd = @window_end;
+
+SET @resumed_from_order_id = @last_order_id;
+
+IF @last_order_id IS NULL
+BEGIN
+    SET @last_order_id = -2147483648;
+    -- Another run of the window may create the row at the same time
+    INSERT INTO {schema_name}.{progress_table_name} (FactTableName, WindowStart, WindowEnd, LastOrderID)
+    SELECT '{fact_table_name}', @window_start, @window_end, @last_order_id
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM {schema_name}.{progress_table_name} WITH (UPDLOCK, HOLDLOCK)
+        WHERE FactTableName = '{fact_table_name}' AND WindowStart = @window_start AND WindowEnd = @window_end
+    );
+END;
+
+-- Orders of the window still to load, with their detail row counts (batches never split an order)
+IF OBJECT_ID('tempdb..#orders') IS NOT NULL DROP TABLE #orders;
+
+SELECT o.OrderID, COUNT(*) AS DetailRows
+INTO #orders
+FROM {schema_name}.stg_Orders_raw AS o
+INNER JOIN {schema_name}.stg_OrderDetails_raw AS od
+    ON o.OrderID = od.OrderID
+WHERE o.OrderDate >= @window_start
+  AND o.OrderDate < DATEADD(DAY, 1, @window_end)
+  AND o.OrderID > @last_order_id
+GROUP BY o.OrderID;
+
+CREATE CLUSTERED INDEX IX_orders_OrderID ON #orders (OrderID);
+
+WHILE 1 = 1
+BEGIN
+    -- Largest OrderID that keeps the batch within @batch_size detail rows (at least one order)
+    SET @to_order_id = NULL;
+    SELECT @to_order_id = MAX(r.OrderID)
+    FROM (
+        SELECT OrderID, SUM(DetailRows) OVER (ORDER BY OrderID ROWS UNBOUNDED PRECEDING) AS RunningRows
+        FROM #orders
+    ) AS r
+    WHERE r.RunningRows <= @batch_size;
+
+    IF @to_order_id IS NULL
+        SELECT @to_order_id = MIN(OrderID) FROM #orders;
+
+    IF @to_order_id IS NULL
+        BREAK;
+
+    -- One transaction per batch: the insert and the progress row commit (or roll back) together
+    BEGIN TRY
+        BEGIN TRANSACTION;
+
+        INSERT INTO {schema_name}.{fact_table_name} (
+            OrderID, OrderDate, RequiredDate, ShippedDate,
+            OrderDateKey, RequiredDateKey, ShippedDateKey, Freight,
+            Customer_SK, Employee_SK, Shipper_SK, Territory_SK, Region_SK,
+            Product_SK, Category_SK, Supplier_SK,
+            Quantity, UnitPrice, Discount,
+            SOR_SK, staging_raw_id_nk
+        )
+        {fact_orders_source}
+          AND o.OrderDate >= @window_start
+          AND o.OrderDate < DATEADD(DAY, 1, @window_end)
+          AND o.OrderID > @last_order_id
+          AND o.OrderID <= @to_order_id
+          -- Skip order lines loaded by an earlier run of this window (seeks IX_FactOrders_OrderID_Product)
+          AND NOT EXISTS (
+              SELECT 1
+              FROM {schema_name}.{fact_table_name} AS f
+              INNER JOIN {schema_name}.DimProducts AS p ON p.Product_SK = f.Product_SK
+              WHERE f.OrderID = o.OrderID AND p.ProductID = od.ProductID
+          );
+
+        SET @batch_rows = @@ROWCOUNT;
+
+        UPDATE {schema_name}.{progress_table_name}
+        SET LastOrderID = @to_order_id,
+            BatchesCommitted = BatchesCommitted + 1,
+            RowsInserted = RowsInserted + @batch_rows,
+            UpdatedAt = SYSUTCDATETIME()
+        WHERE FactTableName = '{fact_table_name}' AND WindowStart = @window_start AND WindowEnd = @window_end;
+
+        COMMIT TRANSACTION;
+    END TRY
+    BEGIN CATCH
+        IF XACT_STATE() <> 0
+            ROLLBACK TRANSACTION;
+
+        -- 2601/2627: another run committed some of these order lines first; the re-run skips them
+        IF ERROR_NUMBER() IN (2601, 2627) AND @duplicate_retries < 3
+        BEGIN
+            SET @duplicate_retries = @duplicate_retries + 1;
+            CONTINUE;
+        END;
+
+        THROW;
+    END CATCH;
+
+    SET @duplicate_retries = 0;
+
+    SET @batches = @batches + 1;
+    SET @rows_inserted = @rows_inserted + @batch_rows;
+    SET @last_order_id = @to_order_id;
+    DELETE FROM #orders WHERE OrderID <= @to_order_id;
+END;
+
+-- Window complete: a later run of the same window starts from scratch again and skips the loaded lines
+DELETE FROM {schema_name}.{progress_table_name}
+WHERE FactTableName = '{fact_table_name}' AND WindowStart = @window_start AND WindowEnd = @window_end;
+
+SELECT
+    @batches AS batches,
+    @rows_inserted AS rows_inserted,
+    @resumed_from_order_id AS resumed_from_order_id;
@@ -0,0 +1,34 @@
+-- Update FactOrders with a single TABLOCK insert (initial loads)
+-- Parameters: @database_name, @schema_name, @fact_table_name, @start_date, @end_date
+-- FactOrders has a clustered primary key and nonclustered indexes (IX_FactOrders_OrderDateKey,
+-- IX_FactOrders_OrderID_Product), so do not count on minimal logging: at best the clustered index of an
+-- empty table is minimally logged (SIMPLE or BULK_LOGGED recovery) while the nonclustered indexes are
+-- fully logged. The gain is mostly one table lock instead of row locks escalating. Meant for initial
+-- loads, not for loads concurrent with readers.
+
+USE {database_name};
+GO
+
+SET XACT_ABORT ON;
+
+DECLARE @sor_orders_sk INT;
+DECLARE @sor_orderdetails_sk INT;
+
+SELECT @sor_orders_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = 'stg_Orders_raw';
+SELECT @sor_orderdetails_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = 'stg_OrderDetails_raw';
+
+BEGIN TRANSACTION;
+
+INSERT INTO {schema_name}.{fact_table_name} WITH (TABLOCK) (
+    OrderID, OrderDate, RequiredDate, ShippedDate,
+    OrderDateKey, RequiredDateKey, ShippedDateKey, Freight,
+    Customer_SK, Employee_SK, Shipper_SK, Territory_SK, Region_SK,
+    Product_SK, Category_SK, Supplier_SK,
+    Quantity, UnitPrice, Discount,
+    SOR_SK, staging_raw_id_nk
+)
+{fact_orders_source}
+  AND o.OrderDate >= '{start_date}'
+  AND o.OrderDate < DATEADD(DAY, 1, CAST('{end_date}' AS DATE));
+
+COMMIT TRANSACTION;
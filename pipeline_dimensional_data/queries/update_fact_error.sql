@@ -64,8 +64,9 @@ LEFT JOIN {schema_name}.DimCategories AS dc2
     ON dp.CategoryID = dc2.CategoryID
 LEFT JOIN {schema_name}.DimSuppliers AS dsup 
     ON dp.SupplierID = dsup.SupplierID
-WHERE CAST(o.OrderDate AS DATE) >= '{start_date}'
-  AND CAST(o.OrderDate AS DATE) <= '{end_date}'
+-- Range predicate on the raw column (no per-row CAST) so it stays sargable
+WHERE o.OrderDate >= '{start_date}'
+  AND o.OrderDate < DATEADD(DAY, 1, CAST('{end_date}' AS DATE))
   -- Only insert rows where at least one required dimension key is missing
   AND (
     dc.Customer_SK IS NULL OR
@@ -76,4 +77,12 @@ WHERE CAST(o.OrderDate AS DATE) >= '{start_date}'
     dp.Product_SK IS NULL OR
     dc2.Category_SK IS NULL OR
     dsup.Supplier_SK IS NULL
+  )
+  -- Skip rows already logged and still unresolved (the window is being loaded again)
+  AND NOT EXISTS (
+    SELECT 1
+    FROM {schema_name}.{fact_error_table_name} AS e
+    WHERE e.OrderID = o.OrderID
+      AND e.ProductID = od.ProductID
+      AND e.IsResolved = 0
   );
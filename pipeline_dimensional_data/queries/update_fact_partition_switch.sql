@@ -0,0 +1,126 @@
+-- Update FactOrders through monthly partition switching (optional partitioned/columnstore design)
+-- Parameters: @database_name, @schema_name, @fact_table_name, @switch_in_table_name, @switch_out_table_name,
+--             @partition_function_name, @partition_scheme_name, @start_date, @end_date, @switch_lock_timeout_ms
+-- Requires infrastructure_initiation/fact_orders_partitioning.sql
+-- Every run shares the switch-in/switch-out tables, so each month is built and switched in one transaction
+-- holding an exclusive application lock: concurrent runs (distributed workers) take turns month by month.
+
+USE {database_name};
+GO
+
+SET XACT_ABORT ON;
+
+DECLARE @sor_orders_sk INT;
+DECLARE @sor_orderdetails_sk INT;
+
+SELECT @sor_orders_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = 'stg_Orders_raw';
+SELECT @sor_orderdetails_sk = SOR_SK FROM {schema_name}.Dim_SOR WHERE StagingTableName = 'stg_OrderDetails_raw';
+
+DECLARE @window_start DATE = '{start_date}';
+DECLARE @window_end DATE = '{end_date}';
+DECLARE @month_start DATE = DATEFROMPARTS(YEAR(@window_start), MONTH(@window_start), 1);
+DECLARE @next_month DATE;
+DECLARE @range_start DATE;
+DECLARE @range_end DATE;
+DECLARE @partition_number INT;
+DECLARE @sql NVARCHAR(MAX);
+DECLARE @lock_result INT;
+
+-- Each month touched by the window is rebuilt in the switch-in table and swapped in as a whole partition:
+-- rows of that month outside the window are carried over, rows inside the window are reloaded from staging.
+WHILE @month_start <= @window_end
+BEGIN
+    SET @next_month = DATEADD(MONTH, 1, @month_start);
+    SET @range_start = CASE WHEN @month_start > @window_start THEN @month_start ELSE @window_start END;
+    SET @range_end = CASE WHEN DATEADD(DAY, -1, @next_month) < @window_end THEN DATEADD(DAY, -1, @next_month) ELSE @window_end END;
+
+    -- The lock is owned by the transaction: it is released by the COMMIT, or by the rollback of a failed month
+    BEGIN TRANSACTION;
+
+    EXEC @lock_result = sp_getapplock
+        @Resource = '{schema_name}.{fact_table_name}:partition_switch',
+        @LockMode = 'Exclusive',
+        @LockOwner = 'Transaction',
+        @LockTimeout = {switch_lock_timeout_ms};
+
+    IF @lock_result < 0
+        THROW 50001, 'Timed out waiting for the FactOrders partition switch lock', 1;
+
+    -- Make sure the month has its own partition (new months are split off the empty tail partition)
+    IF NOT EXISTS (
+        SELECT 1
+        FROM sys.partition_range_values AS prv
+        INNER JOIN sys.partition_functions AS pf ON pf.function_id = prv.function_id
+        WHERE pf.name = '{partition_function_name}' AND CAST(prv.value AS DATE) = @month_start
+    )
+    BEGIN
+        ALTER PARTITION SCHEME {partition_scheme_name} NEXT USED [PRIMARY];
+        ALTER PARTITION FUNCTION {partition_function_name}() SPLIT RANGE (@month_start);
+    END;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM sys.partition_range_values AS prv
+        INNER JOIN sys.partition_functions AS pf ON pf.function_id = prv.function_id
+        WHERE pf.name = '{partition_function_name}' AND CAST(prv.value AS DATE) = @next_month
+    )
+    BEGIN
+        ALTER PARTITION SCHEME {partition_scheme_name} NEXT USED [PRIMARY];
+        ALTER PARTITION FUNCTION {partition_function_name}() SPLIT RANGE (@next_month);
+    END;
+
+    SET @partition_number = $PARTITION.{partition_function_name}(@month_start);
+
+    TRUNCATE TABLE {schema_name}.{switch_in_table_name};
+    TRUNCATE TABLE {schema_name}.{switch_out_table_name};
+
+    -- Bound the switch-in table to the month so it can be switched into the partition
+    ALTER TABLE {schema_name}.{switch_in_table_name} DROP CONSTRAINT IF EXISTS CK_{switch_in_table_name}_OrderDate;
+    SET @sql = N'ALTER TABLE {schema_name}.{switch_in_table_name} WITH CHECK ADD CONSTRAINT CK_{switch_in_table_name}_OrderDate '
+             + N'CHECK (OrderDate >= ''' + CONVERT(NVARCHAR(10), @month_start, 23)
+             + N''' AND OrderDate < ''' + CONVERT(NVARCHAR(10), @next_month, 23) + N''')';
+    EXEC sp_executesql @sql;
+
+    -- Carry over the rows of this month that fall outside the load window
+    INSERT INTO {schema_name}.{switch_in_table_name} (
+        OrderFact_SK, OrderID, OrderDate, RequiredDate, ShippedDate,
+        OrderDateKey, RequiredDateKey, ShippedDateKey, Freight,
+        Customer_SK, Employee_SK, Shipper_SK, Territory_SK, Region_SK,
+        Product_SK, Category_SK, Supplier_SK,
+        Quantity, UnitPrice, Discount,
+        SOR_SK, staging_raw_id_nk, LoadDate
+    )
+    SELECT
+        OrderFact_SK, OrderID, OrderDate, RequiredDate, ShippedDate,
+        OrderDateKey, RequiredDateKey, ShippedDateKey, Freight,
+        Customer_SK, Employee_SK, Shipper_SK, Territory_SK, Region_SK,
+        Product_SK, Category_SK, Supplier_SK,
+        Quantity, UnitPrice, Discount,
+        SOR_SK, staging_raw_id_nk, LoadDate
+    FROM {schema_name}.{fact_table_name}
+    WHERE $PARTITION.{partition_function_name}(OrderDate) = @partition_number
+      AND (OrderDate < @range_start OR OrderDate > @range_end);
+
+    -- Load the part of the window that falls in this month (shared source query, see fact_orders_source.sql)
+    INSERT INTO {schema_name}.{switch_in_table_name} (
+        OrderID, OrderDate, RequiredDate, ShippedDate,
+        OrderDateKey, RequiredDateKey, ShippedDateKey, Freight,
+        Customer_SK, Employee_SK, Shipper_SK, Territory_SK, Region_SK,
+        Product_SK, Category_SK, Supplier_SK,
+        Quantity, UnitPrice, Discount,
+        SOR_SK, staging_raw_id_nk
+    )
+    {fact_orders_source}
+      AND o.OrderDate >= @range_start
+      AND o.OrderDate < DATEADD(DAY, 1, @range_end);
+
+    -- Metadata-only swap: old month out, rebuilt month in
+    ALTER TABLE {schema_name}.{fact_table_name} SWITCH PARTITION @partition_number TO {schema_name}.{switch_out_table_name};
+    ALTER TABLE {schema_name}.{switch_in_table_name} SWITCH TO {schema_name}.{fact_table_name} PARTITION @partition_number;
+
+    TRUNCATE TABLE {schema_name}.{switch_out_table_name};
+
+    COMMIT TRANSACTION;
+
+    SET @month_start = @next_month;
+END;
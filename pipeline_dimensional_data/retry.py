@@ -0,0 +1,94 @@
+"""
+Classification of SQL Server errors and jittered exponential backoff for retrying transient ones.
+"""
+import random
+import re
+
+
+# Error classes that are worth retrying
+DEADLOCK = 'deadlock'
+LOCK_TIMEOUT = 'lock_timeout'
+CONNECTION = 'connection'
+OTHER = 'other'
+TRANSIENT_ERROR_CLASSES = (DEADLOCK, LOCK_TIMEOUT, CONNECTION)
+
+# SQL Server / FreeTDS error numbers
+DEADLOCK_ERRORS = {1205}
+LOCK_TIMEOUT_ERRORS = {1222}
+CONNECTION_ERRORS = {
+    233,     # no process on the other end of the pipe
+    10053,   # connection aborted
+    10054,   # connection reset by peer
+    20003,   # server connection timed out
+    20004,   # read from the server failed
+    20006,   # write to the server failed
+    20009,   # unable to connect
+    20047,   # DBPROCESS is dead or not enabled
+}
+CONNECTION_MESSAGES = (
+    'dbprocess is dead',
+    'read from the server failed',
+    'write to the server failed',
+    'connection reset',
+    'connection was closed',
+    'adaptive server connection timed out',
+)
+
+
+def get_error_number(error: Exception):
+    """
+    Extract the SQL Server error number from a pymssql exception.
+    
+    Args:
+        error: Exception raised by pymssql
+        
+    Returns:
+        int or None: Error number if one could be found
+    """
+    if error.args and isinstance(error.args[0], int):
+        return error.args[0]
+    match = re.match(r'\(?(\d+),', str(error))
+    return int(match.group(1)) if match else None
+
+
+def classify_sql_error(error: Exception) -> str:
+    """
+    Classify a SQL error as deadlock, lock timeout, dropped connection or other.
+    
+    Args:
+        error: Exception raised while executing a batch
+        
+    Returns:
+        str: One of DEADLOCK, LOCK_TIMEOUT, CONNECTION, OTHER
+    """
+    number = get_error_number(error)
+    if number in DEADLOCK_ERRORS:
+        return DEADLOCK
+    if number in LOCK_TIMEOUT_ERRORS:
+        return LOCK_TIMEOUT
+    if number in CONNECTION_ERRORS:
+        return CONNECTION
+    
+    message = str(error).lower()
+    if 'deadlock' in message:
+        return DEADLOCK
+    if 'lock request time out' in message:
+        return LOCK_TIMEOUT
+    if any(text in message for text in CONNECTION_MESSAGES):
+        return CONNECTION
+    return OTHER
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Full-jitter exponential backoff: a random delay up to base_delay * 2^(attempt - 1), capped at max_delay.
+    
+    Args:
+        attempt: Number of the attempt that just failed (1-based)
+        base_delay: Delay bound after the first failure (seconds)
+        max_delay: Upper bound of any delay (seconds)
+        
+    Returns:
+        float: Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
@@ -3,61 +3,226 @@ ETL tasks for dimensional data pipeline.
 Flow-specific functions for executing SQL scripts with proper parameterization.
 """
 import os
-import pymssql
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional
 from pipeline_dimensional_data.config import *
-from utils import read_sql_script, parse_database_config
+from pipeline_dimensional_data.retry import CONNECTION, TRANSIENT_ERROR_CLASSES, backoff_delay, classify_sql_error
+from profiling import SHOWPLAN_COLUMN
+from utils import read_sql_script, get_pymssql_connection
 
 
-def execute_sql_script(sql_script: str, config_file_path: str = "sql_server_config.cfg") -> Dict[str, bool]:
+# SQL templates shipped next to this module
+QUERIES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'queries')
+
+# Semaphores capping concurrent script connections per target (set by multi-target runs)
+_connection_limits = {}
+
+# RunProfiler receiving plans and statistics of every executed batch (set in --profile mode)
+_profiler = None
+_warned_no_msghandler = False
+
+
+def set_connection_limits(limits: Dict[str, object]) -> None:
+    """
+    Register per-target connection limits for this process.
+    
+    Args:
+        limits: Semaphore per target name ('default' for [DATABASE]), sized by the
+                target's max_connections
+    """
+    _connection_limits.clear()
+    _connection_limits.update(limits)
+
+
+def set_profiler(profiler) -> None:
+    """
+    Register the RunProfiler of this process (None to stop profiling).
+    
+    Args:
+        profiler: profiling.RunProfiler that records each executed batch
+    """
+    global _profiler
+    _profiler = profiler
+
+
+def _enable_statistics(conn, cursor, messages: List[str]) -> None:
+    """
+    Return actual plans and collect STATISTICS IO/TIME messages on a connection (profile mode).
+    
+    The messages arrive through pymssql's internal connection object (conn._conn.set_msghandler).
+    If a driver version does not expose it, only the plans are captured; profiling problems are
+    reported as warnings and never fail the script.
+    """
+    global _warned_no_msghandler
+    set_msghandler = getattr(getattr(conn, '_conn', None), 'set_msghandler', None)
+    try:
+        if set_msghandler is None:
+            if not _warned_no_msghandler:
+                print("⚠ Profiling: this pymssql version has no message handler, STATISTICS IO/TIME are not captured")
+                _warned_no_msghandler = True
+            cursor.execute("SET STATISTICS XML ON;")
+        else:
+            set_msghandler(
+                lambda msgstate, severity, srvname, procname, line, msgtext: messages.append(msgtext)
+            )
+            cursor.execute("SET STATISTICS XML ON; SET STATISTICS IO ON; SET STATISTICS TIME ON;")
+    except Exception as e:
+        print(f"⚠ Profiling: could not enable statistics on this connection: {str(e)}")
+
+
+def _record_profiled_batch(batch: str, plans: List[str], messages: List[str], duration_seconds: float) -> None:
+    """Hand an executed batch to the profiler; a failure to record it only prints a warning."""
+    try:
+        _profiler.record_sql_batch(batch, plans, messages, duration_seconds)
+    except Exception as e:
+        print(f"⚠ Profiling: could not record batch: {str(e)}")
+
+
+def _read_results(cursor):
+    """
+    Read every result set of a batch (with STATISTICS XML ON, plans arrive as extra result sets).
+    
+    Returns:
+        tuple: (rows of the last non-empty result set other than a plan, an empty list if every such
+                result set was empty, None if there was none; list of showplan XML documents)
+    """
+    rows = None
+    plans = []
+    while True:
+        if cursor.description:
+            result_rows = cursor.fetchall()
+            if cursor.description[0][0] == SHOWPLAN_COLUMN:
+                plans.extend(row[SHOWPLAN_COLUMN] if isinstance(row, dict) else row[0] for row in result_rows)
+            elif result_rows or rows is None:
+                rows = result_rows
+        if not cursor.nextset():
+            break
+    return rows, plans
+
+
+def execute_sql_script(
+    sql_script: str,
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None,
+    fetch_results: bool = False,
+    idempotent: bool = False,
+    max_attempts: int = SQL_RETRY_MAX_ATTEMPTS
+) -> Dict[str, bool]:
     """
     Execute a SQL script using pymssql.
     
+    A batch that fails with a transient error (deadlock victim, lock timeout, dropped connection)
+    is retried with jittered exponential backoff, but only when the script is idempotent: every
+    batch is atomic or can be re-run after a failure without duplicating data.
+    
     Args:
         sql_script: SQL script to execute
         config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
+        fetch_results: Return the last non-empty result set of the last batch that produced one
+        idempotent: Whether failed batches may be retried
+        max_attempts: Attempts per batch when retrying
         
     Returns:
-        dict: {'success': True} if successful, {'success': False} otherwise
+        dict: {'success': True} if successful (plus 'rows' when fetch_results), {'success': False} otherwise;
+              always includes 'retries' and 'retry_seconds' (time lost to failed attempts and backoff)
     """
+    retries = 0
+    retry_seconds = 0.0
+    conn = None
+    connection_limit = _connection_limits.get(target or 'default')
+    if connection_limit is not None:
+        connection_limit.acquire()
     try:
-        config = parse_database_config(config_file_path)
-        # Use pymssql instead of pyodbc (no ODBC driver needed)
-        if config['username'] and config['password']:
-            conn = pymssql.connect(
-                server=config['server'],
-                user=config['username'],
-                password=config['password'],
-                database=config['database'],
-                port=1433,
-                autocommit=True
-            )
-        else:
-            import getpass
-            conn = pymssql.connect(
-                server=config['server'],
-                user=getpass.getuser(),
-                password='',
-                database=config['database'],
-                port=1433,
-                autocommit=True
-            )
-        cursor = conn.cursor()
-        
         # Split script by GO statements and execute each batch
         batches = [batch.strip() for batch in sql_script.split('GO') if batch.strip()]
         
+        conn = get_pymssql_connection(config_file_path, autocommit=True, target=target)
+        cursor = conn.cursor(as_dict=fetch_results)
+        messages = []
+        if _profiler is not None:
+            _enable_statistics(conn, cursor, messages)
+        
+        rows = []
+        session_batches = []  # USE batches, replayed after a reconnect
         for batch in batches:
-            if batch.strip():  # Only execute non-empty batches
-                cursor.execute(batch)
+            attempt = 1
+            # Error class of the failed attempt, recovered from at the start of the next one so that a
+            # failed reconnect or rollback counts as a failed attempt and is retried with backoff too
+            recover_from = None
+            while True:
+                attempt_started = time.perf_counter()
+                try:
+                    if recover_from == CONNECTION:
+                        try:
+                            conn.close()
+                        except Exception:
+                            pass
+                        conn = get_pymssql_connection(config_file_path, autocommit=True, target=target)
+                        cursor = conn.cursor(as_dict=fetch_results)
+                        if _profiler is not None:
+                            _enable_statistics(conn, cursor, messages)
+                        for session_batch in session_batches:
+                            cursor.execute(session_batch)
+                    elif recover_from is not None:
+                        # A lock timeout without XACT_ABORT leaves the transaction open
+                        cursor.execute("IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;")
+                    recover_from = None
+                    
+                    cursor.execute(batch)
+                    # Both paths drain every result set, so the summary a script SELECTs last is returned
+                    # with or without --profile
+                    if fetch_results or _profiler is not None:
+                        batch_rows, plans = _read_results(cursor)
+                        if fetch_results and batch_rows is not None:
+                            rows = batch_rows
+                        if _profiler is not None:
+                            _record_profiled_batch(batch, plans, list(messages), time.perf_counter() - attempt_started)
+                    messages.clear()
+                    break
+                except Exception as e:
+                    error_class = classify_sql_error(e)
+                    if not idempotent or error_class not in TRANSIENT_ERROR_CLASSES or attempt >= max_attempts:
+                        raise
+                    
+                    delay = backoff_delay(attempt, SQL_RETRY_BASE_DELAY_SECONDS, SQL_RETRY_MAX_DELAY_SECONDS)
+                    print(f"Transient SQL error ({error_class}), retrying batch in {delay:.1f}s "
+                          f"(attempt {attempt + 1}/{max_attempts}): {str(e)}")
+                    time.sleep(delay)
+                    
+                    recover_from = error_class
+                    messages.clear()
+                    
+                    retries += 1
+                    retry_seconds += time.perf_counter() - attempt_started
+                    attempt += 1
+            
+            if batch.upper().startswith('USE '):
+                session_batches.append(batch)
         
         cursor.close()
-        conn.close()
         
-        return {'success': True}
+        result = {'success': True, 'retries': retries, 'retry_seconds': round(retry_seconds, 3)}
+        if fetch_results:
+            result['rows'] = rows
+        return result
     except Exception as e:
         print(f"Error executing SQL script: {str(e)}")
-        return {'success': False, 'error': str(e)}
+        return {
+            'success': False,
+            'error': str(e),
+            'error_class': classify_sql_error(e),
+            'retries': retries,
+            'retry_seconds': round(retry_seconds, 3)
+        }
+    finally:
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if connection_limit is not None:
+            connection_limit.release()
 
 
 def update_dimension_table(
@@ -65,7 +230,8 @@ def update_dimension_table(
     staging_table_name: str,
     database_name: str = DATABASE_NAME,
     schema_name: str = SCHEMA_NAME,
-    config_file_path: str = "sql_server_config.cfg"
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None
 ) -> Dict[str, bool]:
     """
     Update a dimension table from its staging table.
@@ -76,6 +242,7 @@ def update_dimension_table(
         database_name: Name of the database
         schema_name: Name of the schema
         config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
         
     Returns:
         dict: {'success': True} if successful
@@ -83,8 +250,7 @@ def update_dimension_table(
     try:
         # Read the SQL script
         script_path = os.path.join(
-            os.path.dirname(__file__),
-            '../../DS206_Project2_Group4 3/pipeline_dimensional_data/queries',
+            QUERIES_DIR,
             f'update_dim_{dimension_name.lower().replace("dim", "")}.sql'
         )
         
@@ -96,51 +262,128 @@ def update_dimension_table(
         sql_script = sql_script.replace('{dim_table_name}', dimension_name)
         sql_script = sql_script.replace('{staging_table_name}', staging_table_name)
         
-        # Execute the script
-        return execute_sql_script(sql_script, config_file_path)
+        # Execute the script (MERGE-based, safe to re-run after a failure)
+        return execute_sql_script(sql_script, config_file_path, target=target, idempotent=True)
     except Exception as e:
         print(f"Error updating dimension {dimension_name}: {str(e)}")
         return {'success': False, 'error': str(e)}
 
 
-def update_dim_categories(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_categories(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimCategories dimension table."""
-    return update_dimension_table(DIM_CATEGORIES, STG_CATEGORIES_RAW)
+    return update_dimension_table(DIM_CATEGORIES, STG_CATEGORIES_RAW, **kwargs)
 
 
-def update_dim_customers(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_customers(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimCustomers dimension table."""
-    return update_dimension_table(DIM_CUSTOMERS, STG_CUSTOMERS_RAW)
+    return update_dimension_table(DIM_CUSTOMERS, STG_CUSTOMERS_RAW, **kwargs)
 
 
-def update_dim_employees(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_employees(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimEmployees dimension table."""
-    return update_dimension_table(DIM_EMPLOYEES, STG_EMPLOYEES_RAW)
+    return update_dimension_table(DIM_EMPLOYEES, STG_EMPLOYEES_RAW, **kwargs)
 
 
-def update_dim_products(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_products(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimProducts dimension table."""
-    return update_dimension_table(DIM_PRODUCTS, STG_PRODUCTS_RAW)
+    return update_dimension_table(DIM_PRODUCTS, STG_PRODUCTS_RAW, **kwargs)
 
 
-def update_dim_region(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_region(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimRegion dimension table."""
-    return update_dimension_table(DIM_REGION, STG_REGION_RAW)
+    return update_dimension_table(DIM_REGION, STG_REGION_RAW, **kwargs)
 
 
-def update_dim_shippers(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_shippers(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimShippers dimension table."""
-    return update_dimension_table(DIM_SHIPPERS, STG_SHIPPERS_RAW)
+    return update_dimension_table(DIM_SHIPPERS, STG_SHIPPERS_RAW, **kwargs)
 
 
-def update_dim_suppliers(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_suppliers(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimSuppliers dimension table."""
-    return update_dimension_table(DIM_SUPPLIERS, STG_SUPPLIERS_RAW)
+    return update_dimension_table(DIM_SUPPLIERS, STG_SUPPLIERS_RAW, **kwargs)
 
 
-def update_dim_territories(prerequisite_result: Optional[Dict] = None) -> Dict[str, bool]:
+def update_dim_territories(prerequisite_result: Optional[Dict] = None, **kwargs) -> Dict[str, bool]:
     """Update DimTerritories dimension table."""
-    return update_dimension_table(DIM_TERRITORIES, STG_TERRITORIES_RAW)
+    return update_dimension_table(DIM_TERRITORIES, STG_TERRITORIES_RAW, **kwargs)
+
+
+def update_dim_date(
+    start_date: str,
+    end_date: str,
+    prerequisite_result: Optional[Dict] = None,
+    database_name: str = DATABASE_NAME,
+    schema_name: str = SCHEMA_NAME,
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Populate DimDate for the load window and all dates referenced by its orders.
+    
+    Args:
+        start_date: Start date of the load window (YYYY-MM-DD)
+        end_date: End date of the load window (YYYY-MM-DD)
+        prerequisite_result: Result from prerequisite task
+        database_name: Name of the database
+        schema_name: Name of the schema
+        config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
+        
+    Returns:
+        dict: {'success': True} if successful
+    """
+    try:
+        # Read the SQL script
+        script_path = os.path.join(
+            QUERIES_DIR,
+            'update_dim_date.sql'
+        )
+        
+        sql_script = read_sql_script(script_path)
+        
+        # Build the holiday rows from config
+        holiday_values = ", ".join(
+            f"('{holiday_date}', N'{holiday_name.replace(chr(39), chr(39) * 2)}')"
+            for holiday_date, holiday_name in DIM_DATE_HOLIDAYS.items()
+        )
+        holiday_inserts = (
+            f"INSERT INTO @holidays (HolidayDate, HolidayName) VALUES {holiday_values};"
+            if holiday_values else ""
+        )
+        
+        # Replace parameters
+        sql_script = sql_script.replace('{database_name}', database_name)
+        sql_script = sql_script.replace('{schema_name}', schema_name)
+        sql_script = sql_script.replace('{dim_table_name}', DIM_DATE)
+        sql_script = sql_script.replace('{start_date}', start_date)
+        sql_script = sql_script.replace('{end_date}', end_date)
+        sql_script = sql_script.replace('{fiscal_year_start_month}', str(int(DIM_DATE_FISCAL_YEAR_START_MONTH)))
+        sql_script = sql_script.replace('{holiday_inserts}', holiday_inserts)
+        
+        # Execute the script (MERGE-based, safe to re-run after a failure)
+        return execute_sql_script(sql_script, config_file_path, target=target, idempotent=True)
+    except Exception as e:
+        print(f"Error updating dimension {DIM_DATE}: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+
+def fact_load_is_rerunnable(
+    partitioned: bool = FACT_ORDERS_PARTITIONED,
+    load_strategy: str = FACT_ORDERS_LOAD_STRATEGY
+) -> bool:
+    """
+    Whether loading a window again replaces its FactOrders rows instead of appending a second copy.
+    
+    Args:
+        partitioned: Load through monthly partition switching
+        load_strategy: Insert strategy when not partitioned
+        
+    Returns:
+        bool: True for the partition switch, which rebuilds every month of the window, and for
+              the batched load, which skips order lines already in FactOrders
+    """
+    return partitioned or load_strategy == 'batched'
 
 
 def update_fact_orders(
@@ -149,7 +392,11 @@ def update_fact_orders(
     prerequisite_result: Optional[Dict] = None,
     database_name: str = DATABASE_NAME,
     schema_name: str = SCHEMA_NAME,
-    config_file_path: str = "sql_server_config.cfg"
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None,
+    partitioned: bool = FACT_ORDERS_PARTITIONED,
+    load_strategy: str = FACT_ORDERS_LOAD_STRATEGY,
+    batch_size: int = FACT_ORDERS_BATCH_SIZE
 ) -> Dict[str, bool]:
     """
     Update FactOrders fact table.
@@ -161,29 +408,71 @@ def update_fact_orders(
         database_name: Name of the database
         schema_name: Name of the schema
         config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
+        partitioned: Load through monthly partition switching (requires the
+            partitioned FactOrders from fact_orders_partitioning.sql)
+        load_strategy: Insert strategy when not partitioned: "single", "batched" or "bulk"
+        batch_size: Approximate rows per batch for the "batched" strategy
         
     Returns:
-        dict: {'success': True} if successful
+        dict: {'success': True} if successful (plus 'batches', 'rows_inserted' and
+              'resumed_from_order_id' for the "batched" strategy)
     """
     try:
+        fact_scripts = {
+            'single': 'update_fact.sql',
+            'batched': 'update_fact_batched.sql',
+            'bulk': 'update_fact_bulk.sql',
+        }
+        if not partitioned and load_strategy not in fact_scripts:
+            return {'success': False, 'error': f"Unknown fact load strategy: {load_strategy}"}
+        
         # Read the SQL script
         script_path = os.path.join(
-            os.path.dirname(__file__),
-            '../../DS206_Project2_Group4 3/pipeline_dimensional_data/queries',
-            'update_fact.sql'
+            QUERIES_DIR,
+            'update_fact_partition_switch.sql' if partitioned else fact_scripts[load_strategy]
         )
         
         sql_script = read_sql_script(script_path)
         
+        # Every strategy inserts the same source rows (fact_orders_source.sql), filtered to its own window
+        sql_script = sql_script.replace(
+            '{fact_orders_source}', read_sql_script(os.path.join(QUERIES_DIR, 'fact_orders_source.sql')).strip()
+        )
+        
         # Replace parameters
         sql_script = sql_script.replace('{database_name}', database_name)
         sql_script = sql_script.replace('{schema_name}', schema_name)
         sql_script = sql_script.replace('{fact_table_name}', FACT_ORDERS)
+        sql_script = sql_script.replace('{switch_in_table_name}', FACT_ORDERS_SWITCH_IN)
+        sql_script = sql_script.replace('{switch_out_table_name}', FACT_ORDERS_SWITCH_OUT)
+        sql_script = sql_script.replace('{partition_function_name}', FACT_ORDERS_PARTITION_FUNCTION)
+        sql_script = sql_script.replace('{partition_scheme_name}', FACT_ORDERS_PARTITION_SCHEME)
+        sql_script = sql_script.replace('{switch_lock_timeout_ms}', str(int(FACT_ORDERS_SWITCH_LOCK_TIMEOUT_MS)))
+        sql_script = sql_script.replace('{progress_table_name}', FACT_LOAD_PROGRESS_TABLE)
+        sql_script = sql_script.replace('{batch_size}', str(int(batch_size)))
         sql_script = sql_script.replace('{start_date}', start_date)
         sql_script = sql_script.replace('{end_date}', end_date)
         
-        # Execute the script
-        return execute_sql_script(sql_script, config_file_path)
+        if partitioned or load_strategy != 'batched':
+            # Execute the script (the partition switch rebuilds whole months, so it is safe to re-run;
+            # plain inserts are not)
+            return execute_sql_script(sql_script, config_file_path, target=target, idempotent=partitioned)
+        
+        # Execute the batched load and read back what it committed (a re-run resumes after the last committed batch)
+        result = execute_sql_script(sql_script, config_file_path, target=target, fetch_results=True, idempotent=True)
+        if not result.get('success', False):
+            return result
+        
+        summary = result['rows'][0] if result['rows'] else {}
+        return {
+            'success': True,
+            'batches': summary.get('batches', 0),
+            'rows_inserted': summary.get('rows_inserted', 0),
+            'resumed_from_order_id': summary.get('resumed_from_order_id'),
+            'retries': result['retries'],
+            'retry_seconds': result['retry_seconds']
+        }
     except Exception as e:
         print(f"Error updating fact table: {str(e)}")
         return {'success': False, 'error': str(e)}
@@ -195,7 +484,8 @@ def update_fact_orders_error(
     prerequisite_result: Optional[Dict] = None,
     database_name: str = DATABASE_NAME,
     schema_name: str = SCHEMA_NAME,
-    config_file_path: str = "sql_server_config.cfg"
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None
 ) -> Dict[str, bool]:
     """
     Update FactOrders_Error table with faulty rows.
@@ -207,6 +497,7 @@ def update_fact_orders_error(
         database_name: Name of the database
         schema_name: Name of the schema
         config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
         
     Returns:
         dict: {'success': True} if successful
@@ -214,8 +505,7 @@ def update_fact_orders_error(
     try:
         # Read the SQL script
         script_path = os.path.join(
-            os.path.dirname(__file__),
-            '../../DS206_Project2_Group4 3/pipeline_dimensional_data/queries',
+            QUERIES_DIR,
             'update_fact_error.sql'
         )
         
@@ -229,7 +519,180 @@ def update_fact_orders_error(
         sql_script = sql_script.replace('{end_date}', end_date)
         
         # Execute the script
-        return execute_sql_script(sql_script, config_file_path)
+        return execute_sql_script(sql_script, config_file_path, target=target)
     except Exception as e:
         print(f"Error updating fact error table: {str(e)}")
         return {'success': False, 'error': str(e)}
+
+
+def reprocess_fact_orders_error(
+    prerequisite_result: Optional[Dict] = None,
+    database_name: str = DATABASE_NAME,
+    schema_name: str = SCHEMA_NAME,
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Move unresolved FactOrders_Error rows whose missing dimension members now exist into FactOrders.
+    
+    Args:
+        prerequisite_result: Result from prerequisite task
+        database_name: Name of the database
+        schema_name: Name of the schema
+        config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
+        
+    Returns:
+        dict: {'success': True, 'inserted_rows': n, 'resolved_rows': n, 'min_order_date': ..., 'max_order_date': ...}
+              if successful; inserted_rows counts new FactOrders rows, resolved_rows the error rows marked
+              resolved, and the order dates span the inserted rows
+    """
+    try:
+        # Read the SQL script
+        script_path = os.path.join(
+            QUERIES_DIR,
+            'reprocess_fact_error.sql'
+        )
+        
+        sql_script = read_sql_script(script_path)
+        
+        # Replace parameters
+        sql_script = sql_script.replace('{database_name}', database_name)
+        sql_script = sql_script.replace('{schema_name}', schema_name)
+        sql_script = sql_script.replace('{fact_table_name}', FACT_ORDERS)
+        sql_script = sql_script.replace('{fact_error_table_name}', FACT_ORDERS_ERROR)
+        
+        # Execute the script and read back what was resolved (resolving is transactional and skips resolved rows)
+        result = execute_sql_script(sql_script, config_file_path, target=target, fetch_results=True, idempotent=True)
+        if not result.get('success', False):
+            return result
+        
+        summary = result['rows'][0] if result['rows'] else {}
+        return {
+            'success': True,
+            'inserted_rows': summary.get('inserted_rows', 0),
+            'resolved_rows': summary.get('resolved_rows', 0),
+            'min_order_date': summary.get('min_order_date'),
+            'max_order_date': summary.get('max_order_date'),
+            'retries': result['retries'],
+            'retry_seconds': result['retry_seconds']
+        }
+    except Exception as e:
+        print(f"Error reprocessing fact error table: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+
+def update_agg_sales(
+    start_date: str,
+    end_date: str,
+    prerequisite_result: Optional[Dict] = None,
+    database_name: str = DATABASE_NAME,
+    schema_name: str = SCHEMA_NAME,
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Update the dashboard aggregate tables for the days/months touched by the load window.
+    
+    Args:
+        start_date: Start date of the load window (YYYY-MM-DD)
+        end_date: End date of the load window (YYYY-MM-DD)
+        prerequisite_result: Result from prerequisite task
+        database_name: Name of the database
+        schema_name: Name of the schema
+        config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
+        
+    Returns:
+        dict: {'success': True} if successful
+    """
+    try:
+        # Read the SQL script
+        script_path = os.path.join(
+            QUERIES_DIR,
+            'update_agg_sales.sql'
+        )
+        
+        sql_script = read_sql_script(script_path)
+        
+        # Replace parameters
+        sql_script = sql_script.replace('{database_name}', database_name)
+        sql_script = sql_script.replace('{schema_name}', schema_name)
+        sql_script = sql_script.replace('{fact_table_name}', FACT_ORDERS)
+        sql_script = sql_script.replace('{agg_daily_table_name}', AGG_SALES_DAILY)
+        sql_script = sql_script.replace('{agg_monthly_table_name}', AGG_SALES_MONTHLY)
+        sql_script = sql_script.replace('{start_date}', start_date)
+        sql_script = sql_script.replace('{end_date}', end_date)
+        
+        # Execute the script (delete-and-reinsert in one transaction, safe to re-run)
+        return execute_sql_script(sql_script, config_file_path, target=target, idempotent=True)
+    except Exception as e:
+        print(f"Error updating aggregate tables: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+
+def maintain_tables(
+    tables: List[str],
+    prerequisite_result: Optional[Dict] = None,
+    database_name: str = DATABASE_NAME,
+    schema_name: str = SCHEMA_NAME,
+    stats_changed_pct: float = MAINTENANCE_STATS_CHANGED_PCT,
+    stats_changed_rows: int = MAINTENANCE_STATS_CHANGED_ROWS,
+    reorganize_pct: float = MAINTENANCE_REORGANIZE_PCT,
+    rebuild_pct: float = MAINTENANCE_REBUILD_PCT,
+    min_pages: int = MAINTENANCE_MIN_PAGES,
+    config_file_path: str = "sql_server_config.cfg",
+    target: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Reorganize/rebuild fragmented indexes and refresh statistics of tables whose rows changed
+    past a threshold since their statistics were last updated.
+    
+    Args:
+        tables: Table names to maintain
+        prerequisite_result: Result from prerequisite task
+        database_name: Name of the database
+        schema_name: Name of the schema
+        stats_changed_pct: Changed rows (% of table rows) that trigger UPDATE STATISTICS
+        stats_changed_rows: Changed rows (absolute) that trigger UPDATE STATISTICS
+        reorganize_pct: Fragmentation (%) from which an index is reorganized
+        rebuild_pct: Fragmentation (%) from which an index is rebuilt
+        min_pages: Indexes smaller than this many pages are left alone
+        config_file_path: Path to database configuration file
+        target: Named database target from the config file (None for [DATABASE])
+        
+    Returns:
+        dict: {'success': True, 'actions': [...]} with table_name, action, object_name, metric, duration_ms per action
+    """
+    try:
+        # Read the SQL script
+        script_path = os.path.join(
+            QUERIES_DIR,
+            'maintain_tables.sql'
+        )
+        
+        sql_script = read_sql_script(script_path)
+        
+        # Replace parameters
+        sql_script = sql_script.replace('{database_name}', database_name)
+        sql_script = sql_script.replace('{schema_name}', schema_name)
+        sql_script = sql_script.replace('{table_values}', ', '.join(f"('{table}')" for table in tables))
+        sql_script = sql_script.replace('{stats_changed_pct}', str(stats_changed_pct))
+        sql_script = sql_script.replace('{stats_changed_rows}', str(int(stats_changed_rows)))
+        sql_script = sql_script.replace('{reorganize_pct}', str(reorganize_pct))
+        sql_script = sql_script.replace('{rebuild_pct}', str(rebuild_pct))
+        sql_script = sql_script.replace('{min_pages}', str(int(min_pages)))
+        
+        # Execute the script and read back the actions taken
+        result = execute_sql_script(sql_script, config_file_path, target=target, fetch_results=True, idempotent=True)
+        if not result.get('success', False):
+            return result
+        return {
+            'success': True,
+            'actions': result['rows'],
+            'retries': result['retries'],
+            'retry_seconds': result['retry_seconds']
+        }
+    except Exception as e:
+        print(f"Error running table maintenance: {str(e)}")
+        return {'success': False, 'error': str(e)}
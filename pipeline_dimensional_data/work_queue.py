@@ -0,0 +1,384 @@
+"""
+Work queue of date windows for running the dimensional data flow on several workers.
+
+Windows are claimed with a lease, so a window is processed by one worker at a time and
+becomes claimable again if its worker disappears. SqlServerWorkQueue keeps the queue in
+ORDER_DDS (Pipeline_WorkQueue / Pipeline_WorkQueueSteps); InMemoryWorkQueue is a local
+stand-in with the same interface for single-process runs and tests.
+"""
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from pipeline_dimensional_data.config import (
+    SCHEMA_NAME,
+    STAGING_TABLES,
+    WORK_QUEUE_TABLE,
+    WORK_QUEUE_STEPS_TABLE,
+    WORK_QUEUE_LEASE_SECONDS,
+    WORK_QUEUE_MAX_ATTEMPTS,
+)
+from utils import get_pymssql_connection
+
+
+def split_date_range(start_date: str, end_date: str, window_months: int = 1) -> List[Tuple[str, str]]:
+    """
+    Split a date range into calendar-month aligned windows.
+
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD), inclusive
+        window_months: Number of calendar months per window
+
+    Returns:
+        list: (window_start, window_end) tuples as YYYY-MM-DD strings
+    """
+    if window_months < 1:
+        raise ValueError("window_months must be at least 1")
+
+    start = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end = datetime.strptime(end_date, '%Y-%m-%d').date()
+
+    windows = []
+    window_start = start
+    while window_start <= end:
+        month_index = window_start.year * 12 + window_start.month - 1 + window_months
+        next_start = date(month_index // 12, month_index % 12 + 1, 1)
+        window_end = min(next_start - timedelta(days=1), end)
+        windows.append((window_start.isoformat(), window_end.isoformat()))
+        window_start = next_start
+    return windows
+
+
+def get_staging_load_batch(config_file_path: str = "sql_server_config.cfg", schema_name: str = SCHEMA_NAME) -> str:
+    """
+    Identify the current staging load by the latest LoadDate across the staging tables.
+
+    Workers of one backfill see the same value; a new staging load yields a new one, so a
+    queue named after it starts over instead of finding its windows already done.
+
+    Args:
+        config_file_path: Path to database configuration file
+        schema_name: Schema of the staging tables
+
+    Returns:
+        str: Load timestamp such as '20261019T101500.1234567' ('empty' if staging has no rows)
+    """
+    union = ' UNION ALL '.join(f"SELECT MAX(LoadDate) AS LoadDate FROM {schema_name}.{table}" for table in STAGING_TABLES)
+    conn = get_pymssql_connection(config_file_path, autocommit=True)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT CONVERT(VARCHAR(27), MAX(LoadDate), 126) FROM ({union}) AS staging_loads")
+        load_batch = cursor.fetchone()[0]
+        cursor.close()
+    finally:
+        conn.close()
+    return load_batch.replace('-', '').replace(':', '') if load_batch else 'empty'
+
+
+class LeaseKeeper:
+    """
+    Renews the lease of a claimed window from a background thread while the window is processed,
+    so a task that runs longer than the lease does not let another worker claim the window.
+
+    Use as a context manager; call check() between tasks to stop once the lease was lost.
+    """
+
+    def __init__(
+        self,
+        queue,
+        window_id: int,
+        worker_id: str,
+        lease_seconds: int = WORK_QUEUE_LEASE_SECONDS,
+        interval_seconds: Optional[float] = None
+    ):
+        self.queue = queue
+        self.window_id = window_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        # Renew well before expiry, so one failed renewal still leaves time for the next
+        self.interval_seconds = interval_seconds if interval_seconds is not None else max(lease_seconds / 3.0, 1.0)
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"lease-{window_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                renewed = self.queue.renew(self.window_id, self.worker_id, self.lease_seconds)
+            except Exception:
+                # Transient failure: the lease has not expired yet, try again next interval
+                continue
+            if not renewed:
+                self.lost.set()
+                return
+
+    def check(self) -> None:
+        """Raise if the lease was lost (the window was reclaimed by another worker)."""
+        if self.lost.is_set():
+            raise Exception(f"Lost the lease on window {self.window_id}")
+
+
+class InMemoryWorkQueue:
+    """
+    Thread-safe in-process work queue with the same interface as SqlServerWorkQueue.
+    """
+
+    def __init__(self, queue_name: str):
+        self.queue_name = queue_name
+        self._mutex = threading.Lock()
+        self._windows: List[Dict] = []
+        self._steps: Dict[str, str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+
+    def enqueue_windows(self, windows: List[Tuple[str, str]]) -> None:
+        """Add windows that are not queued yet."""
+        with self._mutex:
+            existing = {(w['window_start'], w['window_end']) for w in self._windows}
+            for window_start, window_end in windows:
+                if (window_start, window_end) not in existing:
+                    self._windows.append({
+                        'window_id': len(self._windows) + 1,
+                        'window_start': window_start,
+                        'window_end': window_end,
+                        'status': 'PENDING',
+                        'claimed_by': None,
+                        'lease_expires_at': None,
+                        'attempts': 0,
+                        'last_error': None,
+                    })
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: int = WORK_QUEUE_LEASE_SECONDS,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS
+    ) -> Optional[Dict]:
+        """Claim the earliest claimable window, or return None if there is none."""
+        with self._mutex:
+            now = datetime.utcnow()
+            candidates = [
+                w for w in self._windows
+                if w['attempts'] < max_attempts and (
+                    w['status'] == 'PENDING'
+                    or w['status'] == 'FAILED'
+                    or (w['status'] == 'CLAIMED' and w['lease_expires_at'] < now)
+                )
+            ]
+            if not candidates:
+                return None
+            window = min(candidates, key=lambda w: w['window_start'])
+            window['status'] = 'CLAIMED'
+            window['claimed_by'] = worker_id
+            window['lease_expires_at'] = now + timedelta(seconds=lease_seconds)
+            window['attempts'] += 1
+            return dict(window)
+
+    def renew(self, window_id: int, worker_id: str, lease_seconds: int = WORK_QUEUE_LEASE_SECONDS) -> bool:
+        """Extend the lease of a window still owned by the worker."""
+        with self._mutex:
+            window = self._owned_window(window_id, worker_id)
+            if window is None:
+                return False
+            window['lease_expires_at'] = datetime.utcnow() + timedelta(seconds=lease_seconds)
+            return True
+
+    def complete(self, window_id: int, worker_id: str) -> bool:
+        """Mark a window owned by the worker as done."""
+        with self._mutex:
+            window = self._owned_window(window_id, worker_id)
+            if window is None:
+                return False
+            window['status'] = 'DONE'
+            window['lease_expires_at'] = None
+            return True
+
+    def fail(self, window_id: int, worker_id: str, error: str) -> bool:
+        """Mark a window owned by the worker as failed (retried until max_attempts)."""
+        with self._mutex:
+            window = self._owned_window(window_id, worker_id)
+            if window is None:
+                return False
+            window['status'] = 'FAILED'
+            window['lease_expires_at'] = None
+            window['last_error'] = error
+            return True
+
+    def acquire_lock(self, lock_name: str, timeout_ms: int) -> bool:
+        """Acquire a named exclusive lock, waiting up to timeout_ms."""
+        with self._mutex:
+            lock = self._locks.setdefault(lock_name, threading.Lock())
+        return lock.acquire(timeout=timeout_ms / 1000.0)
+
+    def release_lock(self, lock_name: str) -> None:
+        """Release a named lock acquired by acquire_lock."""
+        self._locks[lock_name].release()
+
+    def is_step_done(self, step_name: str) -> bool:
+        """Whether a once-per-queue step has already completed."""
+        with self._mutex:
+            return step_name in self._steps
+
+    def mark_step_done(self, step_name: str, worker_id: str) -> None:
+        """Record that a once-per-queue step completed."""
+        with self._mutex:
+            self._steps.setdefault(step_name, worker_id)
+
+    def _owned_window(self, window_id: int, worker_id: str) -> Optional[Dict]:
+        for window in self._windows:
+            if window['window_id'] == window_id and window['claimed_by'] == worker_id \
+                    and window['status'] == 'CLAIMED':
+                return window
+        return None
+
+
+class SqlServerWorkQueue:
+    """
+    Work queue stored in SQL Server.
+
+    Windows are claimed atomically with UPDATE ... OUTPUT over a READPAST/UPDLOCK scan, so
+    concurrent workers never claim the same window. Named locks use sp_getapplock owned by
+    a dedicated session that is held for as long as the lock is.
+    """
+
+    def __init__(self, queue_name: str, config_file_path: str = "sql_server_config.cfg", schema_name: str = SCHEMA_NAME):
+        self.queue_name = queue_name
+        self.config_file_path = config_file_path
+        self.schema_name = schema_name
+        self._lock_connections: Dict = {}
+
+    def _execute(self, query: str, params: Tuple = (), fetch: bool = False):
+        conn = get_pymssql_connection(self.config_file_path, autocommit=True)
+        try:
+            cursor = conn.cursor(as_dict=True)
+            cursor.execute(query, params)
+            rows = cursor.fetchall() if fetch else None
+            cursor.close()
+            return rows
+        finally:
+            conn.close()
+
+    def enqueue_windows(self, windows: List[Tuple[str, str]]) -> None:
+        """Add windows that are not queued yet."""
+        for window_start, window_end in windows:
+            self._execute(f"""
+                INSERT INTO {self.schema_name}.{WORK_QUEUE_TABLE} (QueueName, WindowStart, WindowEnd)
+                SELECT %s, %s, %s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {self.schema_name}.{WORK_QUEUE_TABLE} WITH (UPDLOCK, HOLDLOCK)
+                    WHERE QueueName = %s AND WindowStart = %s AND WindowEnd = %s
+                )
+            """, (self.queue_name, window_start, window_end, self.queue_name, window_start, window_end))
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: int = WORK_QUEUE_LEASE_SECONDS,
+        max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS
+    ) -> Optional[Dict]:
+        """Claim the earliest claimable window, or return None if there is none."""
+        rows = self._execute(f"""
+            WITH next_window AS (
+                SELECT TOP (1) *
+                FROM {self.schema_name}.{WORK_QUEUE_TABLE} WITH (UPDLOCK, READPAST, ROWLOCK)
+                WHERE QueueName = %s
+                  AND Attempts < %s
+                  AND (
+                      Status IN ('PENDING', 'FAILED')
+                      OR (Status = 'CLAIMED' AND LeaseExpiresAt < SYSUTCDATETIME())
+                  )
+                ORDER BY WindowStart
+            )
+            UPDATE next_window
+            SET Status = 'CLAIMED',
+                ClaimedBy = %s,
+                LeaseExpiresAt = DATEADD(SECOND, %s, SYSUTCDATETIME()),
+                Attempts = Attempts + 1,
+                UpdatedAt = SYSUTCDATETIME()
+            OUTPUT inserted.WindowID AS window_id,
+                   CONVERT(CHAR(10), inserted.WindowStart, 23) AS window_start,
+                   CONVERT(CHAR(10), inserted.WindowEnd, 23) AS window_end,
+                   inserted.Attempts AS attempts
+        """, (self.queue_name, max_attempts, worker_id, lease_seconds), fetch=True)
+        return rows[0] if rows else None
+
+    def _update_owned(self, window_id: int, worker_id: str, set_clause: str, params: Tuple = ()) -> bool:
+        rows = self._execute(f"""
+            UPDATE {self.schema_name}.{WORK_QUEUE_TABLE}
+            SET {set_clause}, UpdatedAt = SYSUTCDATETIME()
+            OUTPUT inserted.WindowID AS window_id
+            WHERE WindowID = %s AND ClaimedBy = %s AND Status = 'CLAIMED'
+        """, params + (window_id, worker_id), fetch=True)
+        return bool(rows)
+
+    def renew(self, window_id: int, worker_id: str, lease_seconds: int = WORK_QUEUE_LEASE_SECONDS) -> bool:
+        """Extend the lease of a window still owned by the worker."""
+        return self._update_owned(
+            window_id, worker_id, "LeaseExpiresAt = DATEADD(SECOND, %s, SYSUTCDATETIME())", (lease_seconds,)
+        )
+
+    def complete(self, window_id: int, worker_id: str) -> bool:
+        """Mark a window owned by the worker as done."""
+        return self._update_owned(window_id, worker_id, "Status = 'DONE', LeaseExpiresAt = NULL")
+
+    def fail(self, window_id: int, worker_id: str, error: str) -> bool:
+        """Mark a window owned by the worker as failed (retried until max_attempts)."""
+        return self._update_owned(
+            window_id, worker_id, "Status = 'FAILED', LeaseExpiresAt = NULL, LastError = %s", (error,)
+        )
+
+    def acquire_lock(self, lock_name: str, timeout_ms: int) -> bool:
+        """Acquire a named exclusive application lock, waiting up to timeout_ms."""
+        conn = get_pymssql_connection(self.config_file_path, autocommit=True)
+        cursor = conn.cursor()
+        cursor.execute("""
+            DECLARE @result INT;
+            EXEC @result = sp_getapplock @Resource = %s, @LockMode = 'Exclusive',
+                                         @LockOwner = 'Session', @LockTimeout = %s;
+            SELECT @result;
+        """, (lock_name, timeout_ms))
+        result = cursor.fetchone()[0]
+        cursor.close()
+        if result < 0:
+            conn.close()
+            return False
+        self._lock_connections[lock_name] = conn
+        return True
+
+    def release_lock(self, lock_name: str) -> None:
+        """Release a named lock acquired by acquire_lock."""
+        conn = self._lock_connections.pop(lock_name)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("EXEC sp_releaseapplock @Resource = %s, @LockOwner = 'Session';", (lock_name,))
+            cursor.close()
+        finally:
+            conn.close()
+
+    def is_step_done(self, step_name: str) -> bool:
+        """Whether a once-per-queue step has already completed."""
+        rows = self._execute(f"""
+            SELECT 1 AS done FROM {self.schema_name}.{WORK_QUEUE_STEPS_TABLE}
+            WHERE QueueName = %s AND StepName = %s
+        """, (self.queue_name, step_name), fetch=True)
+        return bool(rows)
+
+    def mark_step_done(self, step_name: str, worker_id: str) -> None:
+        """Record that a once-per-queue step completed."""
+        self._execute(f"""
+            INSERT INTO {self.schema_name}.{WORK_QUEUE_STEPS_TABLE} (QueueName, StepName, CompletedBy)
+            SELECT %s, %s, %s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {self.schema_name}.{WORK_QUEUE_STEPS_TABLE}
+                WHERE QueueName = %s AND StepName = %s
+            )
+        """, (self.queue_name, step_name, worker_id, self.queue_name, step_name))
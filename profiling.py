@@ -0,0 +1,310 @@
+"""
+Profiling support for pipeline runs (--profile).
+
+RunProfiler wraps each task with cProfile and tracemalloc, collects the actual execution
+plans and STATISTICS IO/TIME messages of the SQL batches executed by the task, and writes
+a per-run bundle under profiles/<run_id>/:
+    summary.json / summary.txt   top costly plan operators and Python functions
+    <task>.pstats                cProfile data per task (open with pstats or snakeviz)
+    plans/<task>_b<n>_p<m>.sqlplan  actual plans (open in SSMS)
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+SHOWPLAN_NAMESPACE = 'http://schemas.microsoft.com/sqlserver/2004/07/showplan'
+RELOP_TAG = f'{{{SHOWPLAN_NAMESPACE}}}RelOp'
+STATEMENT_TAG = f'{{{SHOWPLAN_NAMESPACE}}}StmtSimple'
+RUNTIME_COUNTERS_TAG = f'{{{SHOWPLAN_NAMESPACE}}}RunTimeCountersPerThread'
+
+# Column name of the result sets produced by SET STATISTICS XML ON
+SHOWPLAN_COLUMN = 'Microsoft SQL Server 2005 XML Showplan'
+
+IO_PATTERN = re.compile(r"Table '([^']+)'\. Scan count (\d+), logical reads (\d+), physical reads (\d+)")
+TIME_PATTERN = re.compile(r"CPU time = (\d+) ms,\s+elapsed time = (\d+) ms")
+
+TOP_FUNCTIONS = 15
+TOP_OPERATORS = 15
+TOP_ALLOCATIONS = 5
+MAX_PLANS_PER_BATCH = 50
+
+
+def parse_plan_operators(plan_xml: str) -> List[Dict]:
+    """
+    Extract the operators of an actual execution plan with their own (exclusive) estimated cost.
+
+    Args:
+        plan_xml: Showplan XML
+
+    Returns:
+        list: One dict per operator (statement, physical_op, logical_op, own_cost, subtree_cost,
+              estimated_rows, actual_rows, actual_elapsed_ms)
+    """
+    operators = []
+    root = ET.fromstring(plan_xml)
+
+    for statement in root.iter(STATEMENT_TAG):
+        statement_text = ' '.join((statement.get('StatementText') or '').split())[:200]
+
+        def walk(element, parent: Optional[Dict]) -> None:
+            for child in element:
+                if child.tag != RELOP_TAG:
+                    walk(child, parent)
+                    continue
+
+                counters = child.find(f'{{{SHOWPLAN_NAMESPACE}}}RunTimeInformation')
+                actual_rows = None
+                actual_elapsed_ms = None
+                if counters is not None:
+                    threads = counters.findall(RUNTIME_COUNTERS_TAG)
+                    actual_rows = sum(int(t.get('ActualRows', 0)) for t in threads)
+                    elapsed = [int(t.get('ActualElapsedms')) for t in threads if t.get('ActualElapsedms')]
+                    actual_elapsed_ms = max(elapsed) if elapsed else None
+
+                operator = {
+                    'statement': statement_text,
+                    'physical_op': child.get('PhysicalOp'),
+                    'logical_op': child.get('LogicalOp'),
+                    'subtree_cost': float(child.get('EstimatedTotalSubtreeCost', 0)),
+                    'estimated_rows': float(child.get('EstimateRows', 0)),
+                    'actual_rows': actual_rows,
+                    'actual_elapsed_ms': actual_elapsed_ms,
+                    '_children_cost': 0.0,
+                }
+                if parent is not None:
+                    parent['_children_cost'] += operator['subtree_cost']
+                operators.append(operator)
+                walk(child, operator)
+
+        walk(statement, None)
+
+    for operator in operators:
+        operator['own_cost'] = round(max(operator['subtree_cost'] - operator.pop('_children_cost'), 0.0), 6)
+    return operators
+
+
+def parse_statistics_messages(messages: List[str]) -> Dict:
+    """
+    Sum the STATISTICS IO / TIME messages of a batch.
+
+    Args:
+        messages: Informational messages returned by the server
+
+    Returns:
+        dict: cpu_ms, elapsed_ms (including parse/compile) and logical/physical reads per table
+    """
+    cpu_ms = 0
+    elapsed_ms = 0
+    tables = {}
+    for message in messages:
+        for table, scans, logical, physical in IO_PATTERN.findall(message):
+            stats = tables.setdefault(table, {'scan_count': 0, 'logical_reads': 0, 'physical_reads': 0})
+            stats['scan_count'] += int(scans)
+            stats['logical_reads'] += int(logical)
+            stats['physical_reads'] += int(physical)
+        for cpu, elapsed in TIME_PATTERN.findall(message):
+            cpu_ms += int(cpu)
+            elapsed_ms += int(elapsed)
+    return {'cpu_ms': cpu_ms, 'elapsed_ms': elapsed_ms, 'tables': tables}
+
+
+class RunProfiler:
+    """
+    Collects Python and SQL profiling data for one run and writes it as a bundle.
+    """
+
+    def __init__(self, run_id: str, output_dir: str = "profiles"):
+        """
+        Initialize the profiler.
+
+        Args:
+            run_id: Identifier of the run (e.g. the execution_id)
+            output_dir: Directory under which the bundle directory is created
+        """
+        self.run_id = run_id
+        self.bundle_dir = os.path.join(output_dir, run_id)
+        self.tasks: List[Dict] = []
+        self.sql_batches: List[Dict] = []
+        self.current_task: Optional[str] = None
+        self._task_names: Dict[str, int] = {}
+        self._started = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def profile_task(self, name: str):
+        """
+        Profile a task with cProfile and tracemalloc. SQL batches recorded while the
+        context is active are attributed to the task.
+
+        Args:
+            name: Task name (repeated names get a numeric suffix)
+        """
+        self._task_names[name] = self._task_names.get(name, 0) + 1
+        if self._task_names[name] > 1:
+            name = f"{name}_{self._task_names[name]}"
+
+        previous_task = self.current_task
+        self.current_task = name
+        profiler = cProfile.Profile()
+        tracemalloc.reset_peak()
+        memory_before, _ = tracemalloc.get_traced_memory()
+        snapshot_before = tracemalloc.take_snapshot()
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Another profiling tool (debugger, outer cProfile) is active: keep timings and memory only
+            print(f"⚠ Profiling: cProfile unavailable for {name}: {str(e)}")
+            profiler = None
+        try:
+            yield
+        finally:
+            self.current_task = previous_task
+            # Profiling problems are reported, never raised into the task
+            try:
+                self._finish_task(name, profiler, started, memory_before, snapshot_before)
+            except Exception as e:
+                print(f"⚠ Profiling: could not record task {name}: {str(e)}")
+
+    def _finish_task(
+        self,
+        name: str,
+        profiler: Optional[cProfile.Profile],
+        started: float,
+        memory_before: int,
+        snapshot_before: tracemalloc.Snapshot
+    ) -> None:
+        """Stop profiling a task, write its .pstats file and record its timings and memory."""
+        if profiler is not None:
+            profiler.disable()
+        wall_seconds = time.perf_counter() - started
+        memory_after, memory_peak = tracemalloc.get_traced_memory()
+        allocations = tracemalloc.take_snapshot().compare_to(snapshot_before, 'lineno')[:TOP_ALLOCATIONS]
+
+        if profiler is not None:
+            os.makedirs(self.bundle_dir, exist_ok=True)
+            profiler.dump_stats(os.path.join(self.bundle_dir, f"{name}.pstats"))
+        self.tasks.append({
+            'task': name,
+            'wall_seconds': round(wall_seconds, 3),
+            'peak_memory_kb': round((memory_peak - memory_before) / 1024, 1),
+            'net_memory_kb': round((memory_after - memory_before) / 1024, 1),
+            'top_functions': self._top_functions(profiler) if profiler is not None else [],
+            'top_allocations': [
+                {'location': str(stat.traceback), 'size_diff_kb': round(stat.size_diff / 1024, 1)}
+                for stat in allocations
+            ],
+        })
+
+    @staticmethod
+    def _top_functions(profiler: cProfile.Profile) -> List[Dict]:
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        functions = []
+        for (file_name, line, function), (_, calls, total_time, cumulative_time, _) in stats.stats.items():
+            functions.append({
+                'function': f"{os.path.basename(file_name)}:{line}({function})",
+                'calls': calls,
+                'total_seconds': round(total_time, 4),
+                'cumulative_seconds': round(cumulative_time, 4),
+            })
+        functions.sort(key=lambda f: f['total_seconds'], reverse=True)
+        return functions[:TOP_FUNCTIONS]
+
+    def record_sql_batch(self, batch: str, plans: List[str], messages: List[str], duration_seconds: float) -> None:
+        """
+        Record one executed SQL batch with its actual plans and statistics messages.
+
+        Args:
+            batch: Batch text
+            plans: Showplan XML documents returned for the batch's statements
+            messages: STATISTICS IO / TIME messages of the batch
+            duration_seconds: Client-side duration of the batch
+        """
+        task = self.current_task or 'unassigned'
+        batch_number = sum(1 for b in self.sql_batches if b['task'] == task) + 1
+
+        plan_files = []
+        operators = []
+        plans_dir = os.path.join(self.bundle_dir, 'plans')
+        for plan_number, plan_xml in enumerate(plans[:MAX_PLANS_PER_BATCH], start=1):
+            os.makedirs(plans_dir, exist_ok=True)
+            plan_file = os.path.join(plans_dir, f"{task}_b{batch_number}_p{plan_number}.sqlplan")
+            with open(plan_file, 'w', encoding='utf-8') as f:
+                f.write(plan_xml)
+            plan_files.append(os.path.relpath(plan_file, self.bundle_dir))
+            try:
+                for operator in parse_plan_operators(plan_xml):
+                    operator['plan_file'] = plan_files[-1]
+                    operators.append(operator)
+            except ET.ParseError:
+                pass
+
+        self.sql_batches.append({
+            'task': task,
+            'batch': batch_number,
+            'batch_start': ' '.join(batch.split())[:120],
+            'duration_seconds': round(duration_seconds, 3),
+            'plans': len(plans),
+            'plan_files': plan_files,
+            'statistics': parse_statistics_messages(messages),
+            'operators': operators,
+        })
+
+    def write_bundle(self) -> str:
+        """
+        Write summary.json and summary.txt naming the top costly operators and functions.
+
+        Returns:
+            str: Bundle directory
+        """
+        os.makedirs(self.bundle_dir, exist_ok=True)
+
+        operators = [
+            dict(operator, task=batch['task'], batch=batch['batch'])
+            for batch in self.sql_batches for operator in batch['operators']
+        ]
+        top_operators = sorted(operators, key=lambda o: o['own_cost'], reverse=True)[:TOP_OPERATORS]
+        top_functions = sorted(
+            (dict(function, task=task['task']) for task in self.tasks for function in task['top_functions']),
+            key=lambda f: f['total_seconds'], reverse=True
+        )[:TOP_FUNCTIONS]
+
+        summary = {
+            'run_id': self.run_id,
+            'wall_seconds': round(time.perf_counter() - self._started, 3),
+            'tasks': [{k: v for k, v in task.items() if k != 'top_functions'} for task in self.tasks],
+            'sql_batches': [{k: v for k, v in batch.items() if k != 'operators'} for batch in self.sql_batches],
+            'top_operators': top_operators,
+            'top_functions': top_functions,
+        }
+        with open(os.path.join(self.bundle_dir, 'summary.json'), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, default=str)
+
+        lines = [f"Profile {self.run_id} ({summary['wall_seconds']}s)", "", "Tasks (wall time, peak memory):"]
+        for task in self.tasks:
+            sql_seconds = sum(b['duration_seconds'] for b in self.sql_batches if b['task'] == task['task'])
+            lines.append(f"  {task['task']}: {task['wall_seconds']}s (SQL {sql_seconds:.3f}s), "
+                         f"peak {task['peak_memory_kb']} KB")
+        lines += ["", "Top plan operators (own estimated cost):"]
+        for operator in top_operators:
+            actual = f", actual rows {operator['actual_rows']}" if operator['actual_rows'] is not None else ""
+            lines.append(f"  {operator['own_cost']:.4f} {operator['physical_op']} ({operator['logical_op']}) "
+                         f"in {operator['task']} batch {operator['batch']}{actual}: {operator['statement'][:80]}")
+        lines += ["", "Top Python functions (own time):"]
+        for function in top_functions:
+            lines.append(f"  {function['total_seconds']:.4f}s {function['function']} "
+                         f"({function['calls']} calls, in {function['task']})")
+        with open(os.path.join(self.bundle_dir, 'summary.txt'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        return self.bundle_dir
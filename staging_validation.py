@@ -0,0 +1,234 @@
+"""
+Pre-load validation of the source DataFrames before they are inserted into staging.
+
+All checks are vectorized pandas operations (isna / duplicated / isin / to_numeric),
+run across sheets in memory: null natural keys, type errors, duplicate natural keys
+and orphan foreign keys (e.g. an Order with an unknown CustomerID or ShipVia).
+"""
+import json
+import os
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+
+# Natural keys per staging table (must be non-null and unique)
+NATURAL_KEYS = {
+    'stg_Categories_raw': ['CategoryID'],
+    'stg_Customers_raw': ['CustomerID'],
+    'stg_Employees_raw': ['EmployeeID'],
+    'stg_Products_raw': ['ProductID'],
+    'stg_Region_raw': ['RegionID'],
+    'stg_Shippers_raw': ['ShipperID'],
+    'stg_Suppliers_raw': ['SupplierID'],
+    'stg_Territories_raw': ['TerritoryID'],
+    'stg_Orders_raw': ['OrderID'],
+    'stg_OrderDetails_raw': ['OrderID', 'ProductID'],
+}
+
+# Columns that must parse as numbers / dates when present
+NUMERIC_COLUMNS = {
+    'stg_Categories_raw': ['CategoryID'],
+    'stg_Employees_raw': ['EmployeeID', 'ReportsTo'],
+    'stg_Products_raw': ['ProductID', 'SupplierID', 'CategoryID', 'UnitPrice',
+                         'UnitsInStock', 'UnitsOnOrder', 'ReorderLevel'],
+    'stg_Region_raw': ['RegionID'],
+    'stg_Shippers_raw': ['ShipperID'],
+    'stg_Suppliers_raw': ['SupplierID'],
+    'stg_Territories_raw': ['RegionID'],
+    'stg_Orders_raw': ['OrderID', 'EmployeeID', 'ShipVia', 'Freight'],
+    'stg_OrderDetails_raw': ['OrderID', 'ProductID', 'UnitPrice', 'Quantity', 'Discount'],
+}
+
+DATE_COLUMNS = {
+    'stg_Employees_raw': ['BirthDate', 'HireDate'],
+    'stg_Orders_raw': ['OrderDate', 'RequiredDate', 'ShippedDate'],
+}
+
+# (child table, child column, parent table, parent column)
+FOREIGN_KEYS = [
+    ('stg_Orders_raw', 'CustomerID', 'stg_Customers_raw', 'CustomerID'),
+    ('stg_Orders_raw', 'EmployeeID', 'stg_Employees_raw', 'EmployeeID'),
+    ('stg_Orders_raw', 'ShipVia', 'stg_Shippers_raw', 'ShipperID'),
+    ('stg_Orders_raw', 'TerritoryID', 'stg_Territories_raw', 'TerritoryID'),
+    ('stg_OrderDetails_raw', 'OrderID', 'stg_Orders_raw', 'OrderID'),
+    ('stg_OrderDetails_raw', 'ProductID', 'stg_Products_raw', 'ProductID'),
+    ('stg_Products_raw', 'SupplierID', 'stg_Suppliers_raw', 'SupplierID'),
+    ('stg_Products_raw', 'CategoryID', 'stg_Categories_raw', 'CategoryID'),
+    ('stg_Territories_raw', 'RegionID', 'stg_Region_raw', 'RegionID'),
+]
+
+# Maximum number of offending keys listed per check in the report
+REPORT_SAMPLE_SIZE = 5
+
+# Tables whose invalid rows may be quarantined. Rows missing from a dimension source table look
+# deleted to the next dimension run (WHEN NOT MATCHED BY SOURCE), so those are never dropped.
+QUARANTINE_TABLES = ('stg_Orders_raw', 'stg_OrderDetails_raw')
+
+
+def normalize_keys(series: pd.Series) -> pd.Series:
+    """
+    Normalize key values so that e.g. 5, 5.0 and '5' compare equal across sheets.
+
+    Args:
+        series: Key column
+
+    Returns:
+        pd.Series: String keys (NaN stays NaN)
+    """
+    numeric = pd.to_numeric(series, errors='coerce')
+    is_integral = numeric.notna() & (numeric == numeric.round())
+    normalized = series.astype('string').str.strip()
+    normalized[is_integral] = numeric[is_integral].astype('int64').astype('string')
+    return normalized.where(series.notna())
+
+
+def validate_frames(frames: Dict[str, pd.DataFrame]) -> Tuple[Dict[str, pd.DataFrame], List[Dict]]:
+    """
+    Run all checks on the staging DataFrames.
+
+    Args:
+        frames: DataFrames keyed by staging table name
+
+    Returns:
+        tuple: (issues, checks) where issues maps table name to a boolean DataFrame
+               (one column per failed check, indexed like the source frame) and checks
+               lists one summary dict per check that found problems
+    """
+    issues: Dict[str, pd.DataFrame] = {table: pd.DataFrame(index=df.index) for table, df in frames.items()}
+    checks: List[Dict] = []
+
+    def record(table: str, check: str, mask: pd.Series) -> None:
+        if not mask.any():
+            return
+        issues[table][check] = mask
+        key_columns = [c for c in NATURAL_KEYS.get(table, []) if c in frames[table].columns]
+        sample = frames[table].loc[mask, key_columns].head(REPORT_SAMPLE_SIZE)
+        checks.append({
+            'table': table,
+            'check': check,
+            'rows': int(mask.sum()),
+            'sample_keys': sample.astype(str).to_dict(orient='records'),
+        })
+
+    for table, df in frames.items():
+        # Null and duplicate natural keys
+        key_columns = [c for c in NATURAL_KEYS.get(table, []) if c in df.columns]
+        if key_columns:
+            record(table, f"null_key:{'+'.join(key_columns)}", df[key_columns].isna().any(axis=1))
+            keys = pd.DataFrame({c: normalize_keys(df[c]) for c in key_columns})
+            record(table, f"duplicate_key:{'+'.join(key_columns)}",
+                   keys.notna().all(axis=1) & keys.duplicated(keep=False))
+
+        # Type checks: value present but not parseable
+        for column in NUMERIC_COLUMNS.get(table, []):
+            if column in df.columns:
+                record(table, f"not_numeric:{column}",
+                       df[column].notna() & pd.to_numeric(df[column], errors='coerce').isna())
+        for column in DATE_COLUMNS.get(table, []):
+            if column in df.columns:
+                record(table, f"not_date:{column}",
+                       df[column].notna() & pd.to_datetime(df[column], errors='coerce').isna())
+
+    # Cross-sheet set membership
+    for child, child_column, parent, parent_column in FOREIGN_KEYS:
+        if child not in frames or parent not in frames:
+            continue
+        if child_column not in frames[child].columns or parent_column not in frames[parent].columns:
+            continue
+        child_keys = normalize_keys(frames[child][child_column])
+        parent_keys = set(normalize_keys(frames[parent][parent_column]).dropna())
+        record(child, f"orphan:{child_column}->{parent}.{parent_column}",
+               child_keys.notna() & ~child_keys.isin(parent_keys))
+
+    return issues, checks
+
+
+def quarantine_invalid_rows(
+    frames: Dict[str, pd.DataFrame],
+    max_passes: int = 5
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, pd.DataFrame], List[Dict]]:
+    """
+    Remove fact-side rows (QUARANTINE_TABLES) that fail any check. Validation is repeated so
+    that removals cascade (e.g. Order Details of a quarantined Order become orphans and are
+    removed too). Failed checks on dimension source tables are reported but their rows are
+    kept; see dimension_checks.
+
+    Args:
+        frames: DataFrames keyed by staging table name
+        max_passes: Maximum number of validation passes
+
+    Returns:
+        tuple: (clean frames, quarantined rows per table with an 'issues' column, checks of the first pass)
+    """
+    clean = dict(frames)
+    quarantined: Dict[str, List[pd.DataFrame]] = {}
+    first_checks: List[Dict] = []
+
+    for validation_pass in range(max_passes):
+        issues, checks = validate_frames(clean)
+        if validation_pass == 0:
+            first_checks = checks
+        if not any(check['table'] in QUARANTINE_TABLES for check in checks):
+            break
+
+        for table, table_issues in issues.items():
+            if table not in QUARANTINE_TABLES or table_issues.empty or table_issues.shape[1] == 0:
+                continue
+            bad = table_issues.any(axis=1)
+            if not bad.any():
+                continue
+            bad_rows = clean[table].loc[bad].copy()
+            bad_rows['issues'] = table_issues.loc[bad].apply(
+                lambda row: ';'.join(row.index[row.fillna(False).astype(bool)]), axis=1
+            )
+            quarantined.setdefault(table, []).append(bad_rows)
+            clean[table] = clean[table].loc[~bad]
+
+    return clean, {table: pd.concat(parts) for table, parts in quarantined.items()}, first_checks
+
+
+def dimension_checks(checks: List[Dict]) -> List[Dict]:
+    """
+    Failed checks on tables whose rows cannot be quarantined (dimension sources).
+
+    Args:
+        checks: Check summaries from validate_frames
+
+    Returns:
+        list: The checks on tables outside QUARANTINE_TABLES
+    """
+    return [check for check in checks if check['table'] not in QUARANTINE_TABLES]
+
+
+def write_report(checks: List[Dict], frames: Dict[str, pd.DataFrame], report_path: str) -> None:
+    """
+    Write a compact JSON validation report.
+
+    Args:
+        checks: Check summaries from validate_frames
+        frames: Validated DataFrames (for row totals)
+        report_path: Output file path
+    """
+    report_dir = os.path.dirname(report_path)
+    if report_dir:
+        os.makedirs(report_dir, exist_ok=True)
+    report = {
+        'row_counts': {table: int(len(df)) for table, df in frames.items()},
+        'failed_checks': checks,
+    }
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def write_quarantine(quarantined: Dict[str, pd.DataFrame], quarantine_dir: str) -> None:
+    """
+    Write quarantined rows to one CSV per staging table.
+
+    Args:
+        quarantined: Quarantined rows per table
+        quarantine_dir: Output directory
+    """
+    os.makedirs(quarantine_dir, exist_ok=True)
+    for table, df in quarantined.items():
+        df.to_csv(os.path.join(quarantine_dir, f"{table}.csv"), index=False)
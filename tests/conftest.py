@@ -0,0 +1,9 @@
+"""
+Shared pytest setup: make the project root importable (as main.py and flow.py expect).
+"""
+import os
+import sys
+
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
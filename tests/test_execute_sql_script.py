@@ -0,0 +1,176 @@
+"""
+Tests for the retry loop of execute_sql_script, run against a fake pymssql connection.
+"""
+import pytest
+
+from pipeline_dimensional_data import tasks
+
+
+class FakeSqlError(Exception):
+    """Shaped like pymssql errors: args = (number, message bytes)."""
+
+
+DEADLOCK = FakeSqlError(1205, b'Transaction was deadlocked')
+CONNECTION_DROPPED = FakeSqlError(20047, b'DBPROCESS is dead or not enabled')
+UNABLE_TO_CONNECT = FakeSqlError(20009, b'Unable to connect: Adaptive Server is unavailable')
+SYNTAX_ERROR = FakeSqlError(102, b"Incorrect syntax near 'SELEC'.")
+
+
+class FakeServer:
+    """
+    Records executed statements. `failures` maps a statement to the errors raised by its next
+    executions (one per call); `reconnect_failures` are raised by the next reconnection attempts.
+    `results` maps a statement to the result sets it returns, as (column name, rows) pairs.
+    """
+
+    def __init__(self, failures=None, reconnect_failures=None, results=None):
+        self.failures = {statement: list(errors) for statement, errors in (failures or {}).items()}
+        self.results = results or {}
+        self.reconnect_failures = list(reconnect_failures or [])
+        self.executed = []
+        self.connections = 0
+
+    def connect(self, *args, **kwargs):
+        if self.connections and self.reconnect_failures:
+            raise self.reconnect_failures.pop(0)
+        self.connections += 1
+        return FakeConnection(self, self.connections)
+
+
+class FakeConnection:
+    def __init__(self, server, number):
+        self.server = server
+        self.number = number
+        self.closed = False
+
+    def cursor(self, as_dict=False):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self._result_sets = []
+
+    def execute(self, statement):
+        server = self.conn.server
+        server.executed.append((self.conn.number, statement))
+        if server.failures.get(statement):
+            raise server.failures[statement].pop(0)
+        self._result_sets = list(server.results.get(statement, []))
+        self.nextset()
+
+    def fetchall(self):
+        return self._rows
+
+    def nextset(self):
+        if not self._result_sets:
+            self.description = None
+            return None
+        column, self._rows = self._result_sets.pop(0)
+        self.description = [(column,)]
+        return True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def run_script(monkeypatch):
+    monkeypatch.setattr(tasks.time, 'sleep', lambda seconds: None)
+
+    def run(server, script='USE ORDER_DDS;\nGO\nSELECT 1;', **kwargs):
+        monkeypatch.setattr(tasks, 'get_pymssql_connection', server.connect)
+        return tasks.execute_sql_script(script, **kwargs)
+
+    return run
+
+
+def test_transient_error_is_retried_after_a_rollback(run_script):
+    server = FakeServer(failures={'SELECT 1;': [DEADLOCK]})
+
+    result = run_script(server, idempotent=True)
+
+    assert result['success']
+    assert result['retries'] == 1
+    assert [statement for _, statement in server.executed] == [
+        'USE ORDER_DDS;', 'SELECT 1;', 'IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;', 'SELECT 1;'
+    ]
+
+
+def test_failed_reconnect_counts_as_an_attempt_and_is_retried(run_script):
+    # The server is still down at the first reconnect
+    server = FakeServer(failures={'SELECT 1;': [CONNECTION_DROPPED]}, reconnect_failures=[UNABLE_TO_CONNECT])
+
+    result = run_script(server, idempotent=True, max_attempts=3)
+
+    assert result['success']
+    assert result['retries'] == 2
+    # The session's USE batch is replayed on the new connection before the batch itself
+    assert server.executed[-2:] == [(2, 'USE ORDER_DDS;'), (2, 'SELECT 1;')]
+
+
+def test_gives_up_after_max_attempts(run_script):
+    server = FakeServer(failures={'SELECT 1;': [CONNECTION_DROPPED]}, reconnect_failures=[UNABLE_TO_CONNECT] * 5)
+
+    result = run_script(server, idempotent=True, max_attempts=3)
+
+    assert not result['success']
+    assert result['error_class'] == 'connection'
+    assert result['retries'] == 2
+
+
+def test_non_idempotent_scripts_are_not_retried(run_script):
+    server = FakeServer(failures={'SELECT 1;': [DEADLOCK]})
+
+    result = run_script(server, idempotent=False)
+
+    assert not result['success']
+    assert result['retries'] == 0
+
+
+def test_permanent_errors_are_not_retried(run_script):
+    server = FakeServer(failures={'SELECT 1;': [SYNTAX_ERROR]})
+
+    result = run_script(server, idempotent=True)
+
+    assert not result['success']
+    assert result['error_class'] == 'other'
+    assert [statement for _, statement in server.executed] == ['USE ORDER_DDS;', 'SELECT 1;']
+
+
+class RecordingProfiler:
+    def __init__(self):
+        self.batches = []
+
+    def record_sql_batch(self, batch, plans, messages, duration_seconds):
+        self.batches.append((batch, plans))
+
+
+@pytest.mark.parametrize('profiled', [False, True])
+def test_fetch_results_returns_the_last_non_empty_result_set(run_script, monkeypatch, profiled):
+    profiler = RecordingProfiler() if profiled else None
+    monkeypatch.setattr(tasks, '_profiler', profiler)
+    results = [
+        ('OrderID', [{'OrderID': 10248}]),
+        (tasks.SHOWPLAN_COLUMN, [{tasks.SHOWPLAN_COLUMN: '<ShowPlanXML/>'}]),
+        ('inserted_rows', [{'inserted_rows': 3, 'resolved_rows': 4}]),
+        ('empty', []),
+    ]
+    server = FakeServer(results={'SELECT 1;': results})
+
+    result = run_script(server, fetch_results=True)
+
+    assert result['rows'] == [{'inserted_rows': 3, 'resolved_rows': 4}]
+    if profiled:
+        assert profiler.batches[-1] == ('SELECT 1;', ['<ShowPlanXML/>'])
+
+
+def test_fetch_results_keeps_an_empty_summary(run_script):
+    server = FakeServer(results={'SELECT 1;': [('action', [])]})
+
+    assert run_script(server, fetch_results=True)['rows'] == []
@@ -0,0 +1,61 @@
+"""
+Tests for the export window and partition replacement helpers (export_fact_data.py).
+"""
+import os
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from export_fact_data import build_export_query, expand_to_months, replace_partitions
+
+
+def test_expand_to_months_widens_partial_months():
+    assert expand_to_months('1996-07-15', '1997-02-03') == ('1996-07-01', '1997-02-28')
+    assert expand_to_months('1996-02-10', '1996-02-10') == ('1996-02-01', '1996-02-29')
+    assert expand_to_months(None, '1996-12-01') == (None, '1996-12-31')
+    assert expand_to_months(None, None) == (None, None)
+
+
+def test_incremental_query_filters_on_load_date_range():
+    query, params = build_export_query('FactOrders', None, None, '1997-01-01 00:00:00', '1997-02-01 00:00:00')
+    assert 'LoadDate > %s AND LoadDate <= %s' in query
+    assert params == ('1997-01-01 00:00:00', '1997-02-01 00:00:00')
+
+
+def test_windowed_query_filters_on_partition_date():
+    query, params = build_export_query('FactOrders_Error', '1996-07-01', '1996-07-31')
+    assert 'LoadDate >= %s AND LoadDate < DATEADD(DAY, 1, CAST(%s AS DATE))' in query
+    assert params == ('1996-07-01', '1996-07-31')
+
+
+def make_partition(output_dir, month, *run_ids):
+    partition_dir = output_dir / 'FactOrders' / f'order_month={month}'
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    for run_id in run_ids:
+        (partition_dir / f'part-{run_id}.parquet').write_bytes(b'')
+    return partition_dir
+
+
+def test_replace_partitions_only_touches_months_of_the_window(tmp_path):
+    before = make_partition(tmp_path, '1996-06', 'old')
+    inside = make_partition(tmp_path, '1996-07', 'old', 'older', 'new')
+    emptied = make_partition(tmp_path, '1996-08', 'old')
+    after = make_partition(tmp_path, '1996-09', 'old')
+
+    removed = replace_partitions(str(tmp_path), 'FactOrders', 'new', '1996-07-01', '1996-08-31')
+
+    assert removed == 3
+    assert os.listdir(inside) == ['part-new.parquet']
+    assert not emptied.exists()
+    assert os.listdir(before) == ['part-old.parquet']
+    assert os.listdir(after) == ['part-old.parquet']
+
+
+def test_replace_partitions_without_window_replaces_the_table(tmp_path):
+    make_partition(tmp_path, '1996-06', 'old')
+    kept = make_partition(tmp_path, '1996-07', 'old', 'new')
+
+    assert replace_partitions(str(tmp_path), 'FactOrders', 'new') == 2
+    assert os.listdir(tmp_path / 'FactOrders') == ['order_month=1996-07']
+    assert os.listdir(kept) == ['part-new.parquet']
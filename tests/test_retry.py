@@ -0,0 +1,65 @@
+"""
+Tests for the SQL error classification and backoff policy (retry.py).
+"""
+import random
+
+import pytest
+
+from pipeline_dimensional_data.retry import (
+    CONNECTION,
+    DEADLOCK,
+    LOCK_TIMEOUT,
+    OTHER,
+    backoff_delay,
+    classify_sql_error,
+    get_error_number,
+)
+
+
+class FakeOperationalError(Exception):
+    """Shaped like pymssql errors: args = (number, message bytes)."""
+
+
+def test_error_number_from_args_or_message():
+    assert get_error_number(FakeOperationalError(1205, b'Transaction was deadlocked')) == 1205
+    assert get_error_number(Exception("(1222, b'Lock request time out period exceeded.')")) == 1222
+    assert get_error_number(Exception('Invalid object name')) is None
+
+
+@pytest.mark.parametrize('error, expected', [
+    (FakeOperationalError(1205, b'Transaction (Process ID 52) was deadlocked'), DEADLOCK),
+    (FakeOperationalError(1222, b'Lock request time out period exceeded.'), LOCK_TIMEOUT),
+    (FakeOperationalError(20047, b'DBPROCESS is dead or not enabled'), CONNECTION),
+    (FakeOperationalError(10054, b'Connection reset by peer'), CONNECTION),
+    (Exception("(1205, b'Transaction was deadlocked')"), DEADLOCK),
+    (FakeOperationalError(208, b"Invalid object name 'dbo.FactOrders'."), OTHER),
+    (FakeOperationalError(2627, b'Violation of PRIMARY KEY constraint'), OTHER),
+])
+def test_classify_by_error_number(error, expected):
+    assert classify_sql_error(error) == expected
+
+
+@pytest.mark.parametrize('message, expected', [
+    ('Transaction was deadlocked on lock resources', DEADLOCK),
+    ('Lock request time out period exceeded', LOCK_TIMEOUT),
+    ('Adaptive Server connection timed out', CONNECTION),
+    ('Read from the server failed', CONNECTION),
+    ('Conversion failed when converting date', OTHER),
+])
+def test_classify_by_message_without_number(message, expected):
+    assert classify_sql_error(Exception(message)) == expected
+
+
+def test_backoff_grows_exponentially_within_bounds():
+    random.seed(0)
+    for attempt, bound in [(1, 0.5), (2, 1.0), (3, 2.0), (4, 4.0)]:
+        delays = [backoff_delay(attempt, 0.5, 30.0) for _ in range(200)]
+        assert all(0 <= delay <= bound for delay in delays)
+        # Full jitter spreads the delays over the whole range
+        assert max(delays) > bound * 0.8
+        assert min(delays) < bound * 0.2
+
+
+def test_backoff_is_capped_at_max_delay():
+    random.seed(0)
+    assert all(backoff_delay(20, 0.5, 3.0) <= 3.0 for _ in range(200))
@@ -0,0 +1,125 @@
+"""
+Tests for the in-memory staging checks (validate_frames, quarantine_invalid_rows).
+"""
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from staging_validation import dimension_checks, normalize_keys, quarantine_invalid_rows, validate_frames
+
+
+def make_frames():
+    """A small consistent workbook: every key present once, every reference resolvable."""
+    return {
+        'stg_Customers_raw': pd.DataFrame({'CustomerID': ['ALFKI', 'ANATR']}),
+        'stg_Employees_raw': pd.DataFrame({
+            'EmployeeID': [1, 2],
+            'ReportsTo': [None, 1],
+            'BirthDate': ['1960-01-01', '1970-05-05'],
+            'HireDate': ['1992-05-01', '1993-10-17'],
+        }),
+        'stg_Shippers_raw': pd.DataFrame({'ShipperID': [1, 2]}),
+        'stg_Region_raw': pd.DataFrame({'RegionID': [1]}),
+        'stg_Territories_raw': pd.DataFrame({'TerritoryID': ['01581', '02116'], 'RegionID': [1, 1]}),
+        'stg_Categories_raw': pd.DataFrame({'CategoryID': [1]}),
+        'stg_Suppliers_raw': pd.DataFrame({'SupplierID': [1]}),
+        'stg_Products_raw': pd.DataFrame({'ProductID': [11, 12], 'SupplierID': [1, 1], 'CategoryID': [1, 1]}),
+        'stg_Orders_raw': pd.DataFrame({
+            'OrderID': [10248, 10249],
+            'CustomerID': ['ALFKI', 'ANATR'],
+            'EmployeeID': [1, 2],
+            'ShipVia': [1, 2],
+            'TerritoryID': ['01581', '02116'],
+            'Freight': [32.38, 11.61],
+            'OrderDate': ['1996-07-04', '1996-07-05'],
+            'RequiredDate': ['1996-08-01', '1996-08-16'],
+            'ShippedDate': ['1996-07-16', None],
+        }),
+        'stg_OrderDetails_raw': pd.DataFrame({
+            'OrderID': [10248, 10248, 10249],
+            'ProductID': [11, 12, 11],
+            'UnitPrice': [14.0, 9.8, 14.0],
+            'Quantity': [12, 10, 5],
+            'Discount': [0.0, 0.0, 0.05],
+        }),
+    }
+
+
+def check_names(checks, table):
+    return {check['check'] for check in checks if check['table'] == table}
+
+
+def test_normalize_keys_compares_numbers_and_strings():
+    keys = normalize_keys(pd.Series([5, 5.0, '5', ' 7 ', 'ALFKI', None], dtype=object))
+    assert list(keys[:5]) == ['5', '5', '5', '7', 'ALFKI']
+    assert pd.isna(keys[5])
+
+
+def test_consistent_frames_pass():
+    issues, checks = validate_frames(make_frames())
+    assert checks == []
+    assert all(table_issues.shape[1] == 0 for table_issues in issues.values())
+
+
+def test_null_and_duplicate_keys_are_reported():
+    frames = make_frames()
+    frames['stg_Shippers_raw'] = pd.DataFrame({'ShipperID': [1, 2, 2.0, None]})
+
+    issues, checks = validate_frames(frames)
+
+    assert check_names(checks, 'stg_Shippers_raw') == {'null_key:ShipperID', 'duplicate_key:ShipperID'}
+    assert list(issues['stg_Shippers_raw']['duplicate_key:ShipperID']) == [False, True, True, False]
+    assert list(issues['stg_Shippers_raw']['null_key:ShipperID']) == [False, False, False, True]
+
+
+def test_type_errors_are_reported():
+    frames = make_frames()
+    # Excel cells read as mixed object columns
+    frames['stg_Orders_raw']['Freight'] = pd.Series(['n/a', 11.61], dtype=object)
+    frames['stg_Orders_raw']['OrderDate'] = pd.Series(['1996-07-04', 'someday'], dtype=object)
+
+    _, checks = validate_frames(frames)
+
+    assert check_names(checks, 'stg_Orders_raw') == {'not_numeric:Freight', 'not_date:OrderDate'}
+
+
+def test_orphan_foreign_keys_are_reported_with_sample_keys():
+    frames = make_frames()
+    frames['stg_OrderDetails_raw'].loc[2, 'ProductID'] = 99
+
+    _, checks = validate_frames(frames)
+
+    [check] = checks
+    assert check['table'] == 'stg_OrderDetails_raw'
+    assert check['check'] == 'orphan:ProductID->stg_Products_raw.ProductID'
+    assert check['rows'] == 1
+    assert check['sample_keys'] == [{'OrderID': '10249', 'ProductID': '99'}]
+
+
+def test_quarantine_cascades_from_orders_to_order_details():
+    frames = make_frames()
+    frames['stg_Orders_raw'].loc[1, 'CustomerID'] = 'NOBODY'
+
+    clean, quarantined, checks = quarantine_invalid_rows(frames)
+
+    assert list(clean['stg_Orders_raw']['OrderID']) == [10248]
+    assert list(clean['stg_OrderDetails_raw']['OrderID']) == [10248, 10248]
+    assert list(quarantined['stg_Orders_raw']['issues']) == ['orphan:CustomerID->stg_Customers_raw.CustomerID']
+    assert list(quarantined['stg_OrderDetails_raw']['ProductID']) == [11]
+    # The report lists the first pass only
+    assert [check['table'] for check in checks] == ['stg_Orders_raw']
+    assert dimension_checks(checks) == []
+
+
+def test_quarantine_keeps_invalid_dimension_rows():
+    frames = make_frames()
+    frames['stg_Products_raw'] = pd.DataFrame({
+        'ProductID': [11, 12, 12], 'SupplierID': [1, 1, 1], 'CategoryID': [1, 1, 1]
+    })
+
+    clean, quarantined, checks = quarantine_invalid_rows(frames)
+
+    # Dropping product 12 would make the next dimension run mark it deleted
+    assert len(clean['stg_Products_raw']) == 3
+    assert 'stg_Products_raw' not in quarantined
+    assert [check['check'] for check in dimension_checks(checks)] == ['duplicate_key:ProductID']
@@ -0,0 +1,100 @@
+"""
+Tests for the database target configuration (list_database_targets, parse_database_config).
+"""
+import pytest
+
+from utils import list_database_targets, parse_database_config
+
+
+def write_config(tmp_path, text):
+    config_path = tmp_path / 'sql_server_config.cfg'
+    config_path.write_text(text)
+    return str(config_path)
+
+
+BASE = """
+[DATABASE]
+server = localhost
+database = ORDER_DDS
+username = sa
+password = secret
+driver = FreeTDS
+max_connections = 6
+"""
+
+
+def test_config_without_targets_has_a_default_target(tmp_path):
+    config_path = write_config(tmp_path, BASE)
+
+    assert list_database_targets(config_path) == ['default']
+    assert parse_database_config(config_path) == {
+        'server': 'localhost',
+        'database': 'ORDER_DDS',
+        'username': 'sa',
+        'password': 'secret',
+        'driver': 'FreeTDS',
+        'max_connections': 6,
+    }
+    assert parse_database_config(config_path, 'default') == parse_database_config(config_path)
+
+
+def test_targets_are_listed_in_file_order(tmp_path):
+    config_path = write_config(tmp_path, BASE + """
+[TARGET emea]
+database = ORDER_DDS_EMEA
+
+[OTHER]
+key = value
+
+[TARGET apac]
+database = ORDER_DDS_APAC
+""")
+
+    assert list_database_targets(config_path) == ['emea', 'apac']
+
+
+def test_target_inherits_missing_keys_from_database(tmp_path):
+    config_path = write_config(tmp_path, BASE + """
+[TARGET apac]
+server = apac-sql.example.com
+database = ORDER_DDS_APAC
+max_connections = 2
+""")
+
+    config = parse_database_config(config_path, 'apac')
+
+    assert config['server'] == 'apac-sql.example.com'
+    assert config['database'] == 'ORDER_DDS_APAC'
+    assert config['max_connections'] == 2
+    assert (config['username'], config['password'], config['driver']) == ('sa', 'secret', 'FreeTDS')
+
+
+def test_built_in_defaults_apply_when_neither_section_sets_a_key(tmp_path):
+    config_path = write_config(tmp_path, """
+[DATABASE]
+server = localhost
+
+[TARGET emea]
+database = ORDER_DDS_EMEA
+""")
+
+    config = parse_database_config(config_path, 'emea')
+
+    assert config['database'] == 'ORDER_DDS_EMEA'
+    assert config['driver'] == 'ODBC Driver 17 for SQL Server'
+    assert config['max_connections'] == 4
+
+
+def test_unknown_target_and_missing_database_section_are_rejected(tmp_path):
+    config_path = write_config(tmp_path, BASE)
+    with pytest.raises(ValueError, match=r'\[TARGET nowhere\]'):
+        parse_database_config(config_path, 'nowhere')
+
+    config_path = write_config(tmp_path, "[TARGET emea]\ndatabase = ORDER_DDS_EMEA\n")
+    with pytest.raises(ValueError, match=r'\[DATABASE\]'):
+        parse_database_config(config_path, 'emea')
+
+
+def test_missing_config_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list_database_targets(str(tmp_path / 'missing.cfg'))
@@ -0,0 +1,181 @@
+"""
+Tests for the date-window work queue (split_date_range, InMemoryWorkQueue, LeaseKeeper).
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from pipeline_dimensional_data.work_queue import InMemoryWorkQueue, LeaseKeeper, split_date_range
+
+
+def test_split_date_range_aligns_windows_to_calendar_months():
+    assert split_date_range('1996-07-04', '1996-09-15') == [
+        ('1996-07-04', '1996-07-31'),
+        ('1996-08-01', '1996-08-31'),
+        ('1996-09-01', '1996-09-15'),
+    ]
+
+
+def test_split_date_range_multi_month_windows_cross_years():
+    assert split_date_range('1996-11-01', '1997-04-30', window_months=3) == [
+        ('1996-11-01', '1997-01-31'),
+        ('1997-02-01', '1997-04-30'),
+    ]
+
+
+def test_split_date_range_single_day_and_leap_february():
+    assert split_date_range('1996-02-10', '1996-02-10') == [('1996-02-10', '1996-02-10')]
+    assert split_date_range('1996-02-01', '1996-03-01') == [
+        ('1996-02-01', '1996-02-29'),
+        ('1996-03-01', '1996-03-01'),
+    ]
+
+
+def test_split_date_range_empty_when_start_after_end():
+    assert split_date_range('1997-01-01', '1996-12-31') == []
+
+
+def test_split_date_range_rejects_non_positive_window():
+    with pytest.raises(ValueError):
+        split_date_range('1996-01-01', '1996-12-31', window_months=0)
+
+
+def make_queue(windows=(('1996-07-01', '1996-07-31'), ('1996-08-01', '1996-08-31'))):
+    queue = InMemoryWorkQueue('test')
+    queue.enqueue_windows(list(windows))
+    return queue
+
+
+def test_enqueue_is_idempotent():
+    queue = make_queue()
+    queue.enqueue_windows([('1996-07-01', '1996-07-31'), ('1996-09-01', '1996-09-30')])
+
+    claimed = []
+    while True:
+        window = queue.claim('worker-1')
+        if window is None:
+            break
+        claimed.append((window['window_start'], window['window_end']))
+    assert claimed == [('1996-07-01', '1996-07-31'), ('1996-08-01', '1996-08-31'), ('1996-09-01', '1996-09-30')]
+
+
+def test_claim_hands_out_each_window_once_in_date_order():
+    queue = make_queue()
+    first = queue.claim('worker-1')
+    second = queue.claim('worker-2')
+
+    assert first['window_start'] == '1996-07-01'
+    assert second['window_start'] == '1996-08-01'
+    assert first['attempts'] == 1
+    assert queue.claim('worker-3') is None
+
+
+def test_concurrent_claims_never_share_a_window():
+    queue = make_queue([(f'1996-{month:02d}-01', f'1996-{month:02d}-28') for month in range(1, 13)])
+    claimed = []
+    mutex = threading.Lock()
+
+    def worker(worker_id):
+        while True:
+            window = queue.claim(worker_id)
+            if window is None:
+                return
+            with mutex:
+                claimed.append(window['window_id'])
+
+    threads = [threading.Thread(target=worker, args=(f'worker-{i}',)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == list(range(1, 13))
+
+
+def test_only_the_owner_can_renew_complete_or_fail():
+    queue = make_queue()
+    window = queue.claim('worker-1')
+
+    assert not queue.renew(window['window_id'], 'worker-2')
+    assert not queue.complete(window['window_id'], 'worker-2')
+    assert not queue.fail(window['window_id'], 'worker-2', 'boom')
+    assert queue.renew(window['window_id'], 'worker-1')
+    assert queue.complete(window['window_id'], 'worker-1')
+    # A completed window is no longer owned, so it cannot be completed twice
+    assert not queue.complete(window['window_id'], 'worker-1')
+
+
+def test_failed_window_is_retried_until_max_attempts():
+    queue = make_queue([('1996-07-01', '1996-07-31')])
+
+    for attempt in range(1, 3):
+        window = queue.claim('worker-1', max_attempts=2)
+        assert window['attempts'] == attempt
+        assert queue.fail(window['window_id'], 'worker-1', 'boom')
+
+    assert queue.claim('worker-1', max_attempts=2) is None
+
+
+def test_expired_lease_can_be_reclaimed_and_old_owner_cannot_complete():
+    queue = make_queue([('1996-07-01', '1996-07-31')])
+    window = queue.claim('worker-1', lease_seconds=60)
+    assert queue.claim('worker-2') is None
+
+    # Let the lease run out
+    queue._windows[0]['lease_expires_at'] = datetime.utcnow() - timedelta(seconds=1)
+    reclaimed = queue.claim('worker-2')
+
+    assert reclaimed['window_id'] == window['window_id']
+    assert reclaimed['attempts'] == 2
+    assert not queue.complete(window['window_id'], 'worker-1')
+    assert queue.complete(window['window_id'], 'worker-2')
+
+
+def test_steps_are_recorded_once_per_queue():
+    queue = make_queue()
+    assert not queue.is_step_done('dimensions')
+
+    queue.mark_step_done('dimensions', 'worker-1')
+    queue.mark_step_done('dimensions', 'worker-2')
+
+    assert queue.is_step_done('dimensions')
+    assert queue._steps['dimensions'] == 'worker-1'
+    assert not InMemoryWorkQueue('other').is_step_done('dimensions')
+
+
+def test_named_lock_is_exclusive():
+    queue = make_queue()
+    assert queue.acquire_lock('test:dimensions', 1000)
+    assert not queue.acquire_lock('test:dimensions', 10)
+
+    queue.release_lock('test:dimensions')
+    assert queue.acquire_lock('test:dimensions', 10)
+    queue.release_lock('test:dimensions')
+
+
+def test_lease_keeper_renews_while_the_window_is_processed():
+    queue = make_queue([('1996-07-01', '1996-07-31')])
+    window = queue.claim('worker-1', lease_seconds=60)
+    expires_at = queue._windows[0]['lease_expires_at']
+
+    with LeaseKeeper(queue, window['window_id'], 'worker-1', lease_seconds=60, interval_seconds=0.01) as lease:
+        time.sleep(0.1)
+        lease.check()
+
+    assert queue._windows[0]['lease_expires_at'] > expires_at
+    assert queue.complete(window['window_id'], 'worker-1')
+
+
+def test_lease_keeper_reports_a_lost_lease():
+    queue = make_queue([('1996-07-01', '1996-07-31')])
+    window = queue.claim('worker-1', lease_seconds=60)
+
+    with LeaseKeeper(queue, window['window_id'], 'worker-1', lease_seconds=60, interval_seconds=0.01) as lease:
+        # Another worker takes over after the lease ran out
+        queue._windows[0]['lease_expires_at'] = datetime.utcnow() - timedelta(seconds=1)
+        queue.claim('worker-2')
+        assert lease.lost.wait(1.0)
+        with pytest.raises(Exception, match='Lost the lease'):
+            lease.check()
@@ -0,0 +1,50 @@
+"""
+Tests for workbook cache eviction (evict).
+"""
+import os
+import time
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('pyarrow')
+
+from workbook_cache import MANIFEST_FILE, evict
+
+
+def make_entry(cache_dir, name, size, age_seconds=0, manifest=True):
+    """Create a cache directory of roughly `size` bytes, last used `age_seconds` ago."""
+    entry_dir = cache_dir / name
+    entry_dir.mkdir()
+    (entry_dir / 'sheet_000.feather').write_bytes(b'x' * size)
+    marker = entry_dir / MANIFEST_FILE if manifest else entry_dir
+    if manifest:
+        marker.write_text('{}')
+    used_at = time.time() - age_seconds
+    os.utime(marker, (used_at, used_at))
+    return entry_dir
+
+
+def test_evicts_least_recently_used_first_and_keeps_current(tmp_path):
+    make_entry(tmp_path, 'oldest', 100, age_seconds=300)
+    make_entry(tmp_path, 'older', 100, age_seconds=200)
+    make_entry(tmp_path, 'current', 100, age_seconds=400)
+
+    assert evict(str(tmp_path), 150, keep='current') == ['oldest', 'older']
+    assert sorted(os.listdir(tmp_path)) == ['current']
+
+
+def test_stale_build_directories_are_removed(tmp_path):
+    make_entry(tmp_path, 'snapshot', 100)
+    make_entry(tmp_path, '.tmp-crashed', 1000, age_seconds=7200, manifest=False)
+
+    assert evict(str(tmp_path), 500, stale_tmp_seconds=3600) == ['.tmp-crashed']
+    assert sorted(os.listdir(tmp_path)) == ['snapshot']
+
+
+def test_fresh_build_directories_count_but_are_kept(tmp_path):
+    make_entry(tmp_path, 'snapshot', 100, age_seconds=60)
+    make_entry(tmp_path, '.tmp-building', 1000, manifest=False)
+
+    assert evict(str(tmp_path), 500, stale_tmp_seconds=3600) == ['snapshot']
+    assert sorted(os.listdir(tmp_path)) == ['.tmp-building']
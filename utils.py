@@ -5,7 +5,7 @@ Flow-agnostic utility functions for reading SQL scripts, parsing configs, etc.
 import os
 import uuid
 import configparser
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 def generate_uuid() -> str:
@@ -39,7 +39,30 @@ def read_sql_script(file_path: str) -> str:
         return f.read()
 
 
-def parse_database_config(config_file_path: str = "sql_server_config.cfg") -> Dict[str, str]:
+def list_database_targets(config_file_path: str = "sql_server_config.cfg") -> List[str]:
+    """
+    List the named targets defined in a config file.
+
+    Targets are sections named [TARGET <name>]. A config file without target
+    sections has a single target, 'default', backed by the [DATABASE] section.
+
+    Args:
+        config_file_path: Path to the configuration file
+
+    Returns:
+        list: Target names in file order
+    """
+    if not os.path.exists(config_file_path):
+        raise FileNotFoundError(f"Config file not found: {config_file_path}")
+
+    config = configparser.ConfigParser()
+    config.read(config_file_path)
+
+    targets = [section[len('TARGET '):].strip() for section in config.sections() if section.startswith('TARGET ')]
+    return targets or ['default']
+
+
+def parse_database_config(config_file_path: str = "sql_server_config.cfg", target: Optional[str] = None) -> Dict[str, str]:
     """
     Parse database configuration from a config file.
 
@@ -50,9 +73,14 @@ def parse_database_config(config_file_path: str = "sql_server_config.cfg") -> Di
     username = your_username
     password = your_password
     driver = ODBC Driver 17 for SQL Server
+    max_connections = 4
+
+    Additional named targets (e.g. one per regional mart) can be defined as
+    [TARGET <name>] sections; keys they leave out are taken from [DATABASE].
 
     Args:
         config_file_path: Path to the configuration file
+        target: Named target to read (None or 'default' for [DATABASE])
 
     Returns:
         dict: Dictionary containing database connection parameters
@@ -70,12 +98,22 @@ def parse_database_config(config_file_path: str = "sql_server_config.cfg") -> Di
     if 'DATABASE' not in config:
         raise ValueError("Config file must contain a [DATABASE] section")
 
+    section = 'DATABASE'
+    if target is not None and target != 'default':
+        section = f'TARGET {target}'
+        if section not in config:
+            raise ValueError(f"Config file has no [{section}] section")
+
+    def get(key: str, fallback: str) -> str:
+        return config.get(section, key, fallback=config.get('DATABASE', key, fallback=fallback))
+
     db_config = {
-        'server': config.get('DATABASE', 'server', fallback='localhost'),
-        'database': config.get('DATABASE', 'database', fallback='ORDER_DDS'),
-        'username': config.get('DATABASE', 'username', fallback=''),
-        'password': config.get('DATABASE', 'password', fallback=''),
-        'driver': config.get('DATABASE', 'driver', fallback='ODBC Driver 17 for SQL Server')
+        'server': get('server', 'localhost'),
+        'database': get('database', 'ORDER_DDS'),
+        'username': get('username', ''),
+        'password': get('password', ''),
+        'driver': get('driver', 'ODBC Driver 17 for SQL Server'),
+        'max_connections': int(get('max_connections', '4'))
     }
 
     return db_config
@@ -112,3 +150,46 @@ def get_connection_string(config_file_path: str = "sql_server_config.cfg") -> st
         )
 
     return conn_str
+
+
+def get_pymssql_connection(
+    config_file_path: str = "sql_server_config.cfg",
+    autocommit: bool = False,
+    target: Optional[str] = None
+):
+    """
+    Open a pymssql connection from the config file.
+
+    Args:
+        config_file_path: Path to the configuration file
+        autocommit: Whether the connection should autocommit
+        target: Named target to connect to (None for [DATABASE])
+
+    Returns:
+        pymssql.Connection: Open connection
+    """
+    import pymssql
+    import getpass
+
+    config = parse_database_config(config_file_path, target)
+
+    if config['username'] and config['password']:
+        # SQL Server Authentication
+        return pymssql.connect(
+            server=config['server'],
+            user=config['username'],
+            password=config['password'],
+            database=config['database'],
+            port=1433,
+            autocommit=autocommit
+        )
+
+    # Windows Authentication (current user)
+    return pymssql.connect(
+        server=config['server'],
+        user=getpass.getuser(),
+        password='',
+        database=config['database'],
+        port=1433,
+        autocommit=autocommit
+    )
@@ -0,0 +1,207 @@
+"""
+Columnar snapshot cache for the Excel source workbook.
+
+Each sheet is parsed once with pd.read_excel and stored as an uncompressed Feather
+(Arrow IPC) file under <cache_dir>/<sha256 of the workbook>/. Later runs on the same
+file content read the snapshot back into DataFrames instead of re-parsing the XML
+(the conversion to pandas copies the data, so memory use is that of a normal read).
+The cache is bounded by size; least recently used snapshots are evicted first.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+
+DEFAULT_CACHE_DIR = '.cache/workbook'
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+MANIFEST_FILE = 'manifest.json'
+TMP_PREFIX = '.tmp-'
+# A snapshot build left unpublished this long belongs to a crashed run
+STALE_TMP_SECONDS = 60 * 60
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Hash a file's content.
+
+    Args:
+        path: File path
+        chunk_size: Read size in bytes
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _to_arrow_compatible(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make a parsed sheet storable as Arrow. Object columns holding mixed types
+    (e.g. PostalCode with both numbers and strings) are stored as strings, which
+    is what the loader inserts for them anyway.
+    """
+    df = df.copy()
+    df.columns = [str(c) for c in df.columns]
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        try:
+            pa.array(df[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+    return df.reset_index(drop=True)
+
+
+def _entry_size(entry_dir: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(entry_dir, name))
+        for name in os.listdir(entry_dir)
+        if os.path.isfile(os.path.join(entry_dir, name))
+    )
+
+
+def evict(
+    cache_dir: str,
+    max_cache_bytes: int,
+    keep: str = None,
+    stale_tmp_seconds: float = STALE_TMP_SECONDS
+) -> List[str]:
+    """
+    Delete least recently used snapshots until the cache fits in max_cache_bytes.
+
+    Unpublished build directories (.tmp-*) older than stale_tmp_seconds were left
+    by an interrupted run and are always removed. Younger ones may still be in
+    use by a concurrent build; they count towards the size but are not deleted.
+
+    Args:
+        cache_dir: Cache root
+        max_cache_bytes: Size limit
+        keep: Snapshot (hash) that must not be evicted
+        stale_tmp_seconds: Age after which a build directory is considered abandoned
+
+    Returns:
+        list: Evicted snapshot hashes and build directory names
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+
+    entries = []
+    evicted = []
+    in_progress_size = 0
+    now = time.time()
+    for name in os.listdir(cache_dir):
+        entry_dir = os.path.join(cache_dir, name)
+        if not os.path.isdir(entry_dir):
+            continue
+        if name.startswith(TMP_PREFIX):
+            try:
+                age = now - os.path.getmtime(entry_dir)
+                size = _entry_size(entry_dir)
+            except OSError:
+                # Published or removed by its builder meanwhile
+                continue
+            if age > stale_tmp_seconds:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                evicted.append(name)
+            else:
+                in_progress_size += size
+            continue
+        manifest_path = os.path.join(entry_dir, MANIFEST_FILE)
+        if not os.path.isfile(manifest_path):
+            continue
+        entries.append((os.path.getmtime(manifest_path), name, _entry_size(entry_dir)))
+
+    total = in_progress_size + sum(size for _, _, size in entries)
+    for _, name, size in sorted(entries):
+        if total <= max_cache_bytes:
+            break
+        if name == keep:
+            continue
+        shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+        total -= size
+        evicted.append(name)
+    return evicted
+
+
+def _build_snapshot(excel_file: str, entry_dir: str, cache_dir: str) -> None:
+    """Parse every sheet and publish the snapshot directory atomically."""
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=TMP_PREFIX, dir=cache_dir)
+    try:
+        excel_file_obj = pd.ExcelFile(excel_file)
+        sheets = []
+        for index, sheet_name in enumerate(excel_file_obj.sheet_names):
+            file_name = f"sheet_{index:03d}.feather"
+            df = _to_arrow_compatible(excel_file_obj.parse(sheet_name))
+            # Uncompressed so reading the snapshot back needs no decode pass
+            feather.write_feather(df, os.path.join(tmp_dir, file_name), compression='uncompressed')
+            sheets.append({'sheet_name': sheet_name, 'file': file_name, 'rows': int(len(df))})
+
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump({'source_file': os.path.abspath(excel_file), 'created_at': time.time(), 'sheets': sheets}, f, indent=2)
+
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Another process published the same snapshot first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def read_workbook(
+    excel_file: str,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    use_cache: bool = True
+) -> Tuple[List[str], Dict[str, pd.DataFrame], bool]:
+    """
+    Read all sheets of a workbook, through the snapshot cache when enabled.
+
+    Args:
+        excel_file: Path to the .xlsx file
+        cache_dir: Cache root directory
+        max_cache_bytes: Size limit of the cache
+        use_cache: If False, parse the workbook directly
+
+    Returns:
+        tuple: (sheet names in workbook order, DataFrames keyed by sheet name, cache hit flag)
+    """
+    if not use_cache:
+        excel_file_obj = pd.ExcelFile(excel_file)
+        frames = {sheet_name: excel_file_obj.parse(sheet_name) for sheet_name in excel_file_obj.sheet_names}
+        return list(excel_file_obj.sheet_names), frames, False
+
+    content_hash = file_sha256(excel_file)
+    entry_dir = os.path.join(cache_dir, content_hash)
+    manifest_path = os.path.join(entry_dir, MANIFEST_FILE)
+
+    cache_hit = os.path.isfile(manifest_path)
+    if not cache_hit:
+        _build_snapshot(excel_file, entry_dir, cache_dir)
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    # Mark as recently used for eviction
+    os.utime(manifest_path, None)
+
+    frames = {}
+    for sheet in manifest['sheets']:
+        table = feather.read_table(os.path.join(entry_dir, sheet['file']), memory_map=True)
+        frames[sheet['sheet_name']] = table.to_pandas()
+
+    evict(cache_dir, max_cache_bytes, keep=content_hash)
+    return [sheet['sheet_name'] for sheet in manifest['sheets']], frames, cache_hit